@@ -3,10 +3,14 @@
 This module defines Pydantic models for custom agent configurations
 following VS Code/GitHub Copilot specification.
 """
+import re
 from typing import Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
+# Agent names: alphanumeric (Unicode-aware, as str.isalnum), hyphens, underscores
+_NAME_PATTERN = re.compile(r"[\w-]+")
+
 
 class AgentTarget(str, Enum):
     """Agent target environments.
@@ -70,7 +74,8 @@ class AgentDefinition(BaseModel):
     file_path: Optional[str] = Field(None, description="Source file path")
 
     model_config = ConfigDict(
-        populate_by_name=True  # Allow both alias and field name
+        populate_by_name=True,  # Allow both alias and field name
+        frozen=True  # Parsed definitions are shared, never mutated
     )
 
     @field_validator("name")
@@ -87,12 +92,12 @@ class AgentDefinition(BaseModel):
         Raises:
             ValueError: If name is empty or contains invalid characters
         """
-        if not v or not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Agent name cannot be empty")
 
         # Allow alphanumeric, hyphens, underscores
-        v = v.strip()
-        if not all(c.isalnum() or c in ("-", "_") for c in v):
+        if not _NAME_PATTERN.fullmatch(v):
             raise ValueError(
                 f"Invalid agent name '{v}': use alphanumeric, hyphens, underscores only"
             )
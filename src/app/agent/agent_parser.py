@@ -3,10 +3,11 @@
 This module provides functionality to parse custom agent definition files
 following the VS Code/GitHub Copilot .agent.md specification.
 """
-import re
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple
+from threading import Lock
+from typing import Tuple, Union
 import yaml
 from pydantic import ValidationError
 
@@ -14,11 +15,26 @@ from app.agent.agent_config import AgentDefinition
 
 logger = logging.getLogger(__name__)
 
-# Regex pattern for YAML frontmatter (--- delimited)
-FRONTMATTER_PATTERN = re.compile(
-    r'^---\s*\n(.*?)\n---\s*\n(.*)$',
-    re.DOTALL | re.MULTILINE
-)
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+    logger.info(
+        "LibYAML bindings unavailable; using pure-Python YAML loader "
+        "for agent files"
+    )
+
+# YAML frontmatter fence (--- on its own line)
+FRONTMATTER_FENCE = b"---"
+
+# Parsed definitions keyed by path, least recently used first; entries hold
+# (mtime_ns, size, agent) and are reused while the file is unchanged.
+# AgentDefinition is frozen, so sharing instances across reloads is safe.
+# Registries parse files from worker threads, so updates take the lock.
+_PARSE_CACHE_MAX_SIZE = 256
+_parse_cache: "OrderedDict[str, Tuple[int, int, AgentDefinition]]" = OrderedDict()
+_parse_cache_lock = Lock()
 
 
 class AgentParseError(Exception):
@@ -53,18 +69,31 @@ def parse_agent_file(file_path: Path) -> AgentDefinition:
         >>> print(agent.name)
         'my-agent'
     """
-    if not file_path.exists():
+    cache_key = str(file_path)
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        # Forget definitions of deleted or renamed files
+        with _parse_cache_lock:
+            _parse_cache.pop(cache_key, None)
         raise FileNotFoundError(f"Agent file not found: {file_path}")
 
+    with _parse_cache_lock:
+        cached = _parse_cache.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _parse_cache.move_to_end(cache_key)
+            return cached[2]
+
     try:
-        content = file_path.read_text(encoding='utf-8')
+        # Fences are located on raw bytes; only the slices get decoded
+        content = file_path.read_bytes()
 
         # Extract frontmatter and body
         frontmatter, body = _extract_frontmatter(content)
 
         # Parse YAML frontmatter
         try:
-            config = yaml.safe_load(frontmatter)
+            config = yaml.load(frontmatter, Loader=_SafeLoader)
             if not isinstance(config, dict):
                 raise AgentParseError("Frontmatter must be a YAML dictionary")
         except yaml.YAMLError as e:
@@ -76,10 +105,17 @@ def parse_agent_file(file_path: Path) -> AgentDefinition:
 
         # Validate with Pydantic model
         try:
-            return AgentDefinition(**config)
+            agent = AgentDefinition.model_validate(config)
         except ValidationError as e:
             raise AgentParseError(f"Agent configuration validation failed: {e}")
 
+        with _parse_cache_lock:
+            _parse_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, agent)
+            _parse_cache.move_to_end(cache_key)
+            if len(_parse_cache) > _PARSE_CACHE_MAX_SIZE:
+                _parse_cache.popitem(last=False)
+        return agent
+
     except AgentParseError:
         # Re-raise AgentParseError as-is
         raise
@@ -91,13 +127,13 @@ def parse_agent_file(file_path: Path) -> AgentDefinition:
         raise AgentParseError(f"Unexpected error parsing agent file: {e}")
 
 
-def _extract_frontmatter(content: str) -> Tuple[str, str]:
+def _extract_frontmatter(content: Union[bytes, str]) -> Tuple[str, str]:
     """Extract YAML frontmatter and Markdown body.
 
     Parses content with YAML frontmatter delimited by --- markers.
 
     Args:
-        content: File content with frontmatter
+        content: File content with frontmatter, as UTF-8 bytes or text
 
     Returns:
         Tuple of (frontmatter, body)
@@ -114,14 +150,51 @@ def _extract_frontmatter(content: str) -> Tuple[str, str]:
         >>> 'name: test' in fm
         True
     """
-    match = FRONTMATTER_PATTERN.match(content)
-    if not match:
-        raise AgentParseError(
-            "No YAML frontmatter found. Expected format:\n"
-            "---\n"
-            "YAML content\n"
-            "---\n"
-            "Markdown body"
-        )
-
-    return match.group(1), match.group(2)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    fence = FRONTMATTER_FENCE
+    fence_len = len(fence)
+
+    # Opening fence must be the first line
+    if content.startswith(fence):
+        open_end = content.find(b"\n", fence_len)
+        if open_end != -1 and not content[fence_len:open_end].strip():
+            # Closing fence is the first following line holding only ---
+            search_from = open_end
+            while True:
+                close_start = content.find(b"\n" + fence, search_from)
+                if close_start == -1:
+                    break
+                close_end = content.find(b"\n", close_start + 1 + fence_len)
+                if close_end == -1:
+                    break
+                if not content[close_start + 1 + fence_len:close_end].strip():
+                    return (
+                        _decode_text(content[open_end + 1:close_start]),
+                        _decode_text(content[close_end + 1:]),
+                    )
+                search_from = close_end
+
+    raise AgentParseError(
+        "No YAML frontmatter found. Expected format:\n"
+        "---\n"
+        "YAML content\n"
+        "---\n"
+        "Markdown body"
+    )
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 bytes with universal newlines, as text-mode reads do.
+
+    Args:
+        data: Raw file slice
+
+    Returns:
+        Decoded text with CRLF and CR line endings normalized to LF
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
@@ -3,8 +3,10 @@
 This module provides thread-safe registry functionality for loading,
 storing, and retrieving custom agent definitions.
 """
+import os
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -35,6 +37,9 @@ class AgentRegistry:
             agents_folder: Optional path to .github/agents or custom folder
         """
         self._agents: Dict[str, AgentDefinition] = {}
+        # Index by target so filtered lookups don't scan every agent
+        self._by_target: Dict[Optional[AgentTarget], List[AgentDefinition]] = {}
+        # Guards writes only; reads rely on atomic dict operations
         self._lock = threading.Lock()
         self._agents_folder = agents_folder
 
@@ -54,12 +59,16 @@ class AgentRegistry:
                 raise ValueError(f"Agent '{agent.name}' already registered")
 
             self._agents[agent.name] = agent
+            # Replace rather than append so readers never see a list mid-update
+            self._by_target[agent.target] = [
+                *self._by_target.get(agent.target, ()), agent
+            ]
             logger.info(f"Registered agent '{agent.name}' with {len(agent.tools)} tools")
 
     def get_agent(self, name: str) -> Optional[AgentDefinition]:
         """Retrieve agent by name.
 
-        Thread-safe retrieval of agent configuration.
+        Lock-free retrieval of agent configuration.
 
         Args:
             name: Agent identifier
@@ -67,19 +76,17 @@ class AgentRegistry:
         Returns:
             Agent definition if found, None otherwise
         """
-        with self._lock:
-            return self._agents.get(name)
+        return self._agents.get(name)
 
     def list_agents(self) -> List[AgentDefinition]:
         """Get all registered agents.
 
-        Thread-safe retrieval of all agents.
+        Lock-free snapshot of all agents.
 
         Returns:
             List of all registered agent definitions
         """
-        with self._lock:
-            return list(self._agents.values())
+        return list(self._agents.values())
 
     def get_agents_by_target(self, target: AgentTarget) -> List[AgentDefinition]:
         """Get agents filtered by target environment.
@@ -90,11 +97,7 @@ class AgentRegistry:
         Returns:
             List of agents matching the target environment
         """
-        with self._lock:
-            return [
-                agent for agent in self._agents.values()
-                if agent.target == target
-            ]
+        return list(self._by_target.get(target, ()))
 
     def load_agents_from_folder(self, folder_path: Path) -> int:
         """Load all .agent.md files from a folder.
@@ -123,17 +126,30 @@ class AgentRegistry:
         logger.info(f"Scanning folder for agent files: {folder_path}")
         logger.info(f"Found {len(agent_files)} .agent.md files")
 
-        for agent_file in agent_files:
-            try:
-                agent = parse_agent_file(agent_file)
-                self.register_agent(agent)
-                loaded_count += 1
-                logger.info(f"Loaded agent from {agent_file.name}")
-            except (AgentParseError, ValueError) as e:
-                logger.warning(
-                    f"Failed to load agent from {agent_file.name}: {e}"
-                )
-                continue
+        if not agent_files:
+            logger.info(f"Successfully loaded 0 agents from {folder_path}")
+            return 0
+
+        # Parse files concurrently; register in file order on this thread so
+        # duplicate-name resolution stays deterministic.
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(agent_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (agent_file, executor.submit(parse_agent_file, agent_file))
+                for agent_file in agent_files
+            ]
+
+            for agent_file, future in futures:
+                try:
+                    agent = future.result()
+                    self.register_agent(agent)
+                    loaded_count += 1
+                    logger.info(f"Loaded agent from {agent_file.name}")
+                except (AgentParseError, ValueError) as e:
+                    logger.warning(
+                        f"Failed to load agent from {agent_file.name}: {e}"
+                    )
+                    continue
 
         logger.info(f"Successfully loaded {loaded_count} agents from {folder_path}")
         return loaded_count
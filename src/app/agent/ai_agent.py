@@ -1,11 +1,12 @@
 """Azure OpenAI agent using Microsoft Agent Framework."""
+import logging
 from typing import Optional, Callable
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 from azure.identity import DefaultAzureCredential, AzureCliCredential, get_bearer_token_provider
 from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
 
-from app.config.settings import settings
+from app.config.settings import get_settings
 from app.telemetry.logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +27,7 @@ class TeamsAIAgent:
         Uses DefaultAzureCredential for managed identity authentication
         in production, or AzureCliCredential for local development.
         """
+        settings = get_settings()
         try:
             # Choose credential based on environment
             if settings.is_production:
@@ -72,6 +74,28 @@ class TeamsAIAgent:
             )
             raise
 
+    def _prepare_thread(self, log_message: str, message: str, thread_id: Optional[str]):
+        """Log the incoming message and resolve its conversation thread.
+
+        Args:
+            log_message: Log line describing the run mode
+            message: User message to process
+            thread_id: Optional conversation thread ID for context
+
+        Returns:
+            Existing thread for thread_id, or a new thread
+        """
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                log_message,
+                properties={
+                    "message_length": len(message),
+                    "has_thread": thread_id is not None
+                }
+            )
+
+        return self._agent.get_thread(thread_id) if thread_id else self._agent.get_new_thread()
+
     async def run(
         self,
         message: str,
@@ -94,30 +118,19 @@ class TeamsAIAgent:
             raise ValueError("Agent not initialized. Call initialize() first.")
 
         try:
-            logger.info(
-                "Processing message",
-                properties={
-                    "message_length": len(message),
-                    "has_thread": thread_id is not None
-                }
-            )
-
-            # Get or create thread
-            if thread_id:
-                thread = self._agent.get_thread(thread_id)
-            else:
-                thread = self._agent.get_new_thread()
+            thread = self._prepare_thread("Processing message", message, thread_id)
 
             # Run agent
             result = await self._agent.run(message, thread=thread)
 
-            logger.info(
-                "Agent response generated",
-                properties={
-                    "response_length": len(result.text),
-                    "thread_id": thread.id
-                }
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    "Agent response generated",
+                    properties={
+                        "response_length": len(result.text),
+                        "thread_id": thread.id
+                    }
+                )
 
             return result.text
 
@@ -153,28 +166,19 @@ class TeamsAIAgent:
             raise ValueError("Agent not initialized. Call initialize() first.")
 
         try:
-            logger.info(
-                "Processing message with streaming",
-                properties={
-                    "message_length": len(message),
-                    "has_thread": thread_id is not None
-                }
+            thread = self._prepare_thread(
+                "Processing message with streaming", message, thread_id
             )
 
-            # Get or create thread
-            if thread_id:
-                thread = self._agent.get_thread(thread_id)
-            else:
-                thread = self._agent.get_new_thread()
-
             # Stream agent response
             async for chunk in self._agent.run_stream(message, thread=thread):
                 yield chunk
 
-            logger.info(
-                "Streaming response completed",
-                properties={"thread_id": thread.id}
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    "Streaming response completed",
+                    properties={"thread_id": thread.id}
+                )
 
         except Exception as e:
             logger.error(
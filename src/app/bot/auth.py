@@ -2,13 +2,127 @@
 Bot Framework Authentication & Security Module
 Implements JWT token validation and Microsoft tenant verification
 """
+import base64
+import hashlib
 import jwt
 import os
+import re
+import time
+from collections import OrderedDict
 from typing import Dict, Optional
 from fastapi import Request, HTTPException
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
 
+from app.utils import json_codec
+
+# Azure AD tenant IDs are GUIDs
+_GUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
+# Endpoints that require Bot Framework authentication
+_AUTHENTICATED_PATHS = frozenset({'/api/messages'})
+
+# Accepted token issuers
+_VALID_ISSUERS = (
+    'https://api.botframework.com',
+    'https://sts.windows.net/',
+    'https://login.microsoftonline.com/'
+)
+
+# Recently validated tokens: digest(token, bot_id) -> exp timestamp.
+# Only successful validations are cached; expiry is re-checked on every hit.
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: "OrderedDict[bytes, float]" = OrderedDict()
+
+
+def _token_cache_key(token: str, bot_id: str) -> bytes:
+    """Build a fixed-size cache key without retaining the raw token."""
+    return hashlib.blake2b(
+        f"{bot_id}\x00{token}".encode('utf-8'),
+        digest_size=16
+    ).digest()
+
+
+def _decode_segment(segment: str) -> object:
+    """
+    Decode one base64url-encoded JSON segment of a JWT.
+
+    Args:
+        segment: Unpadded base64url segment
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If the segment is not valid base64url or JSON
+    """
+    return json_codec.loads(base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4)))
+
+
+def _decode_claims(token: str, bot_id: str) -> Dict:
+    """
+    Decode JWT claims and check expiry and audience.
+
+    Signature verification is left to the Bot Framework Adapter, so the
+    header and payload segments are decoded directly instead of going
+    through jwt.decode. Errors use PyJWT's exception types.
+
+    Args:
+        token: Encoded JWT
+        bot_id: Expected bot application ID (audience)
+
+    Returns:
+        Decoded claims
+
+    Raises:
+        jwt.DecodeError: If the token is malformed
+        jwt.MissingRequiredClaimError: If exp or aud is absent
+        jwt.ExpiredSignatureError: If token is expired
+        jwt.InvalidAudienceError: If audience doesn't match bot_id
+    """
+    segments = token.split('.')
+    if len(segments) != 3:
+        raise jwt.DecodeError("Not enough segments" if len(segments) < 3 else "Too many segments")
+    header_segment, payload_segment, _ = segments
+
+    try:
+        header = _decode_segment(header_segment)
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid header: {e}")
+    if not isinstance(header, dict) or not isinstance(header.get('alg'), str):
+        raise jwt.DecodeError("Invalid header: must be a JSON object with an alg string")
+    if 'typ' in header and not isinstance(header['typ'], str):
+        raise jwt.DecodeError("Invalid header: typ must be a string")
+
+    try:
+        claims = _decode_segment(payload_segment)
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid token payload: {e}")
+
+    if not isinstance(claims, dict):
+        raise jwt.DecodeError("Invalid token payload: not a JSON object")
+
+    for claim in ('exp', 'aud'):
+        if claim not in claims:
+            raise jwt.MissingRequiredClaimError(claim)
+
+    exp = claims['exp']
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+    if exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    audience = claims['aud']
+    if isinstance(audience, str):
+        audience = [audience]
+    if not isinstance(audience, list) or bot_id not in audience:
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+    return claims
+
 
 def validate_jwt_token(auth_header: str, bot_id: str) -> bool:
     """
@@ -30,32 +144,27 @@ def validate_jwt_token(auth_header: str, bot_id: str) -> bool:
 
     token = auth_header.replace('Bearer ', '')
 
+    cache_key = _token_cache_key(token, bot_id)
+    cached_exp = _token_cache.get(cache_key)
+    if cached_exp is not None:
+        if cached_exp > time.time():
+            return True
+        # Expired: drop the entry and let decoding raise below
+        _token_cache.pop(cache_key, None)
+
     try:
         # Decode and validate token
-        # In production, fetch public keys from Bot Framework
-        # For now, validate basic structure
-        decoded = jwt.decode(
-            token,
-            options={
-                "verify_signature": False,  # Will be verified by Bot Framework Adapter
-                "verify_aud": True,
-                "verify_exp": True,
-                "require": ["exp", "aud"]  # Require exp and aud claims for validation
-            },
-            audience=bot_id,
-            algorithms=['RS256', 'HS256']
-        )
+        # Signature is verified by the Bot Framework Adapter
+        decoded = _decode_claims(token, bot_id)
 
         # Validate issuer
-        valid_issuers = [
-            'https://api.botframework.com',
-            'https://sts.windows.net/',
-            'https://login.microsoftonline.com/'
-        ]
-
-        if not any(decoded.get('iss', '').startswith(issuer) for issuer in valid_issuers):
+        if not decoded.get('iss', '').startswith(_VALID_ISSUERS):
             return False
 
+        _token_cache[cache_key] = float(decoded['exp'])
+        if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
         return True
 
     except jwt.ExpiredSignatureError:
@@ -78,11 +187,7 @@ def validate_microsoft_tenant(tenant_id: str) -> bool:
     Returns:
         True if tenant ID is valid format
     """
-    import re
-
-    # Validate GUID format
-    guid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return bool(re.match(guid_pattern, tenant_id, re.IGNORECASE))
+    return _GUID_PATTERN.match(tenant_id) is not None
 
 
 async def authentication_middleware(request: Request, call_next):
@@ -99,20 +204,18 @@ async def authentication_middleware(request: Request, call_next):
     Raises:
         HTTPException: If authentication fails
     """
-    # Skip authentication for health check and root endpoints
-    if request.url.path in ['/', '/health']:
-        return await call_next(request)
-
-    # Only authenticate /api/messages endpoint
-    if request.url.path != '/api/messages':
+    # Only authenticate /api/messages; health check and root pass through
+    if request.url.path not in _AUTHENTICATED_PATHS:
         return await call_next(request)
 
     auth_header = request.headers.get('Authorization', '')
     if not auth_header:
         raise HTTPException(status_code=401, detail="Missing authorization header")
 
-    # Get bot ID from app state
-    bot_id = getattr(request.app.state, 'bot_id', os.getenv('BOT_ID', ''))
+    # Get bot ID from app state (populated at startup)
+    bot_id = getattr(request.app.state, 'bot_id', None)
+    if bot_id is None:
+        bot_id = os.getenv('BOT_ID', '')
 
     try:
         if not validate_jwt_token(auth_header, bot_id):
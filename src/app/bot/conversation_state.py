@@ -1,29 +1,39 @@
 """Conversation state management for Teams bot."""
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from threading import Lock
 
-from app.config.settings import settings
+from app.config.settings import get_settings
 from app.telemetry.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of independently locked conversation shards
+_LOCK_SHARDS = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationContext:
-    """Conversation context for a single conversation."""
+    """Conversation context for a single conversation.
+
+    ``last_activity`` is a POSIX timestamp; ``metadata`` is created lazily
+    since most conversations never use it.
+    """
 
     conversation_id: str
     thread_id: Optional[str] = None
     user_id: Optional[str] = None
-    last_activity: datetime = field(default_factory=datetime.utcnow)
+    last_activity: float = field(default_factory=time.time)
     message_count: int = 0
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Optional[Dict[str, str]] = None
+    # Thread ID assigned when the agent has not provided one
+    default_thread_id: Optional[str] = None
 
     def update_activity(self):
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity = time.time()
         self.message_count += 1
 
 
@@ -36,10 +46,27 @@ class ConversationStore:
 
     def __init__(self):
         """Initialize conversation store."""
-        self._conversations: Dict[str, ConversationContext] = {}
-        self._lock = Lock()
+        # Conversations are split into shards, each with its own lock, so
+        # unrelated conversations never contend. Each shard is ordered
+        # oldest-to-newest by last activity so expiry sweeps can stop at the
+        # first live conversation; plain dict reads are atomic under the GIL.
+        self._shards: Tuple["OrderedDict[str, ConversationContext]", ...] = tuple(
+            OrderedDict() for _ in range(_LOCK_SHARDS)
+        )
+        self._locks = tuple(Lock() for _ in range(_LOCK_SHARDS))
         logger.info("ConversationStore initialized (in-memory)")
 
+    def _shard_index(self, conversation_id: str) -> int:
+        """Get the shard holding a conversation.
+
+        Args:
+            conversation_id: Unique conversation identifier
+
+        Returns:
+            Index into the shard and lock tuples
+        """
+        return hash(conversation_id) % _LOCK_SHARDS
+
     def get_or_create(self, conversation_id: str, user_id: Optional[str] = None) -> ConversationContext:
         """Get existing conversation context or create new one.
 
@@ -50,13 +77,17 @@ class ConversationStore:
         Returns:
             ConversationContext for the conversation
         """
-        with self._lock:
-            if conversation_id not in self._conversations:
+        index = self._shard_index(conversation_id)
+        conversations = self._shards[index]
+        with self._locks[index]:
+            context = conversations.get(conversation_id)
+            if context is None:
                 context = ConversationContext(
                     conversation_id=conversation_id,
-                    user_id=user_id
+                    user_id=user_id,
+                    default_thread_id=f"thread-{conversation_id}"
                 )
-                self._conversations[conversation_id] = context
+                conversations[conversation_id] = context
                 logger.info(
                     "Created new conversation context",
                     properties={
@@ -65,8 +96,8 @@ class ConversationStore:
                     }
                 )
             else:
-                context = self._conversations[conversation_id]
                 context.update_activity()
+                conversations.move_to_end(conversation_id)
 
             return context
 
@@ -79,8 +110,7 @@ class ConversationStore:
         Returns:
             ConversationContext if exists, None otherwise
         """
-        with self._lock:
-            return self._conversations.get(conversation_id)
+        return self._shards[self._shard_index(conversation_id)].get(conversation_id)
 
     def update_thread_id(self, conversation_id: str, thread_id: str):
         """Update thread ID for conversation.
@@ -89,9 +119,11 @@ class ConversationStore:
             conversation_id: Unique conversation identifier
             thread_id: Agent framework thread ID
         """
-        with self._lock:
-            if conversation_id in self._conversations:
-                self._conversations[conversation_id].thread_id = thread_id
+        index = self._shard_index(conversation_id)
+        with self._locks[index]:
+            context = self._shards[index].get(conversation_id)
+            if context is not None:
+                context.thread_id = thread_id
                 logger.debug(
                     "Updated thread ID for conversation",
                     properties={
@@ -100,29 +132,42 @@ class ConversationStore:
                     }
                 )
 
-    def cleanup_expired(self):
-        """Remove expired conversation contexts.
+    def size(self) -> int:
+        """Get the number of stored conversations.
 
-        Conversations are considered expired after configured timeout.
+        Returns:
+            Number of conversation contexts
         """
-        timeout = timedelta(minutes=settings.conversation_timeout_minutes)
-        cutoff_time = datetime.utcnow() - timeout
+        return sum(len(conversations) for conversations in self._shards)
 
-        with self._lock:
-            expired = [
-                conv_id
-                for conv_id, context in self._conversations.items()
-                if context.last_activity < cutoff_time
-            ]
+    def cleanup_expired(self) -> int:
+        """Remove expired conversation contexts.
 
-            for conv_id in expired:
-                del self._conversations[conv_id]
+        Conversations are considered expired after configured timeout.
 
-            if expired:
-                logger.info(
-                    "Cleaned up expired conversations",
-                    properties={"count": len(expired)}
-                )
+        Returns:
+            Number of conversations removed
+        """
+        cutoff_time = time.time() - get_settings().conversation_timeout_minutes * 60
+
+        removed = 0
+        for conversations, lock in zip(self._shards, self._locks):
+            with lock:
+                # Pop from the least recently active end until a live conversation
+                while conversations:
+                    conv_id, context = next(iter(conversations.items()))
+                    if context.last_activity >= cutoff_time:
+                        break
+                    del conversations[conv_id]
+                    removed += 1
+
+        if removed:
+            logger.info(
+                "Cleaned up expired conversations",
+                properties={"count": removed}
+            )
+
+        return removed
 
     def get_stats(self) -> Dict[str, int]:
         """Get conversation store statistics.
@@ -130,13 +175,15 @@ class ConversationStore:
         Returns:
             Dictionary with statistics
         """
-        with self._lock:
-            return {
-                "total_conversations": len(self._conversations),
-                "active_threads": sum(
-                    1 for c in self._conversations.values() if c.thread_id
-                )
-            }
+        contexts = [
+            context
+            for conversations in self._shards
+            for context in list(conversations.values())
+        ]
+        return {
+            "total_conversations": len(contexts),
+            "active_threads": sum(1 for c in contexts if c.thread_id)
+        }
 
 
 # Global conversation store instance
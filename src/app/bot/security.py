@@ -2,15 +2,66 @@
 Security Headers and CORS Configuration
 Implements production-grade security headers and CORS settings
 """
-from typing import Dict, List
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Match, Optional, Pattern, Tuple
 
+from fastapi import Request, Response
 
-def get_security_headers() -> Dict[str, str]:
+from app.utils import json_codec
+
+
+# Content-Security-Policy directives, serialized once into the header value
+_CSP_DIRECTIVES: Tuple[str, ...] = (
+    "default-src 'self'",
+    "script-src 'self'",
+    "style-src 'self' 'unsafe-inline'",
+    "img-src 'self' data: https:",
+    "font-src 'self'",
+    "connect-src 'self' https://api.botframework.com https://*.teams.microsoft.com",
+    "frame-ancestors 'none'",
+    "base-uri 'self'",
+    "form-action 'self'",
+)
+_CONTENT_SECURITY_POLICY = '; '.join(_CSP_DIRECTIVES)
+
+# Security headers are static; build them once at import
+_SECURITY_HEADERS: Mapping[str, str] = MappingProxyType({
+    # Strict-Transport-Security: Enforce HTTPS for 1 year
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains; preload',
+
+    # Content-Security-Policy: Restrict resource loading
+    'Content-Security-Policy': _CONTENT_SECURITY_POLICY,
+
+    # X-Frame-Options: Prevent embedding in iframes
+    'X-Frame-Options': 'DENY',
+
+    # X-Content-Type-Options: Prevent MIME type sniffing
+    'X-Content-Type-Options': 'nosniff',
+
+    # X-XSS-Protection: Enable XSS filter (legacy support)
+    'X-XSS-Protection': '1; mode=block',
+
+    # Referrer-Policy: Control referrer information
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+
+    # Permissions-Policy: Control browser features
+    'Permissions-Policy': 'geolocation=(), microphone=(), camera=()'
+})
+
+# Pre-encoded (name, value) pairs in ASGI raw header form (lowercase names)
+_SECURITY_HEADERS_RAW: Tuple[Tuple[bytes, bytes], ...] = tuple(
+    (name.lower().encode('latin-1'), value.encode('latin-1'))
+    for name, value in _SECURITY_HEADERS.items()
+)
+
+
+def get_security_headers() -> Mapping[str, str]:
     """
     Get security headers for HTTP responses.
 
     Returns:
-        Dictionary of security headers
+        Read-only mapping of security headers
 
     Security headers implemented:
     - HSTS: Enforce HTTPS connections
@@ -19,38 +70,77 @@ def get_security_headers() -> Dict[str, str]:
     - X-Content-Type-Options: Prevent MIME type sniffing
     - X-XSS-Protection: Enable XSS filter
     """
-    return {
-        # Strict-Transport-Security: Enforce HTTPS for 1 year
-        'Strict-Transport-Security': 'max-age=31536000; includeSubDomains; preload',
-
-        # Content-Security-Policy: Restrict resource loading
-        'Content-Security-Policy': (
-            "default-src 'self'; "
-            "script-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self'; "
-            "connect-src 'self' https://api.botframework.com https://*.teams.microsoft.com; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        ),
-
-        # X-Frame-Options: Prevent embedding in iframes
-        'X-Frame-Options': 'DENY',
-
-        # X-Content-Type-Options: Prevent MIME type sniffing
-        'X-Content-Type-Options': 'nosniff',
-
-        # X-XSS-Protection: Enable XSS filter (legacy support)
-        'X-XSS-Protection': '1; mode=block',
-
-        # Referrer-Policy: Control referrer information
-        'Referrer-Policy': 'strict-origin-when-cross-origin',
-
-        # Permissions-Policy: Control browser features
-        'Permissions-Policy': 'geolocation=(), microphone=(), camera=()'
-    }
+    return _SECURITY_HEADERS
+
+
+def get_security_headers_raw() -> Tuple[Tuple[bytes, bytes], ...]:
+    """
+    Get security headers pre-encoded as ASGI raw header pairs.
+
+    Returns:
+        Tuple of (name, value) byte pairs with lowercase names
+    """
+    return _SECURITY_HEADERS_RAW
+
+
+async def security_headers_middleware(request: Request, call_next):
+    """
+    FastAPI middleware that adds security headers to every response.
+
+    Args:
+        request: FastAPI request object
+        call_next: Next middleware in chain
+
+    Returns:
+        Response with security headers appended
+    """
+    response = await call_next(request)
+    response.raw_headers.extend(_SECURITY_HEADERS_RAW)
+    return response
+
+
+# CORS origins; '*' stands for exactly one subdomain label
+_CORS_ALLOWED_ORIGINS: Tuple[str, ...] = (
+    'https://teams.microsoft.com',
+    'https://*.teams.microsoft.com',
+    'https://api.botframework.com',
+    'https://*.botframework.com',
+    'https://smba.trafficmanager.net',
+    'https://*.smba.trafficmanager.net'
+)
+
+
+def _compile_origin_pattern(origins: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile origin patterns into a single alternation.
+
+    Args:
+        origins: Origins, optionally with '*' subdomain wildcards
+
+    Returns:
+        Case-insensitive pattern to be used with fullmatch
+    """
+    alternatives = (
+        re.escape(origin).replace(r'\*', r'[^./:]+')
+        for origin in origins
+    )
+    return re.compile('|'.join(alternatives), re.IGNORECASE | re.ASCII)
+
+
+_CORS_ORIGIN_PATTERN = _compile_origin_pattern(_CORS_ALLOWED_ORIGINS)
+
+
+def get_cors_origin_matcher() -> Callable[[str], Optional[Match[str]]]:
+    """
+    Get a matcher for allowed CORS origins.
+
+    Wildcard entries such as https://*.teams.microsoft.com match a single
+    subdomain label, so nested subdomains and lookalike hosts are rejected.
+
+    Returns:
+        Callable returning a match object if the origin is allowed, else None
+    """
+    return _CORS_ORIGIN_PATTERN.fullmatch
 
 
 def get_cors_config() -> Dict[str, List[str]]:
@@ -66,14 +156,7 @@ def get_cors_config() -> Dict[str, List[str]]:
     - Allowed headers: Authorization, Content-Type
     """
     return {
-        'allowed_origins': [
-            'https://teams.microsoft.com',
-            'https://*.teams.microsoft.com',
-            'https://api.botframework.com',
-            'https://*.botframework.com',
-            'https://smba.trafficmanager.net',
-            'https://*.smba.trafficmanager.net'
-        ],
+        'allowed_origins': list(_CORS_ALLOWED_ORIGINS),
         'allowed_methods': [
             'GET',
             'POST',
@@ -92,6 +175,101 @@ def get_cors_config() -> Dict[str, List[str]]:
     }
 
 
+def _build_preflight_headers(config: Dict) -> Tuple[Tuple[bytes, bytes], ...]:
+    """
+    Pre-encode the origin-independent CORS preflight headers.
+
+    Args:
+        config: CORS configuration as returned by get_cors_config()
+
+    Returns:
+        Tuple of ASGI raw header pairs
+    """
+    headers = [
+        (b'access-control-allow-methods', ', '.join(config['allowed_methods']).encode('latin-1')),
+        (b'access-control-allow-headers', ', '.join(config['allowed_headers']).encode('latin-1')),
+        (b'access-control-max-age', str(config['max_age']).encode('latin-1')),
+        (b'vary', b'Origin'),
+    ]
+    if config['allow_credentials']:
+        headers.append((b'access-control-allow-credentials', b'true'))
+    return tuple(headers)
+
+
+_CORS_CONFIG = get_cors_config()
+_CORS_PREFLIGHT_HEADERS_RAW = _build_preflight_headers(_CORS_CONFIG)
+_CORS_ALLOW_CREDENTIALS: bool = bool(_CORS_CONFIG['allow_credentials'])
+
+# Called server-to-server by Bot Service; never from a browser origin
+_CORS_EXEMPT_PATHS = frozenset({'/api/messages'})
+
+
+def _cors_origin_headers(origin: str) -> List[Tuple[bytes, bytes]]:
+    """
+    Build per-origin CORS response headers.
+
+    Args:
+        origin: Request Origin header value (already validated)
+
+    Returns:
+        List of ASGI raw header pairs
+    """
+    headers = [
+        (b'access-control-allow-origin', origin.encode('latin-1')),
+        (b'vary', b'Origin'),
+    ]
+    if _CORS_ALLOW_CREDENTIALS:
+        headers.append((b'access-control-allow-credentials', b'true'))
+    return headers
+
+
+async def cors_middleware(request: Request, call_next):
+    """
+    FastAPI middleware implementing CORS for the allowed origins.
+
+    Preflight requests (OPTIONS with an allowed Origin and an
+    Access-Control-Request-Method header) are answered immediately from
+    pre-encoded headers without reaching the application; any other request,
+    including OPTIONS from a disallowed origin, falls through to the app.
+    Bot Service traffic to /api/messages and requests without an Origin
+    header skip CORS entirely.
+
+    Args:
+        request: FastAPI request object
+        call_next: Next middleware in chain
+
+    Returns:
+        Response with CORS headers where applicable
+    """
+    if request.url.path in _CORS_EXEMPT_PATHS:
+        return await call_next(request)
+
+    origin = request.headers.get('origin')
+    if not origin or not _CORS_ORIGIN_PATTERN.fullmatch(origin):
+        return await call_next(request)
+
+    if request.method == 'OPTIONS' and 'access-control-request-method' in request.headers:
+        response = Response(status_code=204)
+        response.raw_headers.extend(_CORS_PREFLIGHT_HEADERS_RAW)
+        response.raw_headers.append(
+            (b'access-control-allow-origin', origin.encode('latin-1'))
+        )
+        return response
+
+    response = await call_next(request)
+    response.raw_headers.extend(_cors_origin_headers(origin))
+    return response
+
+    if request.url.path in _CORS_EXEMPT_PATHS:
+        return await call_next(request)
+
+    origin = request.headers.get('origin')
+    response = await call_next(request)
+    if origin and _CORS_ORIGIN_PATTERN.fullmatch(origin):
+        response.raw_headers.extend(_cors_origin_headers(origin))
+    return response
+
+
 def get_rate_limit_config() -> Dict[str, int]:
     """
     Get rate limiting configuration.
@@ -112,12 +290,88 @@ def get_rate_limit_config() -> Dict[str, int]:
     }
 
 
-def get_waf_rules() -> List[Dict[str, str]]:
+# WAF rule definitions (for Azure Front Door/Application Gateway)
+_WAF_RULES: List[Dict] = [
+    {
+        'name': 'SQLInjectionProtection',
+        'priority': 100,
+        'rule_type': 'MatchRule',
+        'match_conditions': [
+            {
+                'match_variable': 'RequestBody',
+                'operator': 'Contains',
+                'match_values': ['union', 'select', 'insert', 'drop', 'delete'],
+                'transforms': ['Lowercase']
+            }
+        ],
+        'action': 'Block'
+    },
+    {
+        'name': 'XSSProtection',
+        'priority': 200,
+        'rule_type': 'MatchRule',
+        'match_conditions': [
+            {
+                'match_variable': 'RequestBody',
+                'operator': 'Contains',
+                'match_values': ['<script', 'javascript:', 'onerror='],
+                'transforms': ['Lowercase']
+            }
+        ],
+        'action': 'Block'
+    },
+    {
+        'name': 'RateLimitByIP',
+        'priority': 300,
+        'rule_type': 'RateLimitRule',
+        'rate_limit_duration': 'OneMinute',
+        'rate_limit_threshold': 100,
+        'action': 'Block'
+    },
+    {
+        'name': 'EnforceHTTPS',
+        'priority': 400,
+        'rule_type': 'MatchRule',
+        'match_conditions': [
+            {
+                'match_variable': 'RequestScheme',
+                'operator': 'Equal',
+                'match_values': ['http']
+            }
+        ],
+        'action': 'Redirect',
+        'redirect_url': 'https://{host}{path}'
+    }
+]
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts and lists into read-only mappings and tuples.
+
+    Args:
+        value: JSON-like structure
+
+    Returns:
+        Equivalent structure that cannot be modified
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_WAF_RULES_FROZEN: Tuple[Mapping[str, Any], ...] = _freeze(_WAF_RULES)
+_WAF_RULES_JSON = json_codec.dumps(_WAF_RULES)
+
+
+def get_waf_rules() -> Tuple[Mapping[str, Any], ...]:
     """
     Get Web Application Firewall rule definitions.
 
     Returns:
-        List of WAF rule configurations
+        Read-only WAF rule configurations, built once at import; nested
+        lists are tuples and nested dicts are read-only mappings
 
     WAF Rules (for Azure Front Door/Application Gateway):
     - SQL injection protection
@@ -126,58 +380,17 @@ def get_waf_rules() -> List[Dict[str, str]]:
     - Rate limiting
     - Bot detection
     """
-    return [
-        {
-            'name': 'SQLInjectionProtection',
-            'priority': 100,
-            'rule_type': 'MatchRule',
-            'match_conditions': [
-                {
-                    'match_variable': 'RequestBody',
-                    'operator': 'Contains',
-                    'match_values': ['union', 'select', 'insert', 'drop', 'delete'],
-                    'transforms': ['Lowercase']
-                }
-            ],
-            'action': 'Block'
-        },
-        {
-            'name': 'XSSProtection',
-            'priority': 200,
-            'rule_type': 'MatchRule',
-            'match_conditions': [
-                {
-                    'match_variable': 'RequestBody',
-                    'operator': 'Contains',
-                    'match_values': ['<script', 'javascript:', 'onerror='],
-                    'transforms': ['Lowercase']
-                }
-            ],
-            'action': 'Block'
-        },
-        {
-            'name': 'RateLimitByIP',
-            'priority': 300,
-            'rule_type': 'RateLimitRule',
-            'rate_limit_duration': 'OneMinute',
-            'rate_limit_threshold': 100,
-            'action': 'Block'
-        },
-        {
-            'name': 'EnforceHTTPS',
-            'priority': 400,
-            'rule_type': 'MatchRule',
-            'match_conditions': [
-                {
-                    'match_variable': 'RequestScheme',
-                    'operator': 'Equal',
-                    'match_values': ['http']
-                }
-            ],
-            'action': 'Redirect',
-            'redirect_url': 'https://{host}{path}'
-        }
-    ]
+    return _WAF_RULES_FROZEN
+
+
+def get_waf_rules_json() -> bytes:
+    """
+    Get the WAF rule definitions serialized for Azure APIs.
+
+    Returns:
+        Compact UTF-8 JSON encoding of get_waf_rules()
+    """
+    return _WAF_RULES_JSON
 
 
 def get_ddos_protection_config() -> Dict[str, any]:
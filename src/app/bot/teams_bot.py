@@ -1,4 +1,5 @@
 """Teams bot adapter and activity handler."""
+import asyncio
 from typing import Optional
 from botbuilder.core import ActivityHandler, TurnContext, MessageFactory
 from botbuilder.schema import Activity, ActivityTypes, ChannelAccount
@@ -14,10 +15,19 @@ logger = get_logger(__name__)
 class TeamsBot(ActivityHandler):
     """Teams bot activity handler integrated with AI agent."""
 
+    # ActivityHandler has no __slots__, so instances keep a __dict__; slotting
+    # our own attributes still gives them fixed-offset access.
+    __slots__ = ("conversation_store", "_agent", "_typing_activity")
+
     def __init__(self):
         """Initialize Teams bot handler."""
         super().__init__()
         self.conversation_store = get_conversation_store()
+        # Resolved on the first message and reused afterwards
+        self._agent = None
+        # Shared typing activity; send_activity deep-copies it before any
+        # await, so setting relates_to per turn is safe on the event loop
+        self._typing_activity = Activity(type=ActivityTypes.typing)
         logger.info("TeamsBot initialized")
 
     async def on_message_activity(self, turn_context: TurnContext):
@@ -26,6 +36,9 @@ class TeamsBot(ActivityHandler):
         Args:
             turn_context: Turn context containing the incoming activity
         """
+        conversation_store = self.conversation_store
+        typing_task = None
+
         try:
             # Extract message text (handle @mentions)
             message_text = extract_message_text(turn_context.activity)
@@ -38,7 +51,7 @@ class TeamsBot(ActivityHandler):
             conversation_id = turn_context.activity.conversation.id
             user_id = turn_context.activity.from_property.id if turn_context.activity.from_property else None
 
-            context = self.conversation_store.get_or_create(conversation_id, user_id)
+            context = conversation_store.get_or_create(conversation_id, user_id)
 
             logger.info(
                 "Processing message",
@@ -50,11 +63,13 @@ class TeamsBot(ActivityHandler):
                 }
             )
 
-            # Send typing indicator
-            await self._send_typing_indicator(turn_context)
+            # Send typing indicator concurrently with agent processing
+            typing_task = asyncio.create_task(self._send_typing_indicator(turn_context))
 
             # Get agent and process message
-            agent = await get_agent()
+            agent = self._agent
+            if agent is None:
+                agent = self._agent = await get_agent()
             response_text = await agent.run(
                 message=message_text,
                 thread_id=context.thread_id
@@ -65,12 +80,13 @@ class TeamsBot(ActivityHandler):
             # We track it in conversation store for reference
             if not context.thread_id:
                 # In production, extract thread_id from agent response
-                # For MVP, we'll generate one from conversation_id
-                context.thread_id = f"thread-{conversation_id}"
-                self.conversation_store.update_thread_id(conversation_id, context.thread_id)
+                # For MVP, we use the ID derived from conversation_id
+                context.thread_id = context.default_thread_id
+                conversation_store.update_thread_id(conversation_id, context.thread_id)
 
-            # Format and send response
+            # Format and send response (after the typing indicator)
             formatted_response = format_teams_response(response_text)
+            await typing_task
             await turn_context.send_activity(MessageFactory.text(formatted_response))
 
             logger.info(
@@ -82,6 +98,8 @@ class TeamsBot(ActivityHandler):
             )
 
         except Exception as e:
+            if typing_task is not None and not typing_task.done():
+                typing_task.cancel()
             logger.error(
                 "Error processing message",
                 properties={
@@ -145,10 +163,8 @@ class TeamsBot(ActivityHandler):
             turn_context: Turn context
         """
         try:
-            typing_activity = Activity(
-                type=ActivityTypes.typing,
-                relates_to=turn_context.activity.relates_to
-            )
+            typing_activity = self._typing_activity
+            typing_activity.relates_to = turn_context.activity.relates_to
             await turn_context.send_activity(typing_activity)
         except Exception as e:
             # Typing indicator is non-critical, log but don't fail
@@ -1,5 +1,6 @@
 """Application configuration and settings."""
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -57,5 +58,21 @@ class Settings(BaseSettings):
         return self.bot_password is None or self.bot_password == ""
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them on first use.
+
+    Tests can call get_settings.cache_clear() to reload from a patched
+    environment.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``settings`` lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,27 @@
 """FastAPI application for Teams AI Agent."""
 import asyncio
+import random
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.responses import JSONResponse
 from botbuilder.core import BotFrameworkAdapterSettings, BotFrameworkAdapter
 from botbuilder.schema import Activity
 
-from app.config.settings import settings
+from app.config.settings import get_settings
 from app.bot.teams_bot import TeamsBot
 from app.agent.ai_agent import get_agent
 from app.bot.conversation_state import get_conversation_store
+from app.bot.security import cors_middleware, security_headers_middleware
 from app.telemetry.logger import get_logger, configure_tracing
+from app.utils import json_codec
 
 logger = get_logger(__name__)
 
+# Conversation cleanup scheduling
+CLEANUP_INTERVAL_SECONDS = 600  # 10 minutes
+CLEANUP_MAX_INTERVAL_SECONDS = 1200
+CLEANUP_JITTER_SECONDS = 60
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,6 +32,9 @@ async def lifespan(app: FastAPI):
     # Configure tracing
     configure_tracing()
 
+    # Cache bot ID for the authentication middleware
+    app.state.bot_id = get_settings().bot_id or ""
+
     # Initialize agent
     try:
         agent = await get_agent()
@@ -57,7 +68,14 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Add security headers to all responses
+app.middleware("http")(security_headers_middleware)
+
+# CORS (registered last so preflight requests short-circuit first)
+app.middleware("http")(cors_middleware)
+
 # Bot Framework adapter settings
+settings = get_settings()
 adapter_settings = BotFrameworkAdapterSettings(
     app_id=settings.bot_id,
     app_password=settings.bot_password or ""
@@ -148,16 +166,19 @@ async def messages(request: Request):
     Returns:
         Response with status code
     """
+    # Reject unauthenticated calls before reading the body. Without a bot ID
+    # (local emulator) the adapter skips auth, so the header is optional.
+    auth_header = request.headers.get("Authorization", "")
+    if settings.bot_id and not auth_header.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Missing authorization header")
+
     try:
         # Get request body
-        body = await request.json()
+        body = json_codec.loads(await request.body())
 
         # Create activity from request
         activity = Activity().deserialize(body)
 
-        # Get auth header
-        auth_header = request.headers.get("Authorization", "")
-
         # Process activity through adapter
         await bot_adapter.process_activity(activity, auth_header, bot.on_turn)
 
@@ -174,14 +195,24 @@ async def messages(request: Request):
 async def periodic_cleanup():
     """Periodic task to cleanup expired conversations.
 
-    Runs every 10 minutes to remove expired conversation contexts.
+    Runs every 10 minutes (plus jitter so replicas don't sweep in lockstep)
+    to remove expired conversation contexts. While the store is empty or
+    sweeps find nothing to remove, the interval doubles up to
+    CLEANUP_MAX_INTERVAL_SECONDS; it resets once a sweep expires entries.
     """
     conversation_store = get_conversation_store()
+    interval = CLEANUP_INTERVAL_SECONDS
 
     while True:
         try:
-            await asyncio.sleep(600)  # 10 minutes
-            conversation_store.cleanup_expired()
+            await asyncio.sleep(interval + random.uniform(0, CLEANUP_JITTER_SECONDS))
+
+            # An empty store has nothing to expire, so skip the sweep
+            removed = conversation_store.cleanup_expired() if conversation_store.size() else 0
+            if removed:
+                interval = CLEANUP_INTERVAL_SECONDS
+            else:
+                interval = min(interval * 2, CLEANUP_MAX_INTERVAL_SECONDS)
             logger.debug("Periodic conversation cleanup completed")
         except asyncio.CancelledError:
             logger.info("Periodic cleanup task cancelled")
@@ -198,5 +229,8 @@ if __name__ == "__main__":
         host=settings.app_host,
         port=settings.app_port,
         log_level=settings.log_level.lower(),
-        reload=not settings.is_production
+        reload=not settings.is_production,
+        # C HTTP parser; uvloop is Linux/macOS only, so fall back locally
+        http="httptools",
+        loop="uvloop" if settings.is_production else "auto"
     )
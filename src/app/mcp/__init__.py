@@ -2,6 +2,7 @@
 
 This module provides MCP server configuration and management for the Azure AI Agent Framework.
 """
+from app.mcp.async_loop import AsyncLoopThread, MCPClientWrapper, get_loop_thread
 from app.mcp.bridge import MCPToolBridge
 from app.mcp.circuit_breaker import CircuitBreaker, CircuitState
 from app.mcp.client import MCPClient, MCPSTDIOClient, MCPSSEClient
@@ -9,10 +10,14 @@ from app.mcp.config import MCPServerConfig, MCPServersConfig, TransportType
 from app.mcp.discovery import discover_tools, discover_tools_from_manager
 from app.mcp.exceptions import MCPConnectionError, MCPTimeoutError, MCPTransportError
 from app.mcp.factory import MCPClientFactory
-from app.mcp.loader import MCPConfigError, load_mcp_config
+from app.mcp.loader import MCPConfigError, load_mcp_config, substitute_env_vars
 from app.mcp.manager import MCPConnectionManager
 from app.mcp.registry import MCPToolRegistry
-from app.mcp.tool_schema import MCPToolSchema, mcp_to_agent_framework
+from app.mcp.tool_schema import (
+    MCPToolSchema,
+    mcp_to_agent_framework,
+    mcp_to_agent_framework_many,
+)
 
 __all__ = [
     # Configuration
@@ -20,6 +25,7 @@ __all__ = [
     "MCPServersConfig",
     "TransportType",
     "load_mcp_config",
+    "substitute_env_vars",
     "MCPConfigError",
     # Clients
     "MCPClient",
@@ -28,12 +34,17 @@ __all__ = [
     "MCPClientFactory",
     # Manager
     "MCPConnectionManager",
+    # Synchronous access
+    "AsyncLoopThread",
+    "MCPClientWrapper",
+    "get_loop_thread",
     # Tool Discovery & Registry
     "MCPToolSchema",
     "MCPToolRegistry",
     "discover_tools",
     "discover_tools_from_manager",
     "mcp_to_agent_framework",
+    "mcp_to_agent_framework_many",
     # Bridge
     "MCPToolBridge",
     # Circuit Breaker
@@ -0,0 +1,256 @@
+"""Background event loop for calling MCP code from synchronous callers.
+
+MCP clients own loop-bound resources (subprocess pipes, HTTP connection pools),
+so every call for a given manager must run on the same event loop. This module
+provides one long-lived loop on a daemon thread and a synchronous facade over
+MCPConnectionManager that submits work to it, instead of callers paying for a
+fresh ``asyncio.run`` loop per call.
+"""
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+from app.mcp.config import MCPServersConfig
+from app.mcp.exceptions import MCPConnectionError
+from app.mcp.manager import MCPConnectionManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """An asyncio event loop running forever on a dedicated daemon thread."""
+
+    __slots__ = ("_loop", "_thread", "_lock")
+
+    def __init__(self):
+        """Initialize without starting the loop; it starts on first submit."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread has been started and not stopped."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread if it is not already running."""
+        with self._lock:
+            if self.is_running:
+                return
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run, args=(loop,), name="mcp-event-loop", daemon=True
+            )
+            thread.start()
+            self._loop = loop
+            self._thread = thread
+            logger.debug("Started MCP event loop thread")
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        """Thread target: run the loop until stopped, then close it.
+
+        Args:
+            loop: Event loop owned by this thread
+        """
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop thread.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future resolved with the coroutine's result
+
+        Raises:
+            RuntimeError: If called from the loop thread itself, where blocking
+                on the returned future would deadlock
+        """
+        self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot submit to the MCP event loop from its own thread")
+        assert self._loop is not None
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop thread and block for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before giving up, or None to wait forever
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the result is not ready within timeout
+            Exception: Any exception raised by the coroutine
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the loop and wait for its thread to exit.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        with self._lock:
+            if not self.is_running:
+                return
+            assert self._loop is not None and self._thread is not None
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._loop = None
+            self._thread = None
+            logger.debug("Stopped MCP event loop thread")
+
+
+_default_loop_thread: Optional[AsyncLoopThread] = None
+_default_loop_lock = threading.Lock()
+
+
+def get_loop_thread() -> AsyncLoopThread:
+    """Get the process-wide MCP loop thread, creating it on first use.
+
+    Returns:
+        Shared AsyncLoopThread instance
+    """
+    global _default_loop_thread
+    if _default_loop_thread is None:
+        with _default_loop_lock:
+            if _default_loop_thread is None:
+                _default_loop_thread = AsyncLoopThread()
+    return _default_loop_thread
+
+
+class MCPClientWrapper:
+    """Synchronous facade over MCPConnectionManager.
+
+    Every call is forwarded to a single loop thread, so the manager and the
+    clients it creates always run on the loop that owns their resources.
+    """
+
+    __slots__ = ("_manager", "_loop_thread", "_timeout")
+
+    def __init__(
+        self,
+        manager: Optional[MCPConnectionManager] = None,
+        loop_thread: Optional[AsyncLoopThread] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            manager: Manager to drive; a new one is created when omitted
+            loop_thread: Loop to run on; the process-wide loop when omitted
+            timeout: Default seconds to wait for each call, or None to wait forever
+        """
+        self._manager = manager if manager is not None else MCPConnectionManager()
+        self._loop_thread = loop_thread if loop_thread is not None else get_loop_thread()
+        self._timeout = timeout
+
+    @property
+    def manager(self) -> MCPConnectionManager:
+        """The wrapped connection manager."""
+        return self._manager
+
+    def initialize(self, config: MCPServersConfig) -> None:
+        """Initialize the manager with server configurations.
+
+        Args:
+            config: MCP servers configuration
+        """
+        self._loop_thread.run(self._manager.initialize(config), self._timeout)
+
+    def connect_server(self, server_name: str, max_retries: int = 3) -> bool:
+        """Connect to a specific MCP server with retry logic.
+
+        Args:
+            server_name: Name of the server to connect to
+            max_retries: Maximum number of connection retry attempts
+
+        Returns:
+            True if connection successful
+        """
+        return self._loop_thread.run(
+            self._manager.connect_server(server_name, max_retries), self._timeout
+        )
+
+    def connect_all_enabled(self) -> Dict[str, bool]:
+        """Connect to all enabled servers.
+
+        Returns:
+            Dictionary mapping server names to connection results
+        """
+        return self._loop_thread.run(self._manager.connect_all_enabled(), self._timeout)
+
+    def disconnect_server(self, server_name: str) -> None:
+        """Disconnect from a specific MCP server.
+
+        Args:
+            server_name: Name of the server to disconnect from
+        """
+        self._loop_thread.run(self._manager.disconnect_server(server_name), self._timeout)
+
+    def send_request(self, server_name: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a JSON-RPC request to a connected server.
+
+        Args:
+            server_name: Name of the connected server
+            request: JSON-RPC request payload
+
+        Returns:
+            JSON-RPC response
+
+        Raises:
+            MCPConnectionError: If no client is connected for the server
+        """
+
+        async def _send() -> Dict[str, Any]:
+            client = await self._manager.get_client(server_name)
+            if client is None:
+                raise MCPConnectionError(f"No client available for server: {server_name}")
+            return await client.send_request(request)
+
+        return self._loop_thread.run(_send(), self._timeout)
+
+    def health_check_all(self) -> Dict[str, bool]:
+        """Perform health check on all connected servers.
+
+        Returns:
+            Dictionary mapping server names to health status
+        """
+        return self._loop_thread.run(self._manager.health_check_all(), self._timeout)
+
+    def get_server_status(self) -> Dict[str, Dict[str, bool]]:
+        """Get detailed status of all configured servers.
+
+        Returns:
+            Dictionary mapping server names to status info (connected, enabled)
+        """
+        return self._loop_thread.run(self._manager.get_server_status(), self._timeout)
+
+    def shutdown(self) -> None:
+        """Gracefully shut down all connections.
+
+        The loop thread keeps running, since it may be shared with other wrappers.
+        """
+        self._loop_thread.run(self._manager.shutdown(), self._timeout)
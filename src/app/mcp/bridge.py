@@ -2,12 +2,14 @@
 
 This module provides basic integration between MCP tools and the Azure AI Agent Framework.
 """
+import copy
+import itertools
 from typing import Any
 
 from app.mcp.exceptions import MCPConnectionError
 from app.mcp.manager import MCPConnectionManager
 from app.mcp.registry import MCPToolRegistry
-from app.mcp.tool_schema import mcp_to_agent_framework
+from app.mcp.tool_schema import mcp_to_agent_framework_many
 
 
 class MCPToolBridge:
@@ -16,6 +18,14 @@ class MCPToolBridge:
     Provides tool execution and listing functionality for Agent Framework integration.
     """
 
+    __slots__ = (
+        "registry",
+        "manager",
+        "_next_request_id",
+        "_cached_tools",
+        "_cached_version",
+    )
+
     def __init__(self, registry: MCPToolRegistry, manager: MCPConnectionManager):
         """Initialize the bridge.
 
@@ -25,7 +35,11 @@ class MCPToolBridge:
         """
         self.registry = registry
         self.manager = manager
-        self._request_id = 0
+        # count.__next__ is atomic, so concurrent calls never share an id
+        self._next_request_id = itertools.count(1).__next__
+        # Agent Framework tool definitions, rebuilt when the registry changes
+        self._cached_tools: list[dict[str, Any]] = []
+        self._cached_version: Any = None
 
     async def execute_tool(self, full_tool_name: str, params: dict[str, Any]) -> Any:
         """Execute a tool by routing to the appropriate MCP server.
@@ -57,11 +71,10 @@ class MCPToolBridge:
             raise MCPConnectionError(f"No client available for server: {tool.server_name}")
 
         # Prepare JSON-RPC tools/call request
-        self._request_id += 1
         request = {
             "jsonrpc": "2.0",
             "method": "tools/call",
-            "id": self._request_id,
+            "id": self._next_request_id(),
             "params": {"name": tool.name, "arguments": params},
         }
 
@@ -69,8 +82,8 @@ class MCPToolBridge:
         response = await client.send_request(request)
 
         # Check for error response
-        if "error" in response:
-            error = response["error"]
+        error = response.get("error")
+        if error is not None:
             raise Exception(f"Tool execution error: {error.get('message', 'Unknown error')}")
 
         # Return result
@@ -79,10 +92,17 @@ class MCPToolBridge:
     def get_available_tools(self) -> list[dict[str, Any]]:
         """Get all available tools in Agent Framework format.
 
+        Conversions are cached until the registry version changes. Each call
+        returns a deep copy, so callers may modify the result without
+        affecting the cache or other callers.
+
         Returns:
             List of tool definitions in Agent Framework format
         """
-        tools = self.registry.list_tools()
+        version = self.registry.version
+        if version != self._cached_version:
+            # Convert each tool to Agent Framework format
+            self._cached_tools = mcp_to_agent_framework_many(self.registry.list_tools())
+            self._cached_version = version
 
-        # Convert each tool to Agent Framework format
-        return [mcp_to_agent_framework(tool) for tool in tools]
+        return copy.deepcopy(self._cached_tools)
@@ -10,6 +10,7 @@ Circuit states:
 """
 import logging
 import time
+from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any, Callable, Optional
 
@@ -17,6 +18,65 @@ from app.mcp.exceptions import MCPConnectionError
 
 logger = logging.getLogger(__name__)
 
+# Millisecond granularity is plenty for recovery timeouts measured in seconds,
+# so prefer the cheaper coarse clock where the platform provides one.
+_COARSE_CLOCK_ID: Optional[int] = getattr(time, "CLOCK_MONOTONIC_COARSE", None)
+
+
+def _coarse_now() -> float:
+    """Read a monotonic timestamp at coarse (jiffy) resolution.
+
+    Returns:
+        Seconds from an arbitrary fixed point, suitable only for intervals
+    """
+    if _COARSE_CLOCK_ID is not None:
+        return time.clock_gettime(_COARSE_CLOCK_ID)
+    return time.monotonic()
+
+
+class _LazyCircuitOpenError(MCPConnectionError):
+    """MCPConnectionError for a rejected call whose message is built on demand.
+
+    Rejections peak during outages and are usually caught without ever being
+    rendered, so the message is formatted only when ``str()`` is called.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        last_failure_time: Optional[float],
+        recovery_timeout: float,
+        rejected_at: float,
+    ):
+        """Initialize the error.
+
+        Args:
+            name: Name of the circuit that rejected the call
+            last_failure_time: Monotonic timestamp of the last recorded failure
+            recovery_timeout: Seconds the circuit waits before recovery
+            rejected_at: Monotonic timestamp at which the call was rejected
+        """
+        super().__init__(name)
+        self.name = name
+        self.last_failure_time = last_failure_time
+        self.recovery_timeout = recovery_timeout
+        self.rejected_at = rejected_at
+
+    def __str__(self) -> str:
+        """Render the rejection message.
+
+        Returns:
+            Message including the time remaining until recovery at rejection
+        """
+        remaining = 0.0
+        if self.last_failure_time is not None:
+            elapsed = self.rejected_at - self.last_failure_time
+            remaining = max(0.0, self.recovery_timeout - elapsed)
+        return (
+            f"Circuit breaker '{self.name}' is OPEN. "
+            f"Service unavailable (recovery in {remaining:.1f}s)"
+        )
+
 
 class CircuitState(str, Enum):
     """Circuit breaker states."""
@@ -25,6 +85,71 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
+@dataclass(slots=True)
+class CircuitMetrics:
+    """Point-in-time snapshot of a circuit breaker.
+
+    ``time_until_reset`` is only set while the circuit is OPEN. Fields can also
+    be read by key (``metrics["state"]``, ``metrics.get(...)``, ``in`` and
+    ``**metrics``), as with the dictionary that ``get_metrics`` used to
+    return; use ``as_dict`` where a real dict is needed, e.g. for JSON.
+    """
+
+    name: str
+    state: str
+    failure_count: int
+    success_count: int
+    time_until_reset: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a field by name.
+
+        Args:
+            key: Field name
+
+        Returns:
+            The field's value
+
+        Raises:
+            KeyError: If key is not a metrics field
+        """
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key names a metrics field."""
+        return key in self.__slots__
+
+    def keys(self) -> tuple[str, ...]:
+        """Get the metrics field names.
+
+        Returns:
+            Field names, in declaration order
+        """
+        return self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field by name, falling back to a default.
+
+        Args:
+            key: Field name
+            default: Value returned when key is not a metrics field
+
+        Returns:
+            The field's value, or default
+        """
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the snapshot to a plain dictionary.
+
+        Returns:
+            Dictionary with the same keys ``get_metrics`` used to return
+        """
+        return asdict(self)
+
+
 class CircuitBreaker:
     """Circuit breaker for protecting MCP server calls.
 
@@ -37,6 +162,17 @@ class CircuitBreaker:
         success_threshold: Successes needed in half-open state to close circuit
     """
 
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "recovery_timeout",
+        "success_threshold",
+        "_state",
+        "_failure_count",
+        "_success_count",
+        "_last_failure_time",
+    )
+
     def __init__(
         self,
         name: str,
@@ -68,26 +204,63 @@ class CircuitBreaker:
 
         Automatically transitions OPEN -> HALF_OPEN if recovery timeout elapsed.
 
+        Returns:
+            Current circuit state
+        """
+        return self._current_state(_coarse_now())
+
+    def _peek_state(self) -> CircuitState:
+        """Get the stored circuit state without applying the recovery transition.
+
+        Returns:
+            Circuit state as last recorded
+        """
+        return self._state
+
+    def _current_state(self, now: float) -> CircuitState:
+        """Resolve the circuit state at a given monotonic timestamp.
+
+        Args:
+            now: Monotonic clock reading to evaluate the recovery timeout against
+
         Returns:
             Current circuit state
         """
         # Auto-transition from OPEN to HALF_OPEN after timeout
-        if self._state == CircuitState.OPEN and self._should_attempt_reset():
+        if self._state == CircuitState.OPEN and self._should_attempt_reset(now):
             logger.info(f"Circuit breaker '{self.name}' transitioning to HALF_OPEN (recovery attempt)")
-            self._state = CircuitState.HALF_OPEN
-            self._success_count = 0
+            self._transition_to(CircuitState.HALF_OPEN)
 
         return self._state
 
-    def _should_attempt_reset(self) -> bool:
+    def _transition_to(self, state: CircuitState) -> None:
+        """Move to a new state and reset the counters that belong to it.
+
+        All state changes go through here so the state and its counters are
+        always updated together. No await happens between the read and the
+        write, so under asyncio the transition is atomic without a lock.
+
+        Args:
+            state: State to enter
+        """
+        self._state = state
+        self._success_count = 0
+        if state is CircuitState.CLOSED:
+            self._failure_count = 0
+            self._last_failure_time = None
+
+    def _should_attempt_reset(self, now: float) -> bool:
         """Check if enough time has passed to attempt recovery.
 
+        Args:
+            now: Monotonic clock reading
+
         Returns:
             True if recovery timeout has elapsed since last failure
         """
         if self._last_failure_time is None:
             return False
-        return time.time() - self._last_failure_time >= self.recovery_timeout
+        return now - self._last_failure_time >= self.recovery_timeout
 
     async def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute a function through the circuit breaker.
@@ -104,14 +277,15 @@ class CircuitBreaker:
             MCPConnectionError: If circuit is OPEN
             Exception: Any exception raised by the function
         """
-        current_state = self.state
-
-        # Fail fast if circuit is open
-        if current_state == CircuitState.OPEN:
-            raise MCPConnectionError(
-                f"Circuit breaker '{self.name}' is OPEN. "
-                f"Service unavailable (recovery in {self._time_until_reset():.1f}s)"
-            )
+        # CLOSED is the common case and needs no clock read or transition check
+        if self._state is not CircuitState.CLOSED:
+            now = _coarse_now()
+
+            # Fail fast if circuit is open
+            if self._current_state(now) is CircuitState.OPEN:
+                raise _LazyCircuitOpenError(
+                    self.name, self._last_failure_time, self.recovery_timeout, now
+                )
 
         try:
             # Execute the function
@@ -139,10 +313,7 @@ class CircuitBreaker:
             # Close circuit if enough successes
             if self._success_count >= self.success_threshold:
                 logger.info(f"Circuit breaker '{self.name}' closing (recovery successful)")
-                self._state = CircuitState.CLOSED
-                self._failure_count = 0
-                self._success_count = 0
-                self._last_failure_time = None
+                self._transition_to(CircuitState.CLOSED)
 
         elif self._state == CircuitState.CLOSED:
             # Reset failure count on success in CLOSED state
@@ -151,15 +322,14 @@ class CircuitBreaker:
     def _on_failure(self) -> None:
         """Handle failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = _coarse_now()
 
         if self._state == CircuitState.HALF_OPEN:
             # Immediately open if failure in half-open state
             logger.warning(
                 f"Circuit breaker '{self.name}' opening (failure during recovery attempt)"
             )
-            self._state = CircuitState.OPEN
-            self._success_count = 0
+            self._transition_to(CircuitState.OPEN)
 
         elif self._state == CircuitState.CLOSED:
             # Open if threshold exceeded
@@ -168,18 +338,23 @@ class CircuitBreaker:
                     f"Circuit breaker '{self.name}' opening "
                     f"(threshold {self.failure_threshold} failures exceeded)"
                 )
-                self._state = CircuitState.OPEN
+                self._transition_to(CircuitState.OPEN)
 
-    def _time_until_reset(self) -> float:
+    def _time_until_reset(self, now: Optional[float] = None) -> float:
         """Calculate time remaining until reset attempt.
 
+        Args:
+            now: Monotonic clock reading; read from the clock when omitted
+
         Returns:
             Seconds until reset, or 0 if ready
         """
         if self._last_failure_time is None:
             return 0.0
 
-        elapsed = time.time() - self._last_failure_time
+        if now is None:
+            now = _coarse_now()
+        elapsed = now - self._last_failure_time
         remaining = max(0.0, self.recovery_timeout - elapsed)
         return remaining
 
@@ -189,21 +364,22 @@ class CircuitBreaker:
         Use this for administrative reset or testing.
         """
         logger.info(f"Circuit breaker '{self.name}' manually reset to CLOSED")
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._success_count = 0
-        self._last_failure_time = None
+        self._transition_to(CircuitState.CLOSED)
 
-    def get_metrics(self) -> dict[str, Any]:
+    def get_metrics(self) -> CircuitMetrics:
         """Get current circuit breaker metrics.
 
+        Observing metrics never transitions the circuit; an OPEN circuit whose
+        recovery timeout has elapsed reports OPEN with zero time until reset.
+
         Returns:
-            Dictionary with state, failure count, and time until reset
-        """
-        return {
-            "name": self.name,
-            "state": self.state.value,
-            "failure_count": self._failure_count,
-            "success_count": self._success_count,
-            "time_until_reset": self._time_until_reset() if self._state == CircuitState.OPEN else None,
-        }
+            Snapshot with state, failure count, and time until reset
+        """
+        state = self._peek_state()
+        return CircuitMetrics(
+            name=self.name,
+            state=state.value,
+            failure_count=self._failure_count,
+            success_count=self._success_count,
+            time_until_reset=self._time_until_reset() if state is CircuitState.OPEN else None,
+        )
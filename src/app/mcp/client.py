@@ -5,15 +5,58 @@ This module provides concrete implementations of MCP clients supporting:
 - SSE transport: HTTP Server-Sent Events for remote servers
 """
 import asyncio
+import importlib.util
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from app.mcp.config import MCPServerConfig
 from app.mcp.exceptions import MCPConnectionError, MCPTimeoutError, MCPTransportError
+from app.utils import json_codec
+
+# HTTP/2 needs the optional h2 package (installed via httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Request bodies are pre-encoded with json_codec rather than httpx's json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Keep warm connections around between MCP calls to skip TCP/TLS setup
+SSE_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Limits for one pool shared by every SSE server of a connection manager
+SHARED_SSE_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+
+def create_http_client(
+    limits: httpx.Limits = SSE_CONNECTION_LIMITS,
+    headers: Optional[Dict[str, str]] = None,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client for SSE transports.
+
+    Args:
+        limits: Connection pool limits
+        headers: Default headers sent with every request
+
+    Returns:
+        Configured httpx.AsyncClient (HTTP/2 when h2 is installed)
+    """
+    return httpx.AsyncClient(
+        timeout=30.0,
+        http2=_HTTP2_AVAILABLE,
+        limits=limits,
+        headers=headers,
+    )
 
 
 class MCPClient(ABC):
@@ -22,6 +65,8 @@ class MCPClient(ABC):
     Defines the interface that all MCP transport implementations must follow.
     """
 
+    __slots__ = ("config", "_connected")
+
     def __init__(self, config: MCPServerConfig):
         """Initialize the MCP client.
 
@@ -65,6 +110,29 @@ class MCPClient(ABC):
         """
         pass
 
+    async def send_batch(
+        self, requests: List[Dict[str, Any]], timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC requests to the MCP server.
+
+        Transports that support JSON-RPC batching send the requests in one
+        round-trip; this default sends them concurrently.
+
+        Args:
+            requests: JSON-RPC request dictionaries, each with a unique id
+            timeout: Timeout in seconds for each request
+
+        Returns:
+            JSON-RPC response dictionaries in request order
+
+        Raises:
+            MCPTimeoutError: If a request times out
+            MCPTransportError: If transport-level error occurs
+        """
+        return list(
+            await asyncio.gather(*(self.send_request(request, timeout) for request in requests))
+        )
+
     @abstractmethod
     async def is_healthy(self) -> bool:
         """Check if the connection to the MCP server is healthy.
@@ -101,6 +169,8 @@ class MCPSTDIOClient(MCPClient):
     Communicates with MCP servers via stdin/stdout using JSON-RPC over subprocess.
     """
 
+    __slots__ = ("_process", "_request_id", "_env", "_pending", "_reader")
+
     def __init__(self, config: MCPServerConfig):
         """Initialize STDIO client.
 
@@ -109,7 +179,23 @@ class MCPSTDIOClient(MCPClient):
         """
         super().__init__(config)
         self._process: Optional[asyncio.subprocess.Process] = None
+        # Source of wire ids, so concurrent callers never collide on the JSON-RPC id
         self._request_id = 0
+        # In-flight requests keyed by wire id, resolved by the reader task
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        # Reused across reconnects unless the server opts into a fresh snapshot
+        self._env: Optional[Dict[str, str]] = (
+            self._build_env() if config.env_snapshot_at_init else None
+        )
+
+    def _build_env(self) -> Dict[str, str]:
+        """Merge the process environment with the server-specific variables.
+
+        Returns:
+            Environment mapping for the subprocess
+        """
+        return {**os.environ, **self.config.env}
 
     async def connect(self) -> bool:
         """Start subprocess and establish STDIO connection.
@@ -122,8 +208,7 @@ class MCPSTDIOClient(MCPClient):
         """
         try:
             # Build environment variables
-            env = os.environ.copy()
-            env.update(self.config.env)
+            env = self._env if self._env is not None else self._build_env()
 
             # Build command with arguments
             command = [self.config.command] + self.config.args
@@ -147,6 +232,11 @@ class MCPSTDIOClient(MCPClient):
 
     async def disconnect(self) -> None:
         """Terminate subprocess and cleanup resources."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        self._fail_pending(MCPConnectionError("Client disconnected"))
+
         if self._process is not None:
             try:
                 # Gracefully terminate the process
@@ -158,8 +248,9 @@ class MCPSTDIOClient(MCPClient):
 
                 # Wait for process to terminate with timeout
                 try:
-                    await asyncio.wait_for(self._process.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
+                    async with asyncio.timeout(5.0):
+                        await self._process.wait()
+                except TimeoutError:
                     # Force kill if terminate didn't work
                     try:
                         self._process.kill()
@@ -188,6 +279,53 @@ class MCPSTDIOClient(MCPClient):
             MCPTimeoutError: If request times out
             MCPTransportError: If communication error occurs
         """
+        responses = await self._exchange([request], timeout, batch=False)
+        return responses[0]
+
+    async def send_batch(
+        self, requests: List[Dict[str, Any]], timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """Send JSON-RPC requests as a single batch line via STDIO.
+
+        Args:
+            requests: JSON-RPC request dictionaries
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            JSON-RPC response dictionaries in request order
+
+        Raises:
+            MCPConnectionError: If not connected
+            MCPTimeoutError: If any response does not arrive in time
+            MCPTransportError: If communication error occurs
+        """
+        if not requests:
+            return []
+
+        return await self._exchange(requests, timeout, batch=True)
+
+    async def _exchange(
+        self, requests: List[Dict[str, Any]], timeout: float, batch: bool
+    ) -> List[Dict[str, Any]]:
+        """Write requests as one frame and wait for a response to each.
+
+        Each request is sent under a wire id drawn from this client's counter,
+        and its response is returned carrying the caller's original id, so
+        callers may reuse ids (or omit them) without colliding.
+
+        Args:
+            requests: JSON-RPC requests to send
+            timeout: Timeout in seconds for all responses
+            batch: Whether to encode the requests as a JSON array frame
+
+        Returns:
+            JSON-RPC responses in request order
+
+        Raises:
+            MCPConnectionError: If not connected
+            MCPTimeoutError: If a response does not arrive in time
+            MCPTransportError: If communication error occurs
+        """
         if not self._connected or self._process is None:
             raise MCPConnectionError("Client not connected")
 
@@ -197,29 +335,100 @@ class MCPSTDIOClient(MCPClient):
         if self._process.stdout is None:
             raise MCPConnectionError("Process stdout stream is unavailable")
 
+        pending = self._pending
+        caller_ids = [request.get("id") for request in requests]
+        wire_ids = list(range(self._request_id + 1, self._request_id + 1 + len(requests)))
+        self._request_id = wire_ids[-1]
+
+        wire_requests = [
+            {**request, "id": wire_id} for request, wire_id in zip(requests, wire_ids)
+        ]
+        if batch:
+            payload = b"[" + b",".join(json_codec.dumps(r) for r in wire_requests) + b"]\n"
+        else:
+            payload = json_codec.dumps(wire_requests[0]) + b"\n"
+
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in wire_ids]
+        pending.update(zip(wire_ids, futures))
+
         try:
             # Send request
-            request_json = json.dumps(request) + "\n"
-            self._process.stdin.write(request_json.encode("utf-8"))
+            self._process.stdin.write(payload)
             await self._process.stdin.drain()
 
-            # Read response with timeout
-            response_line = await asyncio.wait_for(
-                self._process.stdout.readline(), timeout=timeout
-            )
+            # Responses are matched by id, so concurrent requests share one reader
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(
+                    self._read_responses(self._process.stdout)
+                )
 
-            if not response_line:
-                raise MCPTransportError("Empty response from server")
+            # Wait for the matching responses with timeout
+            async with asyncio.timeout(timeout):
+                if len(futures) == 1:
+                    responses = [await futures[0]]
+                else:
+                    responses = list(await asyncio.gather(*futures))
 
-            response = json.loads(response_line.decode("utf-8"))
-            return response
+            # Map each wire id back to the id the caller supplied
+            for response, caller_id in zip(responses, caller_ids):
+                response["id"] = caller_id
+            return responses
 
-        except asyncio.TimeoutError as e:
+        except TimeoutError as e:
             raise MCPTimeoutError(f"Request timed out after {timeout}s") from e
         except json.JSONDecodeError as e:
             raise MCPTransportError(f"Invalid JSON response: {str(e)}") from e
         except Exception as e:
             raise MCPTransportError(f"Transport error: {str(e)}") from e
+        finally:
+            for wire_id in wire_ids:
+                pending.pop(wire_id, None)
+
+    async def _read_responses(self, stdout: asyncio.StreamReader) -> None:
+        """Dispatch response lines to their waiting requests.
+
+        Runs only while requests are in flight. Lines that match no pending
+        id, and requests or notifications sent by the server, are skipped.
+        A read or decode failure is delivered to every pending request,
+        since the stream can no longer be trusted.
+
+        Args:
+            stdout: Subprocess stdout stream
+        """
+        pending = self._pending
+        try:
+            while pending:
+                response_line = await stdout.readline()
+                if not response_line:
+                    raise MCPTransportError("Empty response from server")
+
+                # orjson's JSONDecodeError subclasses json.JSONDecodeError
+                response = json_codec.loads(response_line)
+
+                # Batch replies arrive as one array of response objects
+                for message in response if isinstance(response, list) else (response,):
+                    if not isinstance(message, dict) or "method" in message:
+                        continue
+
+                    future = pending.pop(message.get("id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_pending(e)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error.
+
+        Args:
+            error: Exception delivered to each waiting request
+        """
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
 
     async def is_healthy(self) -> bool:
         """Check if subprocess is still running.
@@ -239,16 +448,32 @@ class MCPSSEClient(MCPClient):
     Communicates with remote MCP servers over HTTP using Server-Sent Events.
     """
 
-    def __init__(self, config: MCPServerConfig):
+    __slots__ = (
+        "_client", "_url", "_headers", "_shared_client", "_get_headers", "_post_headers"
+    )
+
+    def __init__(self, config: MCPServerConfig, http_client: Optional[httpx.AsyncClient] = None):
         """Initialize SSE client.
 
         Args:
             config: MCP server configuration with HTTP endpoint URL
+            http_client: Pooled client shared with other servers; owned and
+                closed by the caller. A private client is created if omitted.
         """
         super().__init__(config)
         self._client: Optional[httpx.AsyncClient] = None
         self._url = config.command  # URL is stored in command field
         self._headers = config.env.copy()  # Headers from env variables
+        self._shared_client = http_client
+
+        # A private client carries the server headers as defaults; a shared
+        # one serves several servers, so they go on each request instead
+        if http_client is None:
+            self._get_headers: Optional[Dict[str, str]] = None
+            self._post_headers = _JSON_HEADERS
+        else:
+            self._get_headers = self._headers
+            self._post_headers = {**_JSON_HEADERS, **self._headers}
 
     async def connect(self) -> bool:
         """Establish HTTP connection to SSE endpoint.
@@ -261,10 +486,13 @@ class MCPSSEClient(MCPClient):
         """
         try:
             # Create client instance (not using context manager for persistent connection)
-            self._client = httpx.AsyncClient(timeout=30.0)
+            if self._shared_client is not None:
+                self._client = self._shared_client
+            else:
+                self._client = create_http_client(headers=self._headers)
 
             # Test connection with a GET request
-            response = await self._client.get(self._url, headers=self._headers)
+            response = await self._client.get(self._url, headers=self._get_headers)
 
             if not response.is_success:
                 raise MCPConnectionError(
@@ -288,7 +516,9 @@ class MCPSSEClient(MCPClient):
         """Close HTTP connection and cleanup resources."""
         if self._client is not None:
             try:
-                await self._client.aclose()
+                # A shared pool is closed by its owner
+                if self._client is not self._shared_client:
+                    await self._client.aclose()
             except Exception:
                 pass
             finally:
@@ -305,6 +535,57 @@ class MCPSSEClient(MCPClient):
         Returns:
             JSON-RPC response dictionary
 
+        Raises:
+            MCPConnectionError: If not connected
+            MCPTimeoutError: If request times out
+            MCPTransportError: If HTTP error occurs
+        """
+        return await self._post(request, timeout)
+
+    async def send_batch(
+        self, requests: List[Dict[str, Any]], timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """Send JSON-RPC requests as a single batch in one HTTP POST.
+
+        Args:
+            requests: JSON-RPC request dictionaries, each with a unique id
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            JSON-RPC response dictionaries in request order
+
+        Raises:
+            MCPConnectionError: If not connected
+            MCPTimeoutError: If request times out
+            MCPTransportError: If HTTP error occurs or the batch is rejected
+        """
+        if not requests:
+            return []
+
+        body = await self._post(requests, timeout)
+        if not isinstance(body, list):
+            # A single object answers the whole batch, e.g. a parse error
+            raise MCPTransportError(f"Batch rejected: {body!r}")
+
+        responses = {
+            response.get("id"): response for response in body if isinstance(response, dict)
+        }
+        missing = [request.get("id") for request in requests if request.get("id") not in responses]
+        if missing:
+            raise MCPTransportError(f"Batch response missing ids: {missing!r}")
+
+        return [responses[request.get("id")] for request in requests]
+
+    async def _post(self, payload: Any, timeout: float) -> Any:
+        """POST a JSON-RPC payload and decode the response body.
+
+        Args:
+            payload: JSON-RPC request object or batch array
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded JSON response body
+
         Raises:
             MCPConnectionError: If not connected
             MCPTimeoutError: If request times out
@@ -314,17 +595,17 @@ class MCPSSEClient(MCPClient):
             raise MCPConnectionError("Client not connected")
 
         try:
-            response = await asyncio.wait_for(
-                self._client.post(self._url, json=request, headers=self._headers),
-                timeout=timeout,
-            )
+            async with asyncio.timeout(timeout):
+                response = await self._client.post(
+                    self._url, content=json_codec.dumps(payload), headers=self._post_headers
+                )
 
             if not response.is_success:
                 raise MCPTransportError(f"HTTP error: {response.status_code}")
 
-            return response.json()
+            return json_codec.loads(response.content)
 
-        except asyncio.TimeoutError as e:
+        except TimeoutError as e:
             raise MCPTimeoutError(f"Request timed out after {timeout}s") from e
         except httpx.HTTPError as e:
             raise MCPTransportError(f"HTTP error: {str(e)}") from e
@@ -341,9 +622,8 @@ class MCPSSEClient(MCPClient):
             return False
 
         try:
-            response = await asyncio.wait_for(
-                self._client.get(self._url, headers=self._headers), timeout=5.0
-            )
+            async with asyncio.timeout(5.0):
+                response = await self._client.get(self._url, headers=self._get_headers)
             return response.is_success
         except Exception:
             return False
@@ -6,9 +6,13 @@ It provides JSON schema validation, type checking, and default values for MCP se
 import os
 import re
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Alphanumeric (Unicode-aware, matching str.isalnum), hyphens, and underscores
+_SERVER_NAME_PATTERN = re.compile(r"[\w-]+")
 
 
 class TransportType(str, Enum):
@@ -31,6 +35,8 @@ class MCPServerConfig(BaseModel):
         enabled: Whether the server is enabled (default: True)
         transport: Communication transport type (default: stdio)
         description: Human-readable description of the server
+        env_snapshot_at_init: Capture the process environment once when the
+            client is created instead of on every connection attempt
     """
     command: str = Field(
         ...,
@@ -57,6 +63,12 @@ class MCPServerConfig(BaseModel):
         default=None,
         description="Human-readable server description",
     )
+    env_snapshot_at_init: bool = Field(
+        default=True,
+        description="Capture the process environment once at client creation",
+    )
+
+    model_config = ConfigDict(frozen=True)  # Shared by registry, manager, and clients
 
     @field_validator("command")
     @classmethod
@@ -78,6 +90,26 @@ class MCPServersConfig(BaseModel):
         description="MCP server configurations keyed by server name",
     )
 
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "MCPServersConfig":
+        """Parse and validate a configuration document in a single step.
+
+        Uses pydantic's native JSON parser, skipping the intermediate
+        Python dict that json.loads followed by validation would build.
+
+        Args:
+            raw: UTF-8 encoded JSON configuration document
+
+        Returns:
+            Validated MCPServersConfig object
+
+        Raises:
+            ValidationError: If the document is not valid JSON or fails validation
+        """
+        return cls.model_validate_json(raw)
+
     @field_validator("mcpServers")
     @classmethod
     def validate_server_names(cls, v: Dict[str, MCPServerConfig]) -> Dict[str, MCPServerConfig]:
@@ -86,7 +118,7 @@ class MCPServersConfig(BaseModel):
             if not name or not name.strip():
                 raise ValueError("Server name cannot be empty")
             # Check for valid server name (alphanumeric, hyphens, underscores)
-            if not all(c.isalnum() or c in ("-", "_") for c in name):
+            if not _SERVER_NAME_PATTERN.fullmatch(name):
                 raise ValueError(
                     f"Server name '{name}' contains invalid characters. "
                     "Use only alphanumeric characters, hyphens, and underscores."
@@ -94,32 +126,63 @@ class MCPServersConfig(BaseModel):
         return v
 
 
-def _parse_server_env_vars(prefix: str) -> Dict[str, str]:
-    """Parse environment variables for a specific MCP server.
+# Suffixes recognised after MCP_SERVER_N_; anything under ENV_ is passed through
+_SERVER_ENV_FIELDS = ("NAME", "COMMAND", "ARGS", "TRANSPORT", "ENABLED", "DESCRIPTION")
 
-    Extracts MCP_SERVER_N_ENV_* variables and converts them to server env dict.
+
+@lru_cache(maxsize=8)
+def _server_env_pattern(prefix: str) -> "re.Pattern[str]":
+    """Build the pattern matching per-server environment variable names.
+
+    Indices are matched without leading zeros so that MCP_SERVER_01_NAME is
+    not treated as server 1.
 
     Args:
-        prefix: Environment variable prefix (e.g., "MCP_SERVER_1")
+        prefix: Environment variable prefix (e.g., "MCP_SERVER_")
 
     Returns:
-        Dictionary of environment variables for the server
+        Compiled pattern capturing the server index, field, and ENV_ suffix
+    """
+    fields = "|".join(_SERVER_ENV_FIELDS)
+    return re.compile(rf"{re.escape(prefix)}([1-9][0-9]*)_(?:({fields})|ENV_(.*))", re.DOTALL)
+
+
+def _group_server_env_vars(
+    prefix: str, max_count: int
+) -> Dict[int, Tuple[Dict[str, str], Dict[str, str]]]:
+    """Group MCP server environment variables by server index in one scan.
+
+    Args:
+        prefix: Environment variable prefix (e.g., "MCP_SERVER_")
+        max_count: Highest server index to accept
+
+    Returns:
+        Mapping of server index to (fields, server env vars)
 
     Examples:
+        >>> os.environ["MCP_SERVER_1_NAME"] = "filesystem"
         >>> os.environ["MCP_SERVER_1_ENV_API_KEY"] = "secret"
-        >>> _parse_server_env_vars("MCP_SERVER_1")
-        {"API_KEY": "secret"}
+        >>> _group_server_env_vars("MCP_SERVER_", 100)
+        {1: ({"NAME": "filesystem"}, {"API_KEY": "secret"})}
     """
-    env_vars = {}
-    env_prefix = f"{prefix}_ENV_"
+    match = _server_env_pattern(prefix).fullmatch
+    grouped: Dict[int, Tuple[Dict[str, str], Dict[str, str]]] = {}
 
     for key, value in os.environ.items():
-        if key.startswith(env_prefix):
-            # Extract the environment variable name after ENV_
-            env_var_name = key[len(env_prefix):]
-            env_vars[env_var_name] = value
+        m = match(key)
+        if m is None:
+            continue
+        index = int(m.group(1))
+        if index > max_count:
+            continue
+        fields, env_vars = grouped.setdefault(index, ({}, {}))
+        field = m.group(2)
+        if field is not None:
+            fields[field] = value
+        else:
+            env_vars[m.group(3)] = value
 
-    return env_vars
+    return grouped
 
 
 def parse_env_var_servers(prefix: str = "MCP_SERVER_") -> Dict[str, MCPServerConfig]:
@@ -134,7 +197,7 @@ def parse_env_var_servers(prefix: str = "MCP_SERVER_") -> Dict[str, MCPServerCon
     - MCP_SERVER_N_DESCRIPTION: Server description
     - MCP_SERVER_N_ENV_*: Environment variables for the server
 
-    MCP_SERVER_COUNT can be used as an optimization hint to limit iteration.
+    MCP_SERVER_COUNT caps the highest server index considered (default: 100).
 
     Args:
         prefix: Environment variable prefix (default: "MCP_SERVER_")
@@ -151,63 +214,49 @@ def parse_env_var_servers(prefix: str = "MCP_SERVER_") -> Dict[str, MCPServerCon
     """
     servers: Dict[str, MCPServerConfig] = {}
 
-    # Use MCP_SERVER_COUNT as optimization hint if provided
     max_count = int(os.environ.get("MCP_SERVER_COUNT", "100"))
+    grouped = _group_server_env_vars(prefix, max_count)
 
-    # Iterate through potential server indices
-    for i in range(1, max_count + 1):
-        server_prefix = f"{prefix}{i}"
-        name_key = f"{server_prefix}_NAME"
-
-        # Check if this server exists
-        if name_key not in os.environ:
-            # If we have a count hint and haven't found servers in a while, stop
-            if "MCP_SERVER_COUNT" in os.environ and i > int(os.environ["MCP_SERVER_COUNT"]):
-                break
-            continue
-
-        server_name = os.environ[name_key]
-        command_key = f"{server_prefix}_COMMAND"
+    # Later indices win on duplicate names, so materialize in index order
+    for index in sorted(grouped):
+        fields, env_vars = grouped[index]
 
-        # Command is required
-        if command_key not in os.environ:
+        # Name and command are required
+        server_name = fields.get("NAME")
+        command = fields.get("COMMAND")
+        if server_name is None or command is None:
             continue
 
-        command = os.environ[command_key]
-
         # Parse optional fields
-        args_key = f"{server_prefix}_ARGS"
         args = []
-        if args_key in os.environ:
+        args_value = fields.get("ARGS")
+        if args_value is not None:
             # Split comma-separated args
-            args = [arg.strip() for arg in os.environ[args_key].split(",") if arg.strip()]
+            args = [arg.strip() for arg in args_value.split(",") if arg.strip()]
 
-        transport_key = f"{server_prefix}_TRANSPORT"
         transport = TransportType.STDIO
-        if transport_key in os.environ:
-            transport_value = os.environ[transport_key].lower()
-            if transport_value == "sse":
-                transport = TransportType.SSE
+        transport_value = fields.get("TRANSPORT")
+        if transport_value is not None and transport_value.lower() == "sse":
+            transport = TransportType.SSE
 
-        enabled_key = f"{server_prefix}_ENABLED"
         enabled = True
-        if enabled_key in os.environ:
-            enabled = os.environ[enabled_key].lower() in ("true", "1", "yes")
-
-        description_key = f"{server_prefix}_DESCRIPTION"
-        description = os.environ.get(description_key, None)
-
-        # Parse server environment variables
-        env_vars = _parse_server_env_vars(server_prefix)
-
-        # Create server configuration
-        server_config = MCPServerConfig(
-            command=command,
-            args=args,
-            env=env_vars,
-            enabled=enabled,
-            transport=transport,
-            description=description,
+        enabled_value = fields.get("ENABLED")
+        if enabled_value is not None:
+            enabled = enabled_value.lower() in ("true", "1", "yes")
+
+        description = fields.get("DESCRIPTION")
+
+        # Values are already typed here, so validate strictly and skip coercion
+        server_config = MCPServerConfig.model_validate(
+            {
+                "command": command.strip(),
+                "args": args,
+                "env": env_vars,
+                "enabled": enabled,
+                "transport": transport,
+                "description": description,
+            },
+            strict=True,
         )
 
         servers[server_name] = server_config
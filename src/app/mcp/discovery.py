@@ -2,6 +2,8 @@
 
 This module provides functions for discovering tools from MCP servers via JSON-RPC.
 """
+import asyncio
+from typing import Optional
 
 from app.mcp.client import MCPClient
 from app.mcp.exceptions import MCPConnectionError, MCPTimeoutError, MCPTransportError
@@ -9,6 +11,37 @@ from app.mcp.manager import MCPConnectionManager
 from app.mcp.tool_schema import MCPToolSchema
 
 
+def _tool_from_data(tool_data: dict, _schema_cls: type = MCPToolSchema) -> MCPToolSchema:
+    """Build a tool schema from one entry of a 'tools/list' result.
+
+    Args:
+        tool_data: Tool description as returned by the server
+        _schema_cls: Bound as a default so the lookup is local, not global
+
+    Returns:
+        Tool schema for the entry
+
+    Raises:
+        ValueError: If the entry has no 'name' field
+    """
+    # Validate required fields
+    name = tool_data.get("name")
+    if name is None:
+        raise ValueError("Tool missing required 'name' field")
+
+    # MCP spec uses 'inputSchema', convert to our format. The default is built
+    # per tool because schemas are mutable and must not be shared.
+    input_schema = tool_data.get("inputSchema")
+    if input_schema is None:
+        input_schema = {"type": "object", "properties": {}}
+
+    return _schema_cls(
+        name=name,
+        description=tool_data.get("description", ""),
+        input_schema=input_schema,
+    )
+
+
 async def discover_tools(client: MCPClient) -> list[MCPToolSchema]:
     """Discover tools from an MCP server.
 
@@ -30,39 +63,45 @@ async def discover_tools(client: MCPClient) -> list[MCPToolSchema]:
     # Prepare JSON-RPC request
     request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1, "params": {}}
 
-    # Send request and get response
-    try:
-        response = await client.send_request(request)
-    except (MCPConnectionError, MCPTimeoutError, MCPTransportError):
-        # Re-raise MCP exceptions
-        raise
+    # Send request and get response; MCP exceptions propagate to the caller
+    response = await client.send_request(request)
 
     # Parse response
-    if "result" not in response:
+    result = response.get("result")
+    if result is None:
         return []
 
-    result = response["result"]
-    if "tools" not in result:
+    tool_list = result.get("tools")
+    if tool_list is None:
         return []
 
     # Convert tools to MCPToolSchema objects
-    tools = []
-    for tool_data in result["tools"]:
-        # Validate required fields
-        if "name" not in tool_data:
-            raise ValueError("Tool missing required 'name' field")
+    return [_tool_from_data(tool_data) for tool_data in tool_list]
 
-        # MCP spec uses 'inputSchema', convert to our format
-        input_schema = tool_data.get("inputSchema", {"type": "object", "properties": {}})
 
-        tool = MCPToolSchema(
-            name=tool_data["name"],
-            description=tool_data.get("description", ""),
-            input_schema=input_schema,
-        )
-        tools.append(tool)
+async def _discover_server_tools(
+    manager: MCPConnectionManager, server_name: str
+) -> Optional[list[MCPToolSchema]]:
+    """Discover tools from one managed server, treating MCP errors as absent.
 
-    return tools
+    Args:
+        manager: MCP connection manager owning the server
+        server_name: Name of the server to query
+
+    Returns:
+        Discovered tools, or None if the server is unavailable or failed
+    """
+    try:
+        # Get client for this server (async operation)
+        client = await manager.get_client(server_name)
+        if client is None:
+            return None
+
+        return await discover_tools(client)
+
+    except (MCPConnectionError, MCPTimeoutError, MCPTransportError):
+        # Skip servers with errors
+        return None
 
 
 async def discover_tools_from_manager(
@@ -70,6 +109,9 @@ async def discover_tools_from_manager(
 ) -> dict[str, list[MCPToolSchema]]:
     """Discover tools from all servers managed by a connection manager.
 
+    Servers are queried concurrently, so discovery takes as long as the
+    slowest server rather than the sum of all round-trips.
+
     Args:
         manager: MCP connection manager with active servers
 
@@ -77,25 +119,21 @@ async def discover_tools_from_manager(
         Dictionary mapping server names to their tool lists.
         Servers with errors are omitted from the results.
     """
-    result: dict[str, list[MCPToolSchema]] = {}
-
     # Get list of all servers
     server_names = manager.list_servers()
 
-    # Discover tools from each server
-    for server_name in server_names:
-        try:
-            # Get client for this server (async operation)
-            client = await manager.get_client(server_name)
-            if client is None:
-                continue
-
-            # Discover tools
-            tools = await discover_tools(client)
-            result[server_name] = tools
-
-        except (MCPConnectionError, MCPTimeoutError, MCPTransportError):
-            # Skip servers with errors
-            continue
+    # Let every query finish before surfacing unexpected errors, so no
+    # task is left running with an unretrieved exception
+    outcomes = await asyncio.gather(
+        *(_discover_server_tools(manager, name) for name in server_names),
+        return_exceptions=True,
+    )
+
+    result: dict[str, list[MCPToolSchema]] = {}
+    for server_name, outcome in zip(server_names, outcomes):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome is not None:
+            result[server_name] = outcome
 
     return result
@@ -3,19 +3,34 @@
 This module provides a factory for creating the appropriate MCP client
 based on the configured transport type (STDIO or SSE).
 """
+from typing import Callable, Optional
+
+import httpx
+
 from app.mcp.client import MCPClient, MCPSSEClient, MCPSTDIOClient
 from app.mcp.config import MCPServerConfig, TransportType
 
+# Client constructor for each transport; add an entry to support a new one
+_CLIENT_BUILDERS: dict[
+    TransportType, Callable[[MCPServerConfig, Optional[httpx.AsyncClient]], MCPClient]
+] = {
+    TransportType.STDIO: lambda config, http_client: MCPSTDIOClient(config),
+    TransportType.SSE: lambda config, http_client: MCPSSEClient(config, http_client=http_client),
+}
+
 
 class MCPClientFactory:
     """Factory for creating MCP clients based on transport type."""
 
     @staticmethod
-    def create_client(config: MCPServerConfig) -> MCPClient:
+    def create_client(
+        config: MCPServerConfig, http_client: Optional[httpx.AsyncClient] = None
+    ) -> MCPClient:
         """Create an MCP client instance based on the configured transport.
 
         Args:
             config: MCP server configuration specifying transport type
+            http_client: Shared HTTP connection pool for SSE clients
 
         Returns:
             Appropriate MCPClient instance (MCPSTDIOClient or MCPSSEClient)
@@ -23,9 +38,7 @@ class MCPClientFactory:
         Raises:
             ValueError: If transport type is not supported
         """
-        if config.transport == TransportType.STDIO:
-            return MCPSTDIOClient(config)
-        elif config.transport == TransportType.SSE:
-            return MCPSSEClient(config)
-        else:
+        builder = _CLIENT_BUILDERS.get(config.transport)
+        if builder is None:
             raise ValueError(f"Unsupported transport type: {config.transport}")
+        return builder(config, http_client)
@@ -13,16 +13,38 @@ from typing import Dict, Any, Optional
 from pydantic import ValidationError
 
 from app.mcp.config import MCPServersConfig, MCPServerConfig, parse_env_var_servers
+from app.utils import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Configuration files without this marker need no environment substitution
+_ENV_VAR_MARKER = b"${"
+
+# Matches ${VAR_NAME} references
+_ENV_VAR_PATTERN = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
 
 class MCPConfigError(Exception):
     """Exception raised for MCP configuration errors."""
     pass
 
 
-def substitute_env_vars(value: str) -> str:
+def _missing_env_var_error(var_name: str) -> MCPConfigError:
+    """Build the error raised for an unset environment variable.
+
+    Args:
+        var_name: Name of the referenced variable
+
+    Returns:
+        MCPConfigError naming the missing variable
+    """
+    return MCPConfigError(
+        f"Environment variable '{var_name}' not found. "
+        f"Please set it before loading the configuration."
+    )
+
+
+def substitute_env_vars(value: str, env_map: Optional[Dict[str, str]] = None) -> str:
     """Substitute environment variables in a string value.
 
     Environment variables are specified using ${VAR_NAME} syntax.
@@ -30,6 +52,8 @@ def substitute_env_vars(value: str) -> str:
 
     Args:
         value: String potentially containing environment variable references
+        env_map: Optional memo of variable values; consulted before os.environ
+            and filled with each variable looked up there
 
     Returns:
         String with environment variables substituted
@@ -44,46 +68,112 @@ def substitute_env_vars(value: str) -> str:
         >>> substitute_env_vars('https://${HOST}/api')
         'https://localhost/api'
     """
-    # Pattern to match ${VAR_NAME}
-    pattern = r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}'
+    # Most literal config strings reference nothing; skip the regex engine
+    if "${" not in value:
+        return value
 
     def replace_var(match: re.Match) -> str:
         var_name = match.group(1)
-        if var_name not in os.environ:
-            raise MCPConfigError(
-                f"Environment variable '{var_name}' not found. "
-                f"Please set it before loading the configuration."
-            )
-        return os.environ[var_name]
+        if env_map is not None and var_name in env_map:
+            return env_map[var_name]
+        resolved = os.environ.get(var_name)
+        if resolved is None:
+            raise _missing_env_var_error(var_name)
+        if env_map is not None:
+            env_map[var_name] = resolved
+        return resolved
+
+    return _ENV_VAR_PATTERN.sub(replace_var, value)
 
-    return re.sub(pattern, replace_var, value)
 
+def _substitute_env_inplace(data: Dict[str, Any], env_map: Dict[str, str]) -> None:
+    """Recursively substitute environment variables in dictionary values in place.
 
-def _substitute_env_in_dict(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively substitute environment variables in dictionary values.
+    Only strings that reference a variable are replaced, so the parsed
+    document is never copied.
 
     Args:
         data: Dictionary potentially containing environment variable references
-
-    Returns:
-        Dictionary with environment variables substituted
+        env_map: Memo of variable values resolved so far during this load
     """
-    result: Dict[str, Any] = {}
     for key, value in data.items():
         if isinstance(value, str):
-            result[key] = substitute_env_vars(value)
+            if "${" in value:
+                data[key] = substitute_env_vars(value, env_map)
         elif isinstance(value, dict):
             # Recursive substitution for nested dictionaries
-            result[key] = _substitute_env_in_dict(value)
+            _substitute_env_inplace(value, env_map)
         elif isinstance(value, list):
-            # Handle list items, preserving type safety
-            result[key] = [
-                substitute_env_vars(item) if isinstance(item, str) else item
-                for item in value
-            ]
-        else:
-            result[key] = value
-    return result
+            # Handle string list items, leaving other types untouched
+            for index, item in enumerate(value):
+                if isinstance(item, str) and "${" in item:
+                    value[index] = substitute_env_vars(item, env_map)
+
+
+def _validation_error(config_path: str, error: ValidationError) -> MCPConfigError:
+    """Build a readable configuration error from a pydantic ValidationError.
+
+    Args:
+        config_path: Path of the configuration file being validated
+        error: Validation error raised by pydantic
+
+    Returns:
+        MCPConfigError listing each failing location
+    """
+    error_details = []
+    for detail in error.errors():
+        location = " -> ".join(str(loc) for loc in detail['loc'])
+        error_details.append(f"{location}: {detail['msg']}")
+
+    return MCPConfigError(
+        f"JSON configuration validation failed for '{config_path}':\n" +
+        "\n".join(f"  - {detail}" for detail in error_details)
+    )
+
+
+def _load_substituted_servers(raw_bytes: bytes, config_path: str) -> Dict[str, MCPServerConfig]:
+    """Parse a configuration document that references environment variables.
+
+    Args:
+        raw_bytes: UTF-8 encoded JSON configuration document
+        config_path: Path of the configuration file, used in error messages
+
+    Returns:
+        Validated server configurations from the document
+
+    Raises:
+        MCPConfigError: If the document is invalid or references missing variables
+    """
+    try:
+        raw_data = json_codec.loads(raw_bytes)
+    except json.JSONDecodeError as e:
+        raise MCPConfigError(
+            f"Invalid JSON in configuration file '{config_path}': {str(e)}"
+        )
+
+    # Substitute environment variables in JSON, resolving each variable once
+    try:
+        _substitute_env_inplace(raw_data, {})
+    except MCPConfigError:
+        # Re-raise environment variable errors
+        raise
+    except Exception as e:
+        raise MCPConfigError(
+            f"Error processing configuration file '{config_path}': {str(e)}"
+        )
+
+    # Extract servers from JSON
+    if "mcpServers" not in raw_data:
+        return {}
+
+    try:
+        # Validate JSON servers
+        json_servers = MCPServersConfig(**raw_data).mcpServers
+    except ValidationError as e:
+        raise _validation_error(config_path, e)
+
+    logger.info(f"Loaded {len(json_servers)} server(s) from JSON configuration")
+    return json_servers
 
 
 def load_mcp_config(config_path: str = "mcp_servers.json") -> MCPServersConfig:
@@ -128,47 +218,27 @@ def load_mcp_config(config_path: str = "mcp_servers.json") -> MCPServersConfig:
     if config_file.exists():
         logger.info(f"Loading MCP configuration from JSON file: {config_path}")
 
-        # Read and parse JSON
+        # Read raw configuration
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise MCPConfigError(
-                f"Invalid JSON in configuration file '{config_path}': {str(e)}"
-            )
+            raw_bytes = config_file.read_bytes()
         except IOError as e:
             raise MCPConfigError(
                 f"Error reading configuration file '{config_path}': {str(e)}"
             )
 
-        # Substitute environment variables in JSON
-        try:
-            processed_data = _substitute_env_in_dict(raw_data)
-        except MCPConfigError:
-            # Re-raise environment variable errors
-            raise
-        except Exception as e:
-            raise MCPConfigError(
-                f"Error processing configuration file '{config_path}': {str(e)}"
-            )
-
-        # Extract servers from JSON
-        if "mcpServers" in processed_data:
+        if _ENV_VAR_MARKER not in raw_bytes:
+            # Nothing to substitute, so parse and validate in one pass
             try:
-                # Validate JSON servers
-                json_config = MCPServersConfig(**processed_data)
-                json_servers = json_config.mcpServers
-                logger.info(f"Loaded {len(json_servers)} server(s) from JSON configuration")
+                json_servers = MCPServersConfig.from_json_bytes(raw_bytes).mcpServers
             except ValidationError as e:
-                error_details = []
-                for error in e.errors():
-                    location = " -> ".join(str(loc) for loc in error['loc'])
-                    error_details.append(f"{location}: {error['msg']}")
-
-                raise MCPConfigError(
-                    f"JSON configuration validation failed for '{config_path}':\n" +
-                    "\n".join(f"  - {detail}" for detail in error_details)
-                )
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise MCPConfigError(
+                        f"Invalid JSON in configuration file '{config_path}': {str(e)}"
+                    )
+                raise _validation_error(config_path, e)
+            logger.info(f"Loaded {len(json_servers)} server(s) from JSON configuration")
+        else:
+            json_servers = _load_substituted_servers(raw_bytes, config_path)
     else:
         logger.info(f"JSON configuration file not found: {config_path}, checking environment variables")
 
@@ -9,24 +9,75 @@ This module provides a connection manager that handles:
 import asyncio
 import logging
 import random
-from typing import Dict, Optional
+import time
+from typing import Any, Awaitable, Dict, Optional
 
-from app.mcp.client import MCPClient
-from app.mcp.config import MCPServerConfig, MCPServersConfig
+import httpx
+
+from app.mcp.client import SHARED_SSE_CONNECTION_LIMITS, MCPClient, create_http_client
+from app.mcp.config import MCPServerConfig, MCPServersConfig, TransportType
 from app.mcp.exceptions import MCPConnectionError
 from app.mcp.factory import MCPClientFactory
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on servers connecting at once, so a large config does not spawn
+# every subprocess or open every socket in the same instant
+DEFAULT_CONNECT_CONCURRENCY = 16
+
+
+async def _settle(awaitable: Awaitable[Any]) -> Any:
+    """Await a fan-out branch, returning its exception instead of raising it.
+
+    A failing branch inside an asyncio.TaskGroup would cancel its siblings;
+    settling each branch keeps one server's failure from affecting the rest.
+
+    Args:
+        awaitable: Branch to run
+
+    Returns:
+        The branch result, or the Exception it raised
+    """
+    try:
+        return await awaitable
+    except Exception as e:
+        return e
+
 
 class MCPConnectionManager:
     """Manages connections to multiple MCP servers with pooling and lifecycle management."""
 
-    def __init__(self):
-        """Initialize the connection manager."""
+    def __init__(self, connect_concurrency: int = DEFAULT_CONNECT_CONCURRENCY):
+        """Initialize the connection manager.
+
+        Args:
+            connect_concurrency: Maximum number of servers connect_all_enabled
+                connects at the same time
+
+        Raises:
+            ValueError: If connect_concurrency is less than 1
+        """
+        if connect_concurrency < 1:
+            raise ValueError("connect_concurrency must be at least 1")
+
         self._config: Optional[MCPServersConfig] = None
         self._clients: Dict[str, MCPClient] = {}
         self._server_configs: Dict[str, MCPServerConfig] = {}
+        # One keep-alive pool for all SSE servers, created on first use
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Private generator so backoff jitter never touches the global random state
+        self._rng = random.Random()
+        self._connect_sem = asyncio.Semaphore(connect_concurrency)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP connection pool shared by SSE servers.
+
+        Returns:
+            Shared httpx.AsyncClient, created on first call
+        """
+        if self._http_client is None:
+            self._http_client = create_http_client(limits=SHARED_SSE_CONNECTION_LIMITS)
+        return self._http_client
 
     async def initialize(self, config: MCPServersConfig) -> None:
         """Initialize manager with server configurations.
@@ -60,36 +111,84 @@ class MCPConnectionManager:
             raise MCPConnectionError(f"Server '{server_name}' is disabled")
 
         # Create client using factory
-        client = MCPClientFactory.create_client(config)
+        http_client = self._get_http_client() if config.transport == TransportType.SSE else None
+        client = MCPClientFactory.create_client(config, http_client=http_client)
 
-        # Retry with exponential backoff
+        # Retry with exponential backoff. Per-attempt detail is debug-only; a
+        # single summary line is logged once the outcome is known.
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        started = time.perf_counter()
         last_error = None
         for attempt in range(max_retries):
             try:
-                logger.info(f"Connecting to '{server_name}' (attempt {attempt + 1}/{max_retries})")
+                if verbose:
+                    logger.debug(
+                        "Connecting to '%s' (attempt %d/%d)", server_name, attempt + 1, max_retries
+                    )
                 result = await client.connect()
 
                 if result:
                     self._clients[server_name] = client
-                    logger.info(f"Successfully connected to '{server_name}'")
+                    logger.info(
+                        "Connected to '%s' after %d attempt(s) in %.2fs",
+                        server_name,
+                        attempt + 1,
+                        time.perf_counter() - started,
+                        extra={
+                            "custom_dimensions": {
+                                "server_name": server_name,
+                                "attempts": attempt + 1,
+                                "connected": True,
+                            }
+                        },
+                    )
                     return True
 
             except MCPConnectionError as e:
                 last_error = e
-                logger.warning(f"Connection attempt {attempt + 1} failed for '{server_name}': {e}")
+                if verbose:
+                    logger.debug(
+                        "Connection attempt %d failed for '%s': %s", attempt + 1, server_name, e
+                    )
 
                 if attempt < max_retries - 1:
                     # Calculate backoff delay
                     delay = self._calculate_backoff(attempt)
-                    logger.info(f"Retrying in {delay}s...")
+                    if verbose:
+                        logger.debug("Retrying '%s' in %.2fs", server_name, delay)
                     await asyncio.sleep(delay)
 
         # All retries exhausted
+        logger.warning(
+            "Failed to connect to '%s' after %d attempt(s) in %.2fs",
+            server_name,
+            max_retries,
+            time.perf_counter() - started,
+            extra={
+                "custom_dimensions": {
+                    "server_name": server_name,
+                    "attempts": max_retries,
+                    "connected": False,
+                }
+            },
+        )
         error_msg = f"Failed to connect to '{server_name}' after {max_retries} attempts"
         if last_error:
             error_msg += f": {last_error}"
         raise MCPConnectionError(error_msg)
 
+    async def _connect_server_bounded(self, server_name: str) -> bool:
+        """Connect to a server once a connection slot is free.
+
+        Args:
+            server_name: Name of the server to connect to
+
+        Returns:
+            True if connection successful
+        """
+        async with self._connect_sem:
+            return await self.connect_server(server_name)
+
     async def disconnect_server(self, server_name: str) -> None:
         """Disconnect from a specific MCP server.
 
@@ -148,26 +247,29 @@ class MCPConnectionManager:
     async def connect_all_enabled(self) -> Dict[str, bool]:
         """Connect to all enabled servers in parallel.
 
+        At most ``connect_concurrency`` servers are connecting at any moment;
+        the rest wait for a slot.
+
         Returns:
             Dictionary mapping server names to connection results (True=success, False=failure)
         """
         results = {}
 
-        # Create connection tasks for all enabled servers
-        tasks = []
-        server_names = []
-
-        for server_name, config in self._server_configs.items():
-            if config.enabled:
-                tasks.append(self.connect_server(server_name))
-                server_names.append(server_name)
+        server_names = [
+            server_name for server_name, config in self._server_configs.items() if config.enabled
+        ]
 
         # Execute all connections in parallel
-        if tasks:
-            task_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for server_name, result in zip(server_names, task_results):
-                # Type narrowing: result can be bool or BaseException
+        if server_names:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_settle(self._connect_server_bounded(server_name)))
+                    for server_name in server_names
+                ]
+
+            for server_name, task in zip(server_names, tasks):
+                result = task.result()
+                # Type narrowing: result can be bool or Exception
                 if isinstance(result, Exception):
                     logger.error(f"Failed to connect to '{server_name}': {result}")
                     results[server_name] = False
@@ -187,15 +289,19 @@ class MCPConnectionManager:
         """
         logger.info("Shutting down MCP connection manager...")
 
-        # Disconnect all clients
-        disconnect_tasks = []
-        for server_name in list(self._clients.keys()):
-            disconnect_tasks.append(self.disconnect_server(server_name))
-
-        if disconnect_tasks:
-            await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+        # Disconnect all clients concurrently, then drop them in one step
+        clients = list(self._clients.values())
+        if clients:
+            async with asyncio.TaskGroup() as tg:
+                for client in clients:
+                    tg.create_task(_settle(client.disconnect()))
 
         self._clients.clear()
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
         logger.info("MCP connection manager shutdown complete")
 
     async def get_server_status(self) -> Dict[str, Dict[str, bool]]:
@@ -241,7 +347,7 @@ class MCPConnectionManager:
 
         if jitter:
             # Add random jitter (0-50% of delay)
-            jitter_amount = delay * random.uniform(0, 0.5)
+            jitter_amount = delay * 0.5 * self._rng.random()
             delay += jitter_amount
 
         return delay
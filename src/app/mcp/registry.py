@@ -9,17 +9,48 @@ from typing import Optional
 from app.mcp.tool_schema import MCPToolSchema
 
 
+def _drop_from_index(
+    by_server: dict[str, tuple[MCPToolSchema, ...]],
+    server_name: str,
+    tool: MCPToolSchema,
+) -> None:
+    """Remove a tool from a per-server index, dropping the server when empty.
+
+    Args:
+        by_server: Index being rebuilt by a writer (not yet published)
+        server_name: Server the tool was registered under
+        tool: Tool instance to remove
+    """
+    remaining = tuple(entry for entry in by_server.get(server_name, ()) if entry is not tool)
+    if remaining:
+        by_server[server_name] = remaining
+    else:
+        by_server.pop(server_name, None)
+
+
 class MCPToolRegistry:
     """Thread-safe registry for MCP tools.
 
     Stores tools with metadata and handles name conflicts by prefixing with server name.
-    All operations are thread-safe using a lock.
+    Writers serialize on a lock and publish a new dict (copy-on-write), so
+    readers never take the lock and always see a consistent snapshot.
     """
 
     def __init__(self):
         """Initialize an empty tool registry."""
         self._tools: dict[str, MCPToolSchema] = {}
+        # Per-server index in registration order, published alongside _tools
+        self._by_server: dict[str, tuple[MCPToolSchema, ...]] = {}
         self._lock = threading.Lock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the set of registered tools changes.
+
+        Lets callers cache values derived from the registry contents.
+        """
+        return self._version
 
     def register_tool(self, server_name: str, tool: MCPToolSchema) -> str:
         """Register a tool in the registry.
@@ -37,13 +68,30 @@ class MCPToolRegistry:
         with self._lock:
             # Construct full name with server prefix
             full_name = f"{server_name}.{tool.name}"
+            previous = self._tools.get(full_name)
+            previous_server = previous.server_name if previous is not None else None
 
             # Set metadata on tool
             tool.server_name = server_name
             tool.full_name = full_name
 
-            # Store in registry
-            self._tools[full_name] = tool
+            # Publish updated copies so lock-free readers never see a partial write
+            tools = dict(self._tools)
+            tools[full_name] = tool
+            by_server = dict(self._by_server)
+            if previous is not None and previous_server == server_name:
+                # Replacement keeps the tool's position in its server listing
+                by_server[server_name] = tuple(
+                    tool if entry is previous else entry for entry in by_server[server_name]
+                )
+            else:
+                if previous is not None:
+                    _drop_from_index(by_server, previous_server, previous)
+                by_server[server_name] = by_server.get(server_name, ()) + (tool,)
+
+            self._tools = tools
+            self._by_server = by_server
+            self._version += 1
 
             return full_name
 
@@ -56,8 +104,7 @@ class MCPToolRegistry:
         Returns:
             Tool schema if found, None otherwise
         """
-        with self._lock:
-            return self._tools.get(full_name)
+        return self._tools.get(full_name)
 
     def list_tools(self, server_name: Optional[str] = None) -> list[MCPToolSchema]:
         """List all registered tools, optionally filtered by server.
@@ -68,17 +115,12 @@ class MCPToolRegistry:
         Returns:
             List of tool schemas (independent copy)
         """
-        with self._lock:
-            if server_name is None:
-                # Return all tools
-                return list(self._tools.values())
-            else:
-                # Filter by server name
-                return [
-                    tool
-                    for tool in self._tools.values()
-                    if tool.server_name == server_name
-                ]
+        if server_name is None:
+            # Return all tools
+            return list(self._tools.values())
+        else:
+            # Served from the per-server index
+            return list(self._by_server.get(server_name, ()))
 
     def remove_tool(self, full_name: str) -> bool:
         """Remove a tool from the registry.
@@ -91,14 +133,22 @@ class MCPToolRegistry:
         """
         with self._lock:
             if full_name in self._tools:
-                del self._tools[full_name]
+                tools = dict(self._tools)
+                removed = tools.pop(full_name)
+                by_server = dict(self._by_server)
+                _drop_from_index(by_server, removed.server_name, removed)
+                self._tools = tools
+                self._by_server = by_server
+                self._version += 1
                 return True
             return False
 
     def clear(self) -> None:
         """Clear all tools from the registry."""
         with self._lock:
-            self._tools.clear()
+            self._tools = {}
+            self._by_server = {}
+            self._version += 1
 
     def get_tool_count(self) -> int:
         """Get the total number of registered tools.
@@ -106,5 +156,4 @@ class MCPToolRegistry:
         Returns:
             Number of tools in the registry
         """
-        with self._lock:
-            return len(self._tools)
+        return len(self._tools)
@@ -4,10 +4,12 @@ This module provides example integrations for common MCP servers:
 - Filesystem server for file operations
 - Web search server for internet search capabilities
 """
-from app.mcp.servers.filesystem import FilesystemServerHelper
+from app.mcp.servers.filesystem import DirectoryCheck, DirectoryStatus, FilesystemServerHelper
 from app.mcp.servers.web_search import WebSearchServerHelper
 
 __all__ = [
+    "DirectoryCheck",
+    "DirectoryStatus",
     "FilesystemServerHelper",
     "WebSearchServerHelper",
 ]
@@ -6,14 +6,106 @@ This module provides utilities for configuring and validating the
 The filesystem server allows agents to read, write, and search files
 within configured directories using STDIO transport.
 """
+import enum
 import logging
-from pathlib import Path
-from typing import Optional
+import os
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from app.mcp.config import MCPServerConfig, TransportType
 
 logger = logging.getLogger(__name__)
 
+# System directories that must never be exposed, and prefixes matching anything
+# beneath them; str.startswith accepts the whole tuple in one call
+_DANGEROUS_PATHS = frozenset({"/", "/etc", "/usr", "/bin", "/sbin", "/sys", "/proc", "/dev"})
+_DANGEROUS_PREFIXES = tuple(dp + "/" for dp in _DANGEROUS_PATHS)
+
+# Static reference data, built once at import and shared read-only
+_AVAILABLE_TOOLS: tuple[str, ...] = (
+    "read_file",       # Read file contents
+    "write_file",      # Write content to file
+    "list_directory",  # List directory contents
+    "create_directory",  # Create a directory
+    "move_file",       # Move/rename file
+    "search_files",    # Search for files by pattern
+)
+
+_SECURITY_RECOMMENDATIONS = MappingProxyType({
+    "directory_permissions": (
+        "Use most restrictive permissions possible",
+        "Prefer read-only access when write is not needed",
+        "Create dedicated directories for agent file access",
+        "Never grant access to system directories",
+    ),
+    "path_configuration": (
+        "Always use absolute paths",
+        "Use environment variables for user-specific paths",
+        "Document all allowed directories in deployment docs",
+        "Audit allowed directories regularly",
+    ),
+    "container_deployment": (
+        "Mount only necessary volumes in container",
+        "Use read-only mounts where possible",
+        "Implement file size limits",
+        "Monitor file system usage and quotas",
+    ),
+    "monitoring": (
+        "Log all file operations via Application Insights",
+        "Set up alerts for unusual file access patterns",
+        "Track file operation success/failure rates",
+        "Monitor disk usage trends",
+    ),
+})
+
+
+class DirectoryStatus(enum.IntEnum):
+    """Outcome of FilesystemServerHelper.check_directory."""
+
+    OK = 0
+    NOT_ABSOLUTE = 1
+    SYSTEM_DIRECTORY = 2
+    NOT_DIRECTORY = 3
+    NOT_READABLE = 4
+    MISSING = 5  # Allowed: the directory can be created later
+
+
+# Statuses that still permit using the directory
+_USABLE_STATUSES = frozenset({DirectoryStatus.OK, DirectoryStatus.MISSING})
+
+_STATUS_MESSAGES = MappingProxyType({
+    DirectoryStatus.OK: "Directory is valid and accessible: {}",
+    DirectoryStatus.NOT_ABSOLUTE: "Path must be absolute: {}",
+    DirectoryStatus.SYSTEM_DIRECTORY: "Cannot grant access to system directory: {}",
+    DirectoryStatus.NOT_DIRECTORY: "Path is not a directory: {}",
+    DirectoryStatus.NOT_READABLE: "Directory is not readable: {}",
+    DirectoryStatus.MISSING: "Directory does not exist (will be created if needed): {}",
+})
+
+
+@dataclass(slots=True, frozen=True)
+class DirectoryCheck:
+    """Result of validating a directory for filesystem server access.
+
+    Attributes:
+        status: Outcome of the validation
+        directory: Directory path as given by the caller
+    """
+
+    status: DirectoryStatus
+    directory: str
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the directory is safe to use."""
+        return self.status in _USABLE_STATUSES
+
+    @property
+    def message(self) -> str:
+        """Human-readable validation result, formatted on access."""
+        return _STATUS_MESSAGES[self.status].format(self.directory)
 
 class FilesystemServerHelper:
     """Helper for filesystem MCP server configuration and validation.
@@ -76,12 +168,14 @@ class FilesystemServerHelper:
             >>> config.args
             ['-y', '@modelcontextprotocol/server-filesystem', '/home/user/documents']
         """
-        # Validate path
-        path = Path(allowed_directory)
-        if not path.is_absolute():
+        if not os.path.isabs(allowed_directory):
             raise ValueError(
                 f"Allowed directory must be an absolute path, got: {allowed_directory}"
             )
+        # Drop redundant separators and "." components only; ".." is kept as
+        # given, since collapsing it lexically can change the sandbox root
+        # when a component is a symlink
+        path = str(PurePath(allowed_directory))
 
         # Build configuration
         return MCPServerConfig(
@@ -89,7 +183,7 @@ class FilesystemServerHelper:
             args=[
                 "-y",  # Yes to package install prompts
                 FilesystemServerHelper.SERVER_PACKAGE,
-                str(path),
+                path,
             ],
             transport=TransportType.STDIO,
             enabled=enabled,
@@ -97,7 +191,7 @@ class FilesystemServerHelper:
         )
 
     @staticmethod
-    def validate_directory(directory: str) -> tuple[bool, str]:
+    def check_directory(directory: str) -> "DirectoryCheck":
         """Validate that a directory is safe for filesystem server access.
 
         Security checks:
@@ -110,89 +204,72 @@ class FilesystemServerHelper:
             directory: Directory path to validate
 
         Returns:
-            Tuple of (is_valid, message)
-            - is_valid: True if directory is safe to use
-            - message: Validation result message
+            DirectoryCheck with a status callers can branch on; the message is
+            only formatted when it is read
         """
         path = Path(directory)
 
         # Check absolute path
         if not path.is_absolute():
-            return False, f"Path must be absolute: {directory}"
+            return DirectoryCheck(DirectoryStatus.NOT_ABSOLUTE, directory)
 
         # Check for dangerous system directories
-        dangerous_paths = {"/", "/etc", "/usr", "/bin", "/sbin", "/sys", "/proc", "/dev"}
-        if str(path) in dangerous_paths or any(
-            str(path).startswith(dp + "/") for dp in dangerous_paths
-        ):
-            return False, f"Cannot grant access to system directory: {directory}"
+        path_str = str(path)
+        if path_str in _DANGEROUS_PATHS or path_str.startswith(_DANGEROUS_PREFIXES):
+            return DirectoryCheck(DirectoryStatus.SYSTEM_DIRECTORY, directory)
 
         # Check if directory exists
         if not path.exists():
-            return True, f"Directory does not exist (will be created if needed): {directory}"
+            return DirectoryCheck(DirectoryStatus.MISSING, directory)
 
         if not path.is_dir():
-            return False, f"Path is not a directory: {directory}"
+            return DirectoryCheck(DirectoryStatus.NOT_DIRECTORY, directory)
 
         # Check readability
         try:
-            # Attempt to list directory
-            list(path.iterdir())
+            # Opening the directory is enough to prove it is readable
+            with os.scandir(path):
+                pass
         except PermissionError:
-            return False, f"Directory is not readable: {directory}"
+            return DirectoryCheck(DirectoryStatus.NOT_READABLE, directory)
 
-        return True, f"Directory is valid and accessible: {directory}"
+        return DirectoryCheck(DirectoryStatus.OK, directory)
 
     @staticmethod
-    def get_available_tools() -> list[str]:
+    def validate_directory(directory: str) -> tuple[bool, str]:
+        """Validate that a directory is safe for filesystem server access.
+
+        See check_directory for the checks performed.
+
+        Args:
+            directory: Directory path to validate
+
+        Returns:
+            Tuple of (is_valid, message)
+            - is_valid: True if directory is safe to use
+            - message: Validation result message
+        """
+        result = FilesystemServerHelper.check_directory(directory)
+        return result.is_valid, result.message
+
+    @staticmethod
+    def get_available_tools() -> tuple[str, ...]:
         """Get list of tools provided by filesystem server.
 
         Returns:
-            List of tool names provided by this server
+            Tuple of tool names provided by this server
 
         Note:
             Actual tool schemas should be discovered via tools/list JSON-RPC call.
             This is a static list for documentation purposes.
         """
-        return [
-            "read_file",       # Read file contents
-            "write_file",      # Write content to file
-            "list_directory",  # List directory contents
-            "create_directory",  # Create a directory
-            "move_file",       # Move/rename file
-            "search_files",    # Search for files by pattern
-        ]
+        return _AVAILABLE_TOOLS
 
     @staticmethod
-    def get_security_recommendations() -> dict[str, list[str]]:
+    def get_security_recommendations() -> Mapping[str, tuple[str, ...]]:
         """Get security recommendations for filesystem server deployment.
 
         Returns:
-            Dictionary of security best practices organized by category
+            Read-only mapping of security best practices organized by category
         """
-        return {
-            "directory_permissions": [
-                "Use most restrictive permissions possible",
-                "Prefer read-only access when write is not needed",
-                "Create dedicated directories for agent file access",
-                "Never grant access to system directories",
-            ],
-            "path_configuration": [
-                "Always use absolute paths",
-                "Use environment variables for user-specific paths",
-                "Document all allowed directories in deployment docs",
-                "Audit allowed directories regularly",
-            ],
-            "container_deployment": [
-                "Mount only necessary volumes in container",
-                "Use read-only mounts where possible",
-                "Implement file size limits",
-                "Monitor file system usage and quotas",
-            ],
-            "monitoring": [
-                "Log all file operations via Application Insights",
-                "Set up alerts for unusual file access patterns",
-                "Track file operation success/failure rates",
-                "Monitor disk usage trends",
-            ],
-        }
+        return _SECURITY_RECOMMENDATIONS
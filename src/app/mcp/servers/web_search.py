@@ -7,12 +7,91 @@ Web search servers allow agents to perform internet searches
 and retrieve current information beyond their training data.
 """
 import logging
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from app.mcp.config import MCPServerConfig, TransportType
 
 logger = logging.getLogger(__name__)
 
+# Static reference data, built once at import and shared read-only
+_AVAILABLE_TOOLS = MappingProxyType({
+    "brave_search": (
+        "web_search",      # General web search
+        "news_search",     # News-specific search
+    ),
+    "google_search": (
+        "search",          # Custom search query
+        "image_search",    # Image search (if enabled)
+    ),
+    "generic": (
+        "search",          # Generic search tool name
+    ),
+})
+
+_RATE_LIMIT_RECOMMENDATIONS = MappingProxyType({
+    "brave_search_free": "15,000 queries/month (500/day) on free tier",
+    "google_custom_search_free": "100 queries/day on free tier",
+    "implementation": "Implement client-side rate limiting with exponential backoff",
+    "caching": "Cache search results for common queries (5-15 minutes TTL)",
+    "monitoring": "Track query counts and costs via Application Insights",
+    "fallback": "Configure fallback search provider if primary quota exceeded",
+})
+
+_SECURITY_RECOMMENDATIONS = MappingProxyType({
+    "api_keys": (
+        "Store API keys in Azure Key Vault, not in code",
+        "Use environment variables for configuration",
+        "Rotate API keys regularly (90 days recommended)",
+        "Monitor API key usage for anomalies",
+    ),
+    "query_validation": (
+        "Sanitize user queries before sending to search API",
+        "Implement query length limits",
+        "Filter sensitive keywords from queries",
+        "Log all search queries for audit purposes",
+    ),
+    "result_handling": (
+        "Validate search results before returning to user",
+        "Strip tracking parameters from URLs",
+        "Implement content filtering for inappropriate results",
+        "Cache results to minimize API calls",
+    ),
+    "cost_control": (
+        "Set daily/monthly query quotas",
+        "Implement alerts for quota threshold (80%)",
+        "Use free tiers where possible",
+        "Monitor cost per query in Application Insights",
+    ),
+})
+
+_DEPLOYMENT_CHECKLIST = MappingProxyType({
+    "pre_deployment": (
+        "Obtain and validate API keys",
+        "Configure environment variables in Key Vault",
+        "Test search functionality locally",
+        "Document rate limits and quotas",
+    ),
+    "deployment": (
+        "Add search server to mcp_servers.json",
+        "Enable server in configuration (enabled: true)",
+        "Deploy updated container with npm dependencies",
+        "Verify server connects successfully",
+    ),
+    "post_deployment": (
+        "Test search queries through agent",
+        "Monitor query success rate",
+        "Validate result formatting",
+        "Set up cost and quota alerts",
+    ),
+    "ongoing_maintenance": (
+        "Review search query logs weekly",
+        "Monitor API costs and quotas",
+        "Update server packages monthly",
+        "Audit and rotate API keys quarterly",
+    ),
+})
+
 
 class WebSearchServerHelper:
     """Helper for web search MCP server configuration.
@@ -172,110 +251,41 @@ class WebSearchServerHelper:
         )
 
     @staticmethod
-    def get_available_tools() -> dict[str, list[str]]:
+    def get_available_tools() -> Mapping[str, tuple[str, ...]]:
         """Get typical tools provided by web search servers.
 
         Returns:
-            Dictionary mapping server types to their typical tool lists
+            Read-only mapping of server types to their typical tool names
 
         Note:
             Actual tool schemas should be discovered via tools/list JSON-RPC call.
             This is a static reference for documentation purposes.
         """
-        return {
-            "brave_search": [
-                "web_search",      # General web search
-                "news_search",     # News-specific search
-            ],
-            "google_search": [
-                "search",          # Custom search query
-                "image_search",    # Image search (if enabled)
-            ],
-            "generic": [
-                "search",          # Generic search tool name
-            ],
-        }
+        return _AVAILABLE_TOOLS
 
     @staticmethod
-    def get_rate_limit_recommendations() -> dict[str, str]:
+    def get_rate_limit_recommendations() -> Mapping[str, str]:
         """Get rate limiting recommendations for web search APIs.
 
         Returns:
-            Dictionary of rate limiting best practices
+            Read-only mapping of rate limiting best practices
         """
-        return {
-            "brave_search_free": "15,000 queries/month (500/day) on free tier",
-            "google_custom_search_free": "100 queries/day on free tier",
-            "implementation": "Implement client-side rate limiting with exponential backoff",
-            "caching": "Cache search results for common queries (5-15 minutes TTL)",
-            "monitoring": "Track query counts and costs via Application Insights",
-            "fallback": "Configure fallback search provider if primary quota exceeded",
-        }
+        return _RATE_LIMIT_RECOMMENDATIONS
 
     @staticmethod
-    def get_security_recommendations() -> dict[str, list[str]]:
+    def get_security_recommendations() -> Mapping[str, tuple[str, ...]]:
         """Get security recommendations for web search server deployment.
 
         Returns:
-            Dictionary of security best practices organized by category
+            Read-only mapping of security best practices organized by category
         """
-        return {
-            "api_keys": [
-                "Store API keys in Azure Key Vault, not in code",
-                "Use environment variables for configuration",
-                "Rotate API keys regularly (90 days recommended)",
-                "Monitor API key usage for anomalies",
-            ],
-            "query_validation": [
-                "Sanitize user queries before sending to search API",
-                "Implement query length limits",
-                "Filter sensitive keywords from queries",
-                "Log all search queries for audit purposes",
-            ],
-            "result_handling": [
-                "Validate search results before returning to user",
-                "Strip tracking parameters from URLs",
-                "Implement content filtering for inappropriate results",
-                "Cache results to minimize API calls",
-            ],
-            "cost_control": [
-                "Set daily/monthly query quotas",
-                "Implement alerts for quota threshold (80%)",
-                "Use free tiers where possible",
-                "Monitor cost per query in Application Insights",
-            ],
-        }
+        return _SECURITY_RECOMMENDATIONS
 
     @staticmethod
-    def get_deployment_checklist() -> dict[str, list[str]]:
+    def get_deployment_checklist() -> Mapping[str, tuple[str, ...]]:
         """Get deployment checklist for web search integration.
 
         Returns:
-            Dictionary of deployment tasks organized by phase
+            Read-only mapping of deployment tasks organized by phase
         """
-        return {
-            "pre_deployment": [
-                "Obtain and validate API keys",
-                "Configure environment variables in Key Vault",
-                "Test search functionality locally",
-                "Document rate limits and quotas",
-            ],
-            "deployment": [
-                "Add search server to mcp_servers.json",
-                "Enable server in configuration (enabled: true)",
-                "Deploy updated container with npm dependencies",
-                "Verify server connects successfully",
-            ],
-            "post_deployment": [
-                "Test search queries through agent",
-                "Monitor query success rate",
-                "Validate result formatting",
-                "Set up cost and quota alerts",
-            ],
-            "ongoing_maintenance": [
-                "Review search query logs weekly",
-                "Monitor API costs and quotas",
-                "Update server packages monthly",
-                "Audit and rotate API keys quarterly",
-            ],
-        }
+        return _DEPLOYMENT_CHECKLIST
@@ -3,10 +3,11 @@
 This module provides utilities for converting MCP tool schemas to Agent Framework format.
 """
 from dataclasses import dataclass
-from typing import Any
+from operator import attrgetter
+from typing import Any, Iterable
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPToolSchema:
     """MCP tool schema representation.
 
@@ -25,6 +26,10 @@ class MCPToolSchema:
     full_name: str = ""
 
 
+# Fields read from each tool during batch conversion
+_TOOL_FIELDS = attrgetter("name", "description", "input_schema", "full_name")
+
+
 def mcp_to_agent_framework(tool: MCPToolSchema) -> dict[str, Any]:
     """Convert MCP tool schema to Agent Framework format.
 
@@ -43,22 +48,56 @@ def mcp_to_agent_framework(tool: MCPToolSchema) -> dict[str, Any]:
     # Use full_name if available, otherwise use name
     tool_name = tool.full_name if tool.full_name else tool.name
 
+    return _to_agent_tool(tool_name, tool.description, tool.input_schema)
+
+
+def mcp_to_agent_framework_many(tools: Iterable[MCPToolSchema]) -> list[dict[str, Any]]:
+    """Convert a batch of MCP tool schemas to Agent Framework format.
+
+    Equivalent to calling mcp_to_agent_framework on each tool, but reads the
+    fields of every tool through a single attrgetter.
+
+    Args:
+        tools: MCP tool schemas to convert
+
+    Returns:
+        Agent Framework tool definitions, in the order of tools
+    """
+    convert = _to_agent_tool
+    return [
+        convert(full_name or name, description, schema)
+        for name, description, schema, full_name in map(_TOOL_FIELDS, tools)
+    ]
+
+
+def _to_agent_tool(name: str, description: str, schema: dict[str, Any]) -> dict[str, Any]:
+    """Build an Agent Framework tool definition.
+
+    Args:
+        name: Tool name to publish
+        description: Tool description
+        schema: MCP input schema
+
+    Returns:
+        Dictionary with name, description and parameters
+    """
     # Convert input schema to Agent Framework format
     # MCP uses 'inputSchema', Agent Framework uses 'parameters'
     parameters = {
-        "type": tool.input_schema.get("type", "object"),
-        "properties": tool.input_schema.get("properties", {}),
+        "type": schema.get("type", "object"),
+        "properties": schema.get("properties", {}),
     }
 
     # Include required fields if present
-    if "required" in tool.input_schema:
-        parameters["required"] = tool.input_schema["required"]
+    required = schema.get("required")
+    if required is not None:
+        parameters["required"] = required
 
     # Preserve nested schema features like enum, default, items (for arrays), etc.
     # These are already in the correct format in the input_schema
 
     return {
-        "name": tool_name,
-        "description": tool.description,
+        "name": name,
+        "description": description,
         "parameters": parameters,
     }
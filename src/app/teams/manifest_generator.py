@@ -3,14 +3,19 @@ Teams App Manifest Generator
 Generates Teams app manifest with environment-specific values
 """
 import os
-import json
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Tuple
+
+from app.utils import json_codec
 
 
 def generate_manifest() -> Dict[str, Any]:
     """
     Generate Teams app manifest with environment variables.
 
+    Each call builds a new manifest, so callers may modify it freely.
+
     Returns:
         Dictionary with complete manifest
 
@@ -20,10 +25,76 @@ def generate_manifest() -> Dict[str, Any]:
     - APP_VERSION: Application version (default: 1.0.0)
     - ENVIRONMENT: Deployment environment (dev/staging/prod)
     """
-    bot_id = os.getenv('BOT_ID', '{{BOT_ID}}')
-    bot_endpoint = os.getenv('BOT_ENDPOINT', '{{BOT_ENDPOINT}}')
-    app_version = os.getenv('APP_VERSION', '1.0.0')
-    environment = os.getenv('ENVIRONMENT', 'dev')
+    return _build_manifest(*_manifest_env())
+
+
+def generate_manifest_json_bytes() -> bytes:
+    """
+    Generate the Teams app manifest as indented UTF-8 JSON.
+
+    The serialized document is cached per set of environment values, so
+    repeated calls with unchanged environment variables skip building and
+    serializing the manifest.
+
+    Returns:
+        Manifest JSON, formatted as save_manifest writes it
+    """
+    return _build_manifest_json(*_manifest_env())
+
+
+def _manifest_env() -> Tuple[str, str, str, str]:
+    """
+    Read the environment values the manifest depends on.
+
+    Returns:
+        Tuple of (bot_id, bot_endpoint, app_version, environment)
+    """
+    return (
+        os.getenv('BOT_ID', '{{BOT_ID}}'),
+        os.getenv('BOT_ENDPOINT', '{{BOT_ENDPOINT}}'),
+        os.getenv('APP_VERSION', '1.0.0'),
+        os.getenv('ENVIRONMENT', 'dev'),
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_manifest_json(
+    bot_id: str, bot_endpoint: str, app_version: str, environment: str
+) -> bytes:
+    """
+    Serialize the manifest for one set of environment values.
+
+    Args:
+        bot_id: Azure Bot Service app ID
+        bot_endpoint: Bot messaging endpoint URL
+        app_version: Application version
+        environment: Deployment environment
+
+    Returns:
+        Indented UTF-8 JSON manifest
+    """
+    return json_codec.dumps_indented(
+        _build_manifest(bot_id, bot_endpoint, app_version, environment)
+    )
+
+
+def _build_manifest(
+    bot_id: str, bot_endpoint: str, app_version: str, environment: str
+) -> Dict[str, Any]:
+    """
+    Build the manifest for one set of environment values.
+
+    Args:
+        bot_id: Azure Bot Service app ID
+        bot_endpoint: Bot messaging endpoint URL
+        app_version: Application version
+        environment: Deployment environment
+
+    Returns:
+        Dictionary with complete manifest
+    """
+    # Application ID URI uses the endpoint host and path without its scheme
+    endpoint_without_scheme = bot_endpoint.removeprefix('https://').removeprefix('http://')
 
     manifest = {
         "$schema": "https://developer.microsoft.com/json-schemas/teams/v1.16/MicrosoftTeams.schema.json",
@@ -102,7 +173,7 @@ def generate_manifest() -> Dict[str, Any]:
         ],
         "webApplicationInfo": {
             "id": bot_id,
-            "resource": f"api://{bot_endpoint.replace('https://', '')}"
+            "resource": f"api://{endpoint_without_scheme}"
         }
     }
 
@@ -117,14 +188,32 @@ def save_manifest(manifest: Dict[str, Any], output_path: str) -> None:
         manifest: Manifest dictionary
         output_path: Output file path
     """
-    with open(output_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(json_codec.dumps_indented(manifest))
+
+
+@lru_cache(maxsize=16)
+def _placeholder_pattern(keys: FrozenSet[str]) -> "re.Pattern[str]":
+    """
+    Compile a pattern matching any {{KEY}} placeholder for the given keys.
+
+    Args:
+        keys: Placeholder names to match
+
+    Returns:
+        Compiled pattern capturing the placeholder name
+    """
+    alternation = "|".join(re.escape(key) for key in keys)
+    return re.compile(r"\{\{(" + alternation + r")\}\}")
 
 
 def substitute_placeholders(manifest_template: str, values: Dict[str, str]) -> str:
     """
     Substitute placeholders in manifest template.
 
+    All placeholders are replaced in a single pass over the template, so
+    placeholders appearing inside substituted values are left as-is.
+
     Args:
         manifest_template: Manifest JSON string with placeholders
         values: Dictionary of placeholder values
@@ -132,8 +221,8 @@ def substitute_placeholders(manifest_template: str, values: Dict[str, str]) -> s
     Returns:
         Manifest string with substituted values
     """
-    for key, value in values.items():
-        placeholder = f"{{{{{key}}}}}"
-        manifest_template = manifest_template.replace(placeholder, value)
+    if not values:
+        return manifest_template
 
-    return manifest_template
+    pattern = _placeholder_pattern(frozenset(values))
+    return pattern.sub(lambda match: values[match.group(1)], manifest_template)
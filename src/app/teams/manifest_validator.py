@@ -4,7 +4,54 @@ Validates Teams manifest against schema and best practices
 """
 import json
 import re
-from typing import Tuple, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List, Dict, Any, Optional
+
+from app.utils import json_codec
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on installed extras
+    Image = None
+
+_GUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE
+)
+_VERSION_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
+
+# Required fields in reporting order; the frozensets allow one subset check
+# for the common case where nothing is missing
+_REQUIRED_FIELDS = (
+    '$schema', 'manifestVersion', 'version', 'id', 'packageName',
+    'developer', 'name', 'description', 'icons', 'accentColor'
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_REQUIRED_DEV_FIELDS = ('name', 'websiteUrl', 'privacyUrl', 'termsOfUseUrl')
+_REQUIRED_DEV_FIELD_SET = frozenset(_REQUIRED_DEV_FIELDS)
+
+_MIN_MANIFEST_VERSION = (1, 16)
+
+# Teams accepts this schema tag for preview features; it has no numeric form
+_DEV_PREVIEW_MANIFEST_VERSION = 'devPreview'
+
+# Upper bound on icons opened concurrently by validate_icons_batch
+_ICON_VALIDATION_WORKERS = 8
+
+
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a dotted version string into a tuple of integers.
+
+    Args:
+        version: Version string such as "1.16"
+
+    Returns:
+        Tuple of version components, or None if the string is not numeric
+    """
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except ValueError:
+        return None
 
 
 def validate_manifest(manifest_path: str) -> Tuple[bool, List[str]]:
@@ -17,52 +64,61 @@ def validate_manifest(manifest_path: str) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, error_messages)
     """
-    errors = []
+    errors: List[str] = []
 
     try:
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        with open(manifest_path, 'rb') as f:
+            manifest = json_codec.loads(f.read())
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {e}"]
     except FileNotFoundError:
         return False, ["Manifest file not found"]
 
-    # Validate required fields
-    required_fields = [
-        '$schema', 'manifestVersion', 'version', 'id', 'packageName',
-        'developer', 'name', 'description', 'icons', 'accentColor'
-    ]
+    if not isinstance(manifest, dict):
+        return False, ["Manifest must be a JSON object"]
 
-    for field in required_fields:
-        if field not in manifest:
-            errors.append(f"Missing required field: {field}")
+    # Validate required fields
+    if not _REQUIRED_FIELD_SET <= manifest.keys():
+        errors.extend(
+            f"Missing required field: {field}"
+            for field in _REQUIRED_FIELDS if field not in manifest
+        )
 
     # Validate manifest version
-    if 'manifestVersion' in manifest:
-        if manifest['manifestVersion'] < '1.16':
-            errors.append(f"Manifest version {manifest['manifestVersion']} is outdated. Use 1.16 or higher.")
+    manifest_version = manifest.get('manifestVersion')
+    if 'manifestVersion' in manifest and manifest_version != _DEV_PREVIEW_MANIFEST_VERSION:
+        parsed_version = (
+            _parse_version(manifest_version) if isinstance(manifest_version, str) else None
+        )
+        if parsed_version is None:
+            errors.append(f"Manifest version {manifest_version} is not a valid version number")
+        elif parsed_version < _MIN_MANIFEST_VERSION:
+            errors.append(f"Manifest version {manifest_version} is outdated. Use 1.16 or higher.")
 
     # Validate bot configuration
-    if 'bots' in manifest and len(manifest['bots']) > 0:
-        bot = manifest['bots'][0]
+    bots = manifest.get('bots')
+    if bots:
+        bot = bots[0]
         if 'botId' not in bot:
             errors.append("Bot configuration missing botId")
         if 'scopes' not in bot:
             errors.append("Bot configuration missing scopes")
 
     # Validate developer info
-    if 'developer' in manifest:
-        dev = manifest['developer']
-        required_dev_fields = ['name', 'websiteUrl', 'privacyUrl', 'termsOfUseUrl']
-        for field in required_dev_fields:
-            if field not in dev:
-                errors.append(f"Developer section missing {field}")
+    dev = manifest.get('developer')
+    if isinstance(dev, dict):
+        if not _REQUIRED_DEV_FIELD_SET <= dev.keys():
+            errors.extend(
+                f"Developer section missing {field}"
+                for field in _REQUIRED_DEV_FIELDS if field not in dev
+            )
+    elif dev is not None:
+        errors.append("Developer section must be an object")
 
     # Validate icons
-    if 'icons' in manifest:
-        icons = manifest['icons']
-        if 'color' not in icons or 'outline' not in icons:
-            errors.append("Icons section must include both color and outline icons")
+    icons = manifest.get('icons')
+    if icons is not None and ('color' not in icons or 'outline' not in icons):
+        errors.append("Icons section must include both color and outline icons")
 
     return len(errors) == 0, errors
 
@@ -77,8 +133,7 @@ def validate_bot_id(bot_id: str) -> bool:
     Returns:
         True if valid GUID format
     """
-    guid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return bool(re.match(guid_pattern, bot_id, re.IGNORECASE))
+    return _GUID_PATTERN.match(bot_id) is not None
 
 
 def validate_required_scopes(manifest: Dict[str, Any]) -> bool:
@@ -114,8 +169,7 @@ def validate_version_format(version: str) -> bool:
     Returns:
         True if valid semantic version
     """
-    version_pattern = r'^\d+\.\d+\.\d+$'
-    return bool(re.match(version_pattern, version))
+    return _VERSION_PATTERN.match(version) is not None
 
 
 def validate_icon_dimensions(icon_path: str, expected_size: Tuple[int, int]) -> Tuple[bool, str]:
@@ -129,16 +183,35 @@ def validate_icon_dimensions(icon_path: str, expected_size: Tuple[int, int]) ->
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if Image is None:
+        # PIL not available, skip dimension check
+        return True, ""
+
     try:
-        from PIL import Image
         with Image.open(icon_path) as img:
             if img.size != expected_size:
                 return False, f"Icon size {img.size} does not match expected {expected_size}"
         return True, ""
-    except ImportError:
-        # PIL not available, skip dimension check
-        return True, ""
     except FileNotFoundError:
         return False, f"Icon file not found: {icon_path}"
     except Exception as e:
         return False, f"Error validating icon: {e}"
+
+
+def validate_icons_batch(
+    specs: List[Tuple[str, Tuple[int, int]]]
+) -> List[Tuple[bool, str]]:
+    """
+    Validate several icons, overlapping their file I/O on a thread pool.
+
+    Args:
+        specs: List of (icon_path, expected_size) pairs
+
+    Returns:
+        List of (is_valid, error_message) results in the same order as specs
+    """
+    if len(specs) <= 1:
+        return [validate_icon_dimensions(path, size) for path, size in specs]
+
+    with ThreadPoolExecutor(max_workers=min(_ICON_VALIDATION_WORKERS, len(specs))) as executor:
+        return list(executor.map(lambda spec: validate_icon_dimensions(*spec), specs))
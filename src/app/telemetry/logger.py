@@ -8,7 +8,7 @@ from opencensus.trace import config_integration
 from opencensus.trace.samplers import ProbabilitySampler
 from opencensus.trace.tracer import Tracer
 
-from app.config.settings import settings
+from app.config.settings import get_settings
 
 
 class StructuredLogger:
@@ -20,6 +20,7 @@ class StructuredLogger:
         Args:
             name: Logger name (typically __name__ of the module)
         """
+        settings = get_settings()
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, settings.log_level.upper()))
 
@@ -56,12 +57,25 @@ class StructuredLogger:
         """
         base_properties = {
             "service": "teams-ai-agent",
-            "environment": "production" if settings.is_production else "development"
+            "environment": "production" if get_settings().is_production else "development"
         }
         if properties:
             base_properties.update(properties)
         return base_properties
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at a level would be emitted.
+
+        Lets callers skip building properties for filtered-out messages.
+
+        Args:
+            level: Standard logging level (e.g. logging.INFO)
+
+        Returns:
+            True if the underlying logger handles the level
+        """
+        return self.logger.isEnabledFor(level)
+
     def info(self, message: str, properties: Optional[Dict[str, Any]] = None):
         """Log info message with optional properties."""
         self.logger.info(message, extra={"custom_dimensions": self._enrich_properties(properties)})
@@ -101,6 +115,7 @@ def configure_tracing() -> Optional[Tracer]:
     Returns:
         Tracer instance if Application Insights is configured, None otherwise
     """
+    settings = get_settings()
     if not settings.applicationinsights_connection_string:
         return None
 
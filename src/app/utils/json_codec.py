@@ -0,0 +1,65 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce UTF-8 output.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Deserialize JSON text or UTF-8 bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+
+    Raises:
+        TypeError: If obj is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON indented by two spaces.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded, human-readable JSON document
+
+    Raises:
+        TypeError: If obj is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -3,6 +3,9 @@ import re
 from typing import Optional
 from botbuilder.schema import Activity
 
+# Teams adds mentions as <at>botname</at>
+_MENTION_PATTERN = re.compile(r'<at>.*?</at>')
+
 
 def extract_message_text(activity: Activity) -> str:
     """Extract clean message text from Teams activity.
@@ -18,16 +21,14 @@ def extract_message_text(activity: Activity) -> str:
     if not activity.text:
         return ""
 
-    text = activity.text.strip()
-
-    # Remove @mentions (Teams adds mentions as <at>botname</at>)
-    # Pattern matches: <at>...</at>
-    text = re.sub(r'<at>.*?</at>', '', text)
+    text = activity.text
 
-    # Clean up extra whitespace
-    text = ' '.join(text.split())
+    # Remove @mentions; most messages carry none, so skip the regex then
+    if '<at>' in text:
+        text = _MENTION_PATTERN.sub('', text)
 
-    return text.strip()
+    # Clean up extra whitespace (also trims both ends)
+    return ' '.join(text.split())
 
 
 def format_teams_response(text: str) -> str:
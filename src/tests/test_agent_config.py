@@ -90,6 +90,32 @@ class TestAgentDefinitionValidation:
             )
         assert "name" in str(exc_info.value).lower()
 
+    def test_name_is_stripped_but_other_strings_are_not(self):
+        """Test only the agent name has surrounding whitespace removed."""
+        agent = AgentDefinition(
+            name="  test-agent  ",
+            description=" Test ",
+            tools=["tool1"],
+            model="Claude Sonnet 4",
+            instructions="  Indented instructions\n"
+        )
+
+        assert agent.name == "test-agent"
+        assert agent.description == " Test "
+        assert agent.instructions == "  Indented instructions\n"
+
+    def test_whitespace_only_name_validation(self):
+        """Test that a whitespace-only agent name raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            AgentDefinition(
+                name="   ",
+                description="Test",
+                tools=["tool1"],
+                model="Claude Sonnet 4",
+                instructions="Test"
+            )
+        assert "cannot be empty" in str(exc_info.value).lower()
+
     def test_invalid_name_characters(self):
         """Test that invalid characters in name raise ValidationError."""
         with pytest.raises(ValidationError) as exc_info:
@@ -118,6 +144,15 @@ class TestAgentDefinitionValidation:
 class TestAgentParser:
     """Test .agent.md file parsing functionality."""
 
+    @pytest.fixture(autouse=True)
+    def empty_parse_cache(self):
+        """Isolate each test from definitions cached by earlier tests."""
+        from app.agent import agent_parser
+
+        agent_parser._parse_cache.clear()
+        yield
+        agent_parser._parse_cache.clear()
+
     @pytest.fixture
     def temp_agent_file(self, tmp_path: Path) -> Path:
         """Create a temporary .agent.md file."""
@@ -152,6 +187,50 @@ It can contain multiple lines.
         assert "Test Agent Instructions" in agent.instructions
         assert str(temp_agent_file) == agent.file_path
 
+    def test_parse_reuses_unchanged_file(self, temp_agent_file: Path):
+        """Test unchanged files return the cached definition."""
+        first = parse_agent_file(temp_agent_file)
+        assert parse_agent_file(temp_agent_file) is first
+
+        temp_agent_file.write_text(
+            temp_agent_file.read_text().replace("Test agent", "Updated agent")
+        )
+        updated = parse_agent_file(temp_agent_file)
+        assert updated is not first
+        assert updated.description.startswith("Updated agent")
+
+    def test_parse_cache_evicts_least_recently_used(
+        self, temp_agent_file: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test the parse cache is bounded and evicts the oldest entry."""
+        from app.agent import agent_parser
+
+        monkeypatch.setattr(agent_parser, "_PARSE_CACHE_MAX_SIZE", 2)
+        content = temp_agent_file.read_text()
+        paths = []
+        for name in ("one", "two", "three"):
+            path = tmp_path / f"{name}.agent.md"
+            path.write_text(content.replace("test-agent", name))
+            paths.append(path)
+
+        parse_agent_file(paths[0])
+        parse_agent_file(paths[1])
+        parse_agent_file(paths[0])  # Mark "one" as recently used
+        parse_agent_file(paths[2])
+
+        assert list(agent_parser._parse_cache) == [str(paths[0]), str(paths[2])]
+
+    def test_parse_cache_forgets_deleted_file(self, temp_agent_file: Path):
+        """Test a deleted file's cached definition is dropped."""
+        from app.agent import agent_parser
+
+        parse_agent_file(temp_agent_file)
+        temp_agent_file.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            parse_agent_file(temp_agent_file)
+        assert str(temp_agent_file) not in agent_parser._parse_cache
+
     def test_parse_file_not_found(self, tmp_path: Path):
         """Test parsing non-existent file raises FileNotFoundError."""
         non_existent = tmp_path / "missing.agent.md"
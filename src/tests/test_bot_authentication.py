@@ -76,6 +76,78 @@ class TestBotAuthentication:
                 bot_id="different-bot-id"
             )
 
+    def test_validate_jwt_token_cached_expiry_rechecked(self, mock_jwt_token, monkeypatch):
+        """Test repeated tokens skip decoding until their exp claim passes."""
+        from app.bot import auth
+
+        header = f"Bearer {mock_jwt_token}"
+        assert auth.validate_jwt_token(header, bot_id="test-bot-id") is True
+
+        with patch.object(auth, "_decode_claims", wraps=auth._decode_claims) as decode_spy:
+            assert auth.validate_jwt_token(header, bot_id="test-bot-id") is True
+            decode_spy.assert_not_called()
+
+            # Past the cached exp the token must be fully re-validated
+            future = auth.time.time() + 7200
+            monkeypatch.setattr(auth.time, "time", lambda: future)
+            with pytest.raises(jwt.ExpiredSignatureError):
+                auth.validate_jwt_token(header, bot_id="test-bot-id")
+            decode_spy.assert_called_once()
+
+    def test_validate_jwt_token_audience_list(self):
+        """Test JWT token validation accepts bot ID within an audience list."""
+        from app.bot.auth import validate_jwt_token
+
+        now = datetime.now(timezone.utc)
+        token = jwt.encode(
+            {
+                'aud': ['other-app', 'test-bot-id'],
+                'iss': 'https://login.microsoftonline.com/tenant/v2.0',
+                'exp': int((now + timedelta(hours=1)).timestamp()),
+            },
+            'test-secret',
+            algorithm='HS256'
+        )
+        assert validate_jwt_token(f"Bearer {token}", bot_id="test-bot-id") is True
+
+    def test_validate_jwt_token_missing_exp(self):
+        """Test JWT token validation rejects tokens without exp claim."""
+        from app.bot.auth import validate_jwt_token
+
+        token = jwt.encode(
+            {'aud': 'test-bot-id', 'iss': 'https://api.botframework.com'},
+            'test-secret',
+            algorithm='HS256'
+        )
+        assert validate_jwt_token(f"Bearer {token}", bot_id="test-bot-id") is False
+
+    @pytest.mark.parametrize('header_segment', [
+        'not-base64!',
+        'bm90LWpzb24',  # base64url of "not-json"
+        'WyJIUzI1NiJd',  # base64url of '["HS256"]'
+        'eyJ0eXAiOiJKV1QifQ',  # base64url of '{"typ":"JWT"}' (no alg)
+    ])
+    def test_validate_jwt_token_malformed_header(self, mock_jwt_token, header_segment):
+        """Test tokens with a malformed header segment are rejected."""
+        from app.bot.auth import _decode_claims, validate_jwt_token
+
+        _, payload, signature = mock_jwt_token.split('.')
+        token = f"{header_segment}.{payload}.{signature}"
+
+        with pytest.raises(jwt.DecodeError, match="Invalid header"):
+            _decode_claims(token, "test-bot-id")
+        assert validate_jwt_token(f"Bearer {token}", bot_id="test-bot-id") is False
+
+    @pytest.mark.parametrize('segment_count', [2, 4])
+    def test_validate_jwt_token_wrong_segment_count(self, mock_jwt_token, segment_count):
+        """Test tokens without exactly three segments are rejected."""
+        from app.bot.auth import _decode_claims
+
+        token = '.'.join((mock_jwt_token.split('.') + ['extra'])[:segment_count])
+
+        with pytest.raises(jwt.DecodeError, match="segments"):
+            _decode_claims(token, "test-bot-id")
+
     def test_validate_microsoft_tenant_valid(self):
         """Test Microsoft tenant verification with valid tenant."""
         from app.bot.auth import validate_microsoft_tenant
@@ -188,6 +260,14 @@ class TestSecurityHeaders:
         assert 'X-XSS-Protection' in headers
         assert headers['X-XSS-Protection'] == '1; mode=block'
 
+    def test_security_headers_raw_matches_mapping(self):
+        """Test pre-encoded raw headers mirror the header mapping."""
+        from app.bot.security import get_security_headers, get_security_headers_raw
+
+        raw = dict(get_security_headers_raw())
+        for name, value in get_security_headers().items():
+            assert raw[name.lower().encode()] == value.encode()
+
 
 class TestCORSConfiguration:
     """Test suite for CORS configuration."""
@@ -217,3 +297,133 @@ class TestCORSConfiguration:
         assert 'allowed_headers' in config
         assert 'Authorization' in config['allowed_headers']
         assert 'Content-Type' in config['allowed_headers']
+
+    def test_cors_origin_matcher(self):
+        """Test compiled CORS origin matcher honours wildcard subdomains."""
+        from app.bot.security import get_cors_origin_matcher
+
+        matches = get_cors_origin_matcher()
+        assert matches('https://teams.microsoft.com')
+        assert matches('https://contoso.teams.microsoft.com')
+        assert matches('HTTPS://Europe.SMBA.TrafficManager.net')
+        assert not matches('https://a.b.teams.microsoft.com')
+        assert not matches('https://evilteams.microsoft.com')
+        assert not matches('http://teams.microsoft.com')
+        assert not matches('https://teams.microsoft.com.evil.com')
+
+    def test_cors_origin_headers_follow_allow_credentials(self, monkeypatch):
+        """Test per-origin CORS headers honour the allow_credentials setting."""
+        from app.bot import security
+
+        origin = 'https://teams.microsoft.com'
+        monkeypatch.setattr(security, '_CORS_ALLOW_CREDENTIALS', True)
+        headers = dict(security._cors_origin_headers(origin))
+        assert headers[b'access-control-allow-credentials'] == b'true'
+        assert headers[b'access-control-allow-origin'] == origin.encode()
+
+        monkeypatch.setattr(security, '_CORS_ALLOW_CREDENTIALS', False)
+        headers = dict(security._cors_origin_headers(origin))
+        assert b'access-control-allow-credentials' not in headers
+
+    def test_cors_preflight_credentials_follow_config(self):
+        """Test preflight headers include credentials only when configured."""
+        from app.bot.security import _build_preflight_headers, get_cors_config
+
+        config = get_cors_config()
+        config['allow_credentials'] = False
+        headers = dict(_build_preflight_headers(config))
+        assert b'access-control-allow-credentials' not in headers
+
+    @staticmethod
+    def _request(method, path='/health', headers=None):
+        """Build a mock request for the CORS middleware."""
+        request = Mock()
+        request.method = method
+        request.url.path = path
+        request.headers = headers or {}
+        return request
+
+    @pytest.mark.asyncio
+    async def test_cors_middleware_answers_allowed_preflight(self):
+        """Test a preflight from an allowed origin is answered without the app."""
+        from app.bot.security import cors_middleware
+
+        request = self._request('OPTIONS', headers={
+            'origin': 'https://teams.microsoft.com',
+            'access-control-request-method': 'POST',
+        })
+        call_next = AsyncMock()
+
+        response = await cors_middleware(request, call_next)
+
+        call_next.assert_not_awaited()
+        assert response.status_code == 204
+        assert response.headers['access-control-allow-origin'] == 'https://teams.microsoft.com'
+        assert 'access-control-allow-methods' in response.headers
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('headers', [
+        {'origin': 'https://evil.example.com', 'access-control-request-method': 'POST'},
+        {},
+    ])
+    async def test_cors_middleware_ignores_disallowed_origins(self, headers):
+        """Test OPTIONS without an allowed origin reaches the app without CORS headers."""
+        from fastapi import Response
+        from app.bot.security import cors_middleware
+
+        request = self._request('OPTIONS', headers=headers)
+        downstream = Response(status_code=405)
+        call_next = AsyncMock(return_value=downstream)
+
+        response = await cors_middleware(request, call_next)
+
+        call_next.assert_awaited_once_with(request)
+        assert response is downstream
+        assert 'access-control-allow-credentials' not in response.headers
+        assert 'access-control-allow-origin' not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_cors_middleware_passes_plain_options_to_app(self):
+        """Test OPTIONS without Access-Control-Request-Method is not a preflight."""
+        from fastapi import Response
+        from app.bot.security import cors_middleware
+
+        request = self._request('OPTIONS', headers={'origin': 'https://teams.microsoft.com'})
+        call_next = AsyncMock(return_value=Response(status_code=405))
+
+        response = await cors_middleware(request, call_next)
+
+        call_next.assert_awaited_once_with(request)
+        assert response.status_code == 405
+        assert response.headers['access-control-allow-origin'] == 'https://teams.microsoft.com'
+
+
+class TestWAFRules:
+    """Test suite for WAF rule definitions."""
+
+    def test_waf_rules_json_matches_rules(self):
+        """Test pre-serialized WAF rules describe the same rules."""
+        import json
+        from app.bot.security import get_waf_rules, get_waf_rules_json
+
+        decoded = json.loads(get_waf_rules_json())
+        rules = get_waf_rules()
+        assert [rule['name'] for rule in decoded] == [rule['name'] for rule in rules]
+        assert decoded[0]['match_conditions'][0]['match_values'] == list(
+            rules[0]['match_conditions'][0]['match_values']
+        )
+
+    def test_waf_rules_are_cached_and_read_only(self):
+        """Test callers share one rule structure that cannot be modified."""
+        from app.bot.security import get_waf_rules
+
+        rules = get_waf_rules()
+        assert get_waf_rules() is rules
+
+        with pytest.raises(TypeError):
+            rules[0]['action'] = 'Allow'
+        with pytest.raises(AttributeError):
+            rules.append({'name': 'Extra'})
+        with pytest.raises(AttributeError):
+            rules[0]['match_conditions'][0]['match_values'].append('exec')
+        assert rules[0]['action'] == 'Block'
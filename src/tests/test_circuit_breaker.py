@@ -140,3 +140,68 @@ class TestCircuitBreaker:
         assert metrics["name"] == "test-server"
         assert metrics["state"] == CircuitState.CLOSED.value
         assert metrics["failure_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_supports_dict_protocol(self, circuit_breaker):
+        """Test metrics work with in, get, ** unpacking and JSON via as_dict."""
+        import json
+
+        metrics = circuit_breaker.get_metrics()
+        expected = {
+            "name": "test-server",
+            "state": CircuitState.CLOSED.value,
+            "failure_count": 0,
+            "success_count": 0,
+            "time_until_reset": None,
+        }
+
+        assert "state" in metrics
+        assert "missing" not in metrics
+        assert metrics.get("failure_count") == 0
+        assert metrics.get("missing", "default") == "default"
+        assert {**metrics} == expected
+        assert json.loads(json.dumps(metrics.as_dict())) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_supports_attribute_access(self, circuit_breaker):
+        """Test metrics fields are readable as attributes and unknown keys raise."""
+        metrics = circuit_breaker.get_metrics()
+
+        assert metrics.state == metrics["state"] == CircuitState.CLOSED.value
+        with pytest.raises(KeyError):
+            metrics["missing"]
+
+    @pytest.mark.asyncio
+    async def test_open_error_reports_recovery_time(self, circuit_breaker):
+        """Test rejection message reports the remaining recovery time."""
+        async def failing_func():
+            raise ValueError("Failure")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await circuit_breaker.call(failing_func)
+
+        with pytest.raises(MCPConnectionError) as exc_info:
+            await circuit_breaker.call(failing_func)
+
+        message = str(exc_info.value)
+        assert "'test-server' is OPEN" in message
+        assert "recovery in 0." in message or "recovery in 1.0s" in message
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_does_not_transition_state(self, circuit_breaker):
+        """Test reading metrics leaves an expired OPEN circuit untouched."""
+        async def failing_func():
+            raise ValueError("Failure")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await circuit_breaker.call(failing_func)
+
+        circuit_breaker._last_failure_time -= circuit_breaker.recovery_timeout
+
+        metrics = circuit_breaker.get_metrics()
+
+        assert metrics["state"] == CircuitState.OPEN.value
+        assert metrics["time_until_reset"] == 0.0
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
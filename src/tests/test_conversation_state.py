@@ -0,0 +1,211 @@
+"""Tests for the in-memory conversation store.
+
+Test conversation state management including:
+- Creating, reading and updating conversation contexts
+- Concurrent access from many threads
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """Provide the required settings so the store's logger can load them."""
+    from app.config.settings import get_settings
+
+    monkeypatch.setenv('AZURE_OPENAI_ENDPOINT', 'https://example.openai.azure.com')
+    monkeypatch.setenv('AZURE_OPENAI_DEPLOYMENT_NAME', 'test-deployment')
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def store(settings_env):
+    """Provide an empty conversation store."""
+    from app.bot.conversation_state import ConversationStore
+
+    return ConversationStore()
+
+
+class TestConversationStore:
+    """Test suite for ConversationStore."""
+
+    def test_get_or_create_returns_same_context(self, store):
+        """Test a conversation is created once and then reused."""
+        created = store.get_or_create('conv-1', user_id='user-1')
+        reused = store.get_or_create('conv-1')
+
+        assert reused is created
+        assert created.user_id == 'user-1'
+        assert created.default_thread_id == 'thread-conv-1'
+        assert created.message_count == 1
+        assert store.size() == 1
+
+    def test_get_returns_none_for_unknown_conversation(self, store):
+        """Test get does not create missing conversations."""
+        assert store.get('missing') is None
+        assert store.size() == 0
+
+    def test_update_thread_id_and_stats(self, store):
+        """Test thread IDs are recorded and counted in the stats."""
+        store.get_or_create('conv-1')
+        store.get_or_create('conv-2')
+        store.update_thread_id('conv-1', 'thread-abc')
+        store.update_thread_id('missing', 'thread-xyz')
+
+        assert store.get('conv-1').thread_id == 'thread-abc'
+        assert store.get_stats() == {"total_conversations": 2, "active_threads": 1}
+
+    def test_concurrent_get_or_create(self, store):
+        """Test concurrent threads share one context per conversation."""
+        conversation_ids = [f'conv-{i}' for i in range(200)]
+        results = [[] for _ in range(8)]
+        barrier = threading.Barrier(len(results))
+
+        def worker(seen):
+            barrier.wait()
+            for conversation_id in conversation_ids:
+                seen.append(store.get_or_create(conversation_id))
+
+        threads = [threading.Thread(target=worker, args=(seen,)) for seen in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.size() == len(conversation_ids)
+        for index, conversation_id in enumerate(conversation_ids):
+            context = store.get(conversation_id)
+            assert all(seen[index] is context for seen in results)
+            assert context.message_count == len(results) - 1
+
+    def test_cleanup_concurrent_with_creation(self, store):
+        """Test sweeps racing with creations neither lose nor double-count entries."""
+        conversation_ids = [f'conv-{worker}-{i}' for worker in range(4) for i in range(250)]
+        removed = []
+        creating = threading.Event()
+        done = threading.Event()
+
+        def create(ids):
+            creating.set()
+            for conversation_id in ids:
+                store.get_or_create(conversation_id)
+
+        def sweep():
+            creating.wait()
+            while not done.is_set():
+                removed.append(store.cleanup_expired())
+
+        with patch('app.bot.conversation_state.get_settings') as mock_settings:
+            # A negative timeout expires every conversation as soon as it exists
+            mock_settings.return_value.conversation_timeout_minutes = -1
+            sweeper = threading.Thread(target=sweep)
+            creators = [
+                threading.Thread(target=create, args=(conversation_ids[i::4],))
+                for i in range(4)
+            ]
+            sweeper.start()
+            for thread in creators:
+                thread.start()
+            for thread in creators:
+                thread.join()
+            done.set()
+            sweeper.join()
+            removed.append(store.cleanup_expired())
+
+        assert sum(removed) == len(conversation_ids)
+        assert store.size() == 0
+
+
+class TestConversationCleanup:
+    """Test suite for ConversationStore.cleanup_expired."""
+
+    @pytest.fixture(autouse=True)
+    def timeout_settings(self):
+        """Use a 30 minute conversation timeout for every sweep."""
+        with patch('app.bot.conversation_state.get_settings') as mock_settings:
+            mock_settings.return_value.conversation_timeout_minutes = 30
+            yield
+
+    @pytest.fixture
+    def store(self, settings_env):
+        """Provide a single-shard store, so every entry shares one activity order."""
+        from app.bot.conversation_state import ConversationStore
+
+        with patch('app.bot.conversation_state._LOCK_SHARDS', 1):
+            yield ConversationStore()
+
+    @staticmethod
+    def _age(context, minutes):
+        """Backdate a conversation's last activity."""
+        context.last_activity = time.time() - minutes * 60
+
+    def test_removes_expired_entries_at_head(self, store):
+        """Test the oldest conversations are removed once past the timeout."""
+        for conversation_id in ('old-1', 'old-2'):
+            self._age(store.get_or_create(conversation_id), 45)
+        store.get_or_create('fresh')
+
+        assert store.cleanup_expired() == 2
+        assert store.get('old-1') is None
+        assert store.get('old-2') is None
+        assert store.get('fresh') is not None
+
+    def test_touched_conversation_survives(self, store):
+        """Test get_or_create moves a conversation behind the cutoff."""
+        for conversation_id in ('a', 'b', 'c'):
+            self._age(store.get_or_create(conversation_id), 45)
+
+        store.get_or_create('b')
+
+        assert store.cleanup_expired() == 2
+        assert store.get('b') is not None
+        assert store.size() == 1
+
+    def test_returns_zero_when_nothing_expired(self, store):
+        """Test a sweep over live conversations removes nothing."""
+        store.get_or_create('a')
+        store.get_or_create('b')
+
+        assert store.cleanup_expired() == 0
+        assert store.size() == 2
+
+
+class TestConversationContext:
+    """Test suite for ConversationContext."""
+
+    def test_defaults(self, settings_env):
+        """Test a new context uses a float timestamp and no metadata."""
+        from app.bot.conversation_state import ConversationContext
+
+        before = time.time()
+        context = ConversationContext(conversation_id='conv-1')
+
+        assert isinstance(context.last_activity, float)
+        assert before <= context.last_activity <= time.time()
+        assert context.metadata is None
+        assert context.message_count == 0
+
+    def test_update_activity(self, settings_env):
+        """Test update_activity refreshes the timestamp and counts messages."""
+        from app.bot.conversation_state import ConversationContext
+
+        context = ConversationContext(conversation_id='conv-1', last_activity=0.0)
+        context.update_activity()
+
+        assert context.last_activity > 0.0
+        assert context.message_count == 1
+
+    def test_rejects_undeclared_attributes(self, settings_env):
+        """Test the slotted context has no per-instance __dict__."""
+        from app.bot.conversation_state import ConversationContext
+
+        context = ConversationContext(conversation_id='conv-1')
+
+        assert not hasattr(context, '__dict__')
+        with pytest.raises(AttributeError):
+            context.unknown = 'value'
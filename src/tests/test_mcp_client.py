@@ -1,6 +1,7 @@
 """Tests for MCP client implementations (STDIO and SSE transports)."""
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.mcp.client import MCPClient, MCPSTDIOClient, MCPSSEClient
@@ -116,6 +117,102 @@ class TestMCPSTDIOClient:
             assert "result" in response
             mock_process.stdin.write.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stdio_client_matches_out_of_order_responses(self):
+        """Test concurrent STDIO requests are resolved by JSON-RPC id."""
+        config = MCPServerConfig(command="npx", transport=TransportType.STDIO)
+        client = MCPSTDIOClient(config)
+
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.stdout = AsyncMock()
+            mock_process.stdout.readline = AsyncMock(
+                side_effect=[
+                    b'{"jsonrpc": "2.0", "result": "second", "id": 2}\n',
+                    b'{"jsonrpc": "2.0", "method": "notifications/progress"}\n',
+                    b'{"jsonrpc": "2.0", "result": "first", "id": 1}\n',
+                ]
+            )
+            mock_process.stdin = MagicMock()
+            mock_process.stdin.drain = AsyncMock()
+            mock_process.returncode = None
+            mock_subprocess.return_value = mock_process
+
+            await client.connect()
+
+            first, second = await asyncio.gather(
+                client.send_request({"jsonrpc": "2.0", "method": "a", "id": 1}),
+                client.send_request({"jsonrpc": "2.0", "method": "b", "id": 2}),
+            )
+
+            assert first["result"] == "first"
+            assert second["result"] == "second"
+
+    @pytest.mark.asyncio
+    async def test_stdio_client_concurrent_requests_with_same_id(self):
+        """Test concurrent requests reusing a caller id get distinct wire ids."""
+        config = MCPServerConfig(command="npx", transport=TransportType.STDIO)
+        client = MCPSTDIOClient(config)
+
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.stdout = AsyncMock()
+            mock_process.stdout.readline = AsyncMock(
+                side_effect=[
+                    b'{"jsonrpc": "2.0", "result": "second", "id": 2}\n',
+                    b'{"jsonrpc": "2.0", "result": "first", "id": 1}\n',
+                ]
+            )
+            mock_process.stdin = MagicMock()
+            mock_process.stdin.drain = AsyncMock()
+            mock_process.returncode = None
+            mock_subprocess.return_value = mock_process
+
+            await client.connect()
+
+            first, second = await asyncio.gather(
+                client.send_request({"jsonrpc": "2.0", "method": "a", "id": 1}),
+                client.send_request({"jsonrpc": "2.0", "method": "b", "id": 1}),
+            )
+
+            assert (first["result"], first["id"]) == ("first", 1)
+            assert (second["result"], second["id"]) == ("second", 1)
+            wire_ids = [
+                json.loads(call.args[0])["id"] for call in mock_process.stdin.write.call_args_list
+            ]
+            assert wire_ids == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stdio_client_send_batch(self):
+        """Test STDIO client writes one array frame and splits the reply by id."""
+        config = MCPServerConfig(command="npx", transport=TransportType.STDIO)
+        client = MCPSTDIOClient(config)
+
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.stdout = AsyncMock()
+            mock_process.stdout.readline = AsyncMock(
+                return_value=(
+                    b'[{"jsonrpc": "2.0", "result": "b", "id": 2},'
+                    b' {"jsonrpc": "2.0", "result": "a", "id": 1}]\n'
+                )
+            )
+            mock_process.stdin = MagicMock()
+            mock_process.stdin.drain = AsyncMock()
+            mock_process.returncode = None
+            mock_subprocess.return_value = mock_process
+
+            await client.connect()
+
+            responses = await client.send_batch([
+                {"jsonrpc": "2.0", "method": "a", "id": 1},
+                {"jsonrpc": "2.0", "method": "b", "id": 2},
+            ])
+
+            assert [response["result"] for response in responses] == ["a", "b"]
+            frame = mock_process.stdin.write.call_args[0][0]
+            assert frame.startswith(b"[") and frame.endswith(b"]\n")
+
     @pytest.mark.asyncio
     async def test_stdio_client_request_timeout(self):
         """Test STDIO client handles request timeout."""
@@ -217,6 +314,27 @@ class TestMCPSTDIOClient:
             assert env["API_KEY"] == "test_key"
             assert env["DEBUG"] == "true"
 
+    @pytest.mark.asyncio
+    async def test_stdio_client_environment_refreshed_without_snapshot(self, monkeypatch):
+        """Test STDIO client rereads the process environment when snapshots are off."""
+        config = MCPServerConfig(
+            command="npx",
+            env={"API_KEY": "test_key"},
+            transport=TransportType.STDIO,
+            env_snapshot_at_init=False,
+        )
+        client = MCPSTDIOClient(config)
+        monkeypatch.setenv("MCP_TEST_LATE_VAR", "late")
+
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_subprocess.return_value = AsyncMock()
+
+            await client.connect()
+
+            env = mock_subprocess.call_args[1]["env"]
+            assert env["MCP_TEST_LATE_VAR"] == "late"
+            assert env["API_KEY"] == "test_key"
+
 
 class TestMCPSSEClient:
     """Test suite for SSE transport client."""
@@ -310,9 +428,7 @@ class TestMCPSSEClient:
             mock_request_response = AsyncMock()
             mock_request_response.status_code = 200
             mock_request_response.is_success = True
-            mock_request_response.json = Mock(
-                return_value={"jsonrpc": "2.0", "result": {"tools": []}, "id": 1}
-            )
+            mock_request_response.content = b'{"jsonrpc": "2.0", "result": {"tools": []}, "id": 1}'
 
             mock_client.get = AsyncMock(return_value=mock_connect_response)
             mock_client.post = AsyncMock(return_value=mock_request_response)
@@ -327,6 +443,43 @@ class TestMCPSSEClient:
             assert "result" in response
             mock_client.post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_sse_client_send_batch(self):
+        """Test SSE client posts one batch and orders responses by id."""
+        config = MCPServerConfig(
+            command="http://localhost:8080/sse",
+            transport=TransportType.SSE,
+        )
+        client = MCPSSEClient(config)
+
+        with patch("app.mcp.client.httpx.AsyncClient") as mock_httpx:
+            mock_client = AsyncMock()
+            mock_connect_response = AsyncMock()
+            mock_connect_response.is_success = True
+
+            mock_batch_response = AsyncMock()
+            mock_batch_response.is_success = True
+            mock_batch_response.content = (
+                b'[{"jsonrpc": "2.0", "result": {"prompts": []}, "id": 2},'
+                b' {"jsonrpc": "2.0", "result": {"tools": []}, "id": 1}]'
+            )
+
+            mock_client.get = AsyncMock(return_value=mock_connect_response)
+            mock_client.post = AsyncMock(return_value=mock_batch_response)
+            mock_httpx.return_value = mock_client
+
+            await client.connect()
+
+            requests = [
+                {"jsonrpc": "2.0", "method": "tools/list", "id": 1},
+                {"jsonrpc": "2.0", "method": "prompts/list", "id": 2},
+            ]
+            responses = await client.send_batch(requests)
+
+            assert [response["id"] for response in responses] == [1, 2]
+            mock_client.post.assert_called_once()
+            assert json.loads(mock_client.post.call_args[1]["content"]) == requests
+
     @pytest.mark.asyncio
     async def test_sse_client_request_timeout(self):
         """Test SSE client handles request timeout."""
@@ -422,8 +575,8 @@ class TestMCPSSEClient:
 
             await client.connect()
 
-            # Verify headers were included in connection
-            call_kwargs = mock_client.get.call_args[1]
+            # Verify headers were set as client defaults
+            call_kwargs = mock_httpx.call_args[1]
             assert "headers" in call_kwargs
             headers = call_kwargs["headers"]
             assert headers["AUTHORIZATION"] == "Bearer token123"
@@ -12,6 +12,7 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Dict, Any
+from unittest.mock import patch
 
 import pytest
 
@@ -172,6 +173,15 @@ class TestMCPServersConfig:
         assert "default_enabled" in enabled
         assert "disabled_server" not in enabled
 
+    def test_from_json_bytes(self):
+        """Test configuration can be validated straight from JSON bytes."""
+        raw = b'{"mcpServers": {"filesystem": {"command": " npx ", "transport": "sse"}}}'
+
+        config = MCPServersConfig.from_json_bytes(raw)
+
+        assert config.mcpServers["filesystem"].command == "npx"
+        assert config.mcpServers["filesystem"].transport == TransportType.SSE
+
 
 class TestEnvironmentVariableSubstitution:
     """Test cases for environment variable substitution."""
@@ -305,6 +315,103 @@ class TestLoadMCPConfig:
             os.unlink(config_path)
             del os.environ["TEST_API_KEY"]
 
+    def test_load_config_without_placeholders_skips_substitution(self):
+        """Test a config with no ${...} references never runs the substitution pass."""
+        config_data = {
+            "mcpServers": {
+                "test-server": {
+                    "command": "npx",
+                    "args": ["-y", "test-package"],
+                    "env": {"MODE": "plain"},
+                }
+            }
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            with patch("app.mcp.loader._substitute_env_inplace") as mock_substitute:
+                config = load_mcp_config(config_path)
+
+            mock_substitute.assert_not_called()
+            assert config.mcpServers["test-server"].env == {"MODE": "plain"}
+        finally:
+            os.unlink(config_path)
+
+    def test_load_config_resolves_repeated_env_var(self):
+        """Test a variable referenced several times resolves everywhere."""
+        os.environ["TEST_SHARED_HOST"] = "example.internal"
+
+        config_data = {
+            "mcpServers": {
+                "api-server": {
+                    "command": "python",
+                    "args": ["--host", "${TEST_SHARED_HOST}"],
+                    "env": {"UPSTREAM": "https://${TEST_SHARED_HOST}/api"},
+                }
+            }
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            server = load_mcp_config(config_path).mcpServers["api-server"]
+
+            assert server.args == ["--host", "example.internal"]
+            assert server.env == {"UPSTREAM": "https://example.internal/api"}
+        finally:
+            os.unlink(config_path)
+            del os.environ["TEST_SHARED_HOST"]
+
+    def test_load_config_ignores_references_outside_substituted_values(self):
+        """Test an unset variable in a key, which is never substituted, still loads."""
+        os.environ.pop("TEST_UNSET_KEY_VAR", None)
+
+        config_data = {
+            "mcpServers": {
+                "api-server": {
+                    "command": "python",
+                    "env": {"${TEST_UNSET_KEY_VAR}": "literal"},
+                }
+            }
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            server = load_mcp_config(config_path).mcpServers["api-server"]
+
+            assert server.env == {"${TEST_UNSET_KEY_VAR}": "literal"}
+        finally:
+            os.unlink(config_path)
+
+    def test_load_config_with_missing_env_var_raises_error(self):
+        """Test a reference to an unset variable fails the load."""
+        config_data = {
+            "mcpServers": {
+                "api-server": {
+                    "command": "python",
+                    "env": {"API_KEY": "${TEST_UNSET_VARIABLE_XYZ}"},
+                }
+            }
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            with pytest.raises(MCPConfigError, match="TEST_UNSET_VARIABLE_XYZ"):
+                load_mcp_config(config_path)
+        finally:
+            os.unlink(config_path)
+
     def test_load_nonexistent_file_returns_empty_config(self):
         """Test loading nonexistent file returns empty config (unless env vars present)."""
         # With no env vars and no file, should return empty config
@@ -514,6 +621,29 @@ class TestEnvironmentVariableParsing:
                 if env_key in os.environ:
                     del os.environ[env_key]
 
+    def test_parse_keeps_env_vars_per_server_index(self):
+        """Test server env vars are not shared between servers 1 and 10."""
+        from app.mcp.config import parse_env_var_servers
+
+        keys = {
+            "MCP_SERVER_1_NAME": "one",
+            "MCP_SERVER_1_COMMAND": "npx",
+            "MCP_SERVER_1_ENV_TOKEN": "first",
+            "MCP_SERVER_10_NAME": "ten",
+            "MCP_SERVER_10_COMMAND": "python",
+            "MCP_SERVER_10_ENV_TOKEN": "tenth",
+        }
+        os.environ.update(keys)
+
+        try:
+            servers = parse_env_var_servers()
+
+            assert servers["one"].env == {"TOKEN": "first"}
+            assert servers["ten"].env == {"TOKEN": "tenth"}
+        finally:
+            for env_key in keys:
+                del os.environ[env_key]
+
     def test_parse_with_server_count_hint(self):
         """Test parsing with MCP_SERVER_COUNT optimization hint."""
         from app.mcp.config import parse_env_var_servers
@@ -302,6 +302,44 @@ class TestMCPConnectionManager:
                         mock_stdio_disconnect.assert_called_once()
                         mock_sse_disconnect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_manager_shares_http_pool_across_sse_servers(self):
+        """Test SSE servers share one HTTP pool that only shutdown closes."""
+        config = MCPServersConfig(
+            mcpServers={
+                "search": MCPServerConfig(
+                    command="http://localhost:8080/sse",
+                    env={"X-API-KEY": "search-key"},
+                    transport=TransportType.SSE,
+                ),
+                "docs": MCPServerConfig(
+                    command="http://localhost:8081/sse",
+                    transport=TransportType.SSE,
+                ),
+            }
+        )
+
+        manager = MCPConnectionManager()
+        await manager.initialize(config)
+
+        with patch("app.mcp.client.httpx.AsyncClient") as mock_httpx:
+            mock_pool = AsyncMock()
+            mock_pool.get = AsyncMock(return_value=MagicMock(is_success=True))
+            mock_httpx.return_value = mock_pool
+
+            await manager.connect_server("search")
+            await manager.connect_server("docs")
+
+            mock_httpx.assert_called_once()
+            # Per-server headers travel with each request on a shared pool
+            assert mock_pool.get.call_args_list[0][1]["headers"] == {"X-API-KEY": "search-key"}
+
+            await manager.disconnect_server("search")
+            mock_pool.aclose.assert_not_called()
+
+            await manager.shutdown()
+            mock_pool.aclose.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_manager_skips_disabled_servers(self):
         """Test manager doesn't connect to disabled servers."""
@@ -369,6 +407,46 @@ class TestMCPConnectionManager:
                 assert results["filesystem"] is True
                 assert results["api"] is True
 
+    @pytest.mark.asyncio
+    async def test_manager_connect_all_enabled_bounds_concurrency(self):
+        """Test connect_all_enabled never connects more servers at once than allowed."""
+        config = MCPServersConfig(
+            mcpServers={
+                f"server-{i}": MCPServerConfig(
+                    command="test",
+                    transport=TransportType.STDIO,
+                    enabled=True,
+                )
+                for i in range(6)
+            }
+        )
+
+        manager = MCPConnectionManager(connect_concurrency=2)
+        await manager.initialize(config)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_connect(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        with patch("app.mcp.client.MCPSTDIOClient.connect", side_effect=slow_connect):
+            results = await manager.connect_all_enabled()
+
+        assert len(results) == 6
+        assert all(results.values())
+        assert peak == 2
+
+    def test_manager_rejects_invalid_connect_concurrency(self):
+        """Test manager requires at least one connection slot."""
+        with pytest.raises(ValueError):
+            MCPConnectionManager(connect_concurrency=0)
+
     @pytest.mark.asyncio
     async def test_manager_exponential_backoff_caps_at_max(self):
         """Test exponential backoff caps at maximum delay."""
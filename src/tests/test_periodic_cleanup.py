@@ -0,0 +1,53 @@
+"""Tests for the periodic conversation cleanup task.
+
+Test the cleanup scheduling including:
+- Backing off while the store is empty or nothing expires
+- Resetting the interval once conversations are expired
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def main_module(monkeypatch):
+    """Import the application module with the required settings present."""
+    from app.config.settings import get_settings
+
+    monkeypatch.setenv('AZURE_OPENAI_ENDPOINT', 'https://example.openai.azure.com')
+    monkeypatch.setenv('AZURE_OPENAI_DEPLOYMENT_NAME', 'test-deployment')
+    get_settings.cache_clear()
+    yield pytest.importorskip('app.main', exc_type=ImportError)
+    get_settings.cache_clear()
+
+
+class TestPeriodicCleanup:
+    """Test suite for periodic_cleanup scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_interval_backs_off_when_idle_and_resets_after_expiry(self, main_module):
+        """Test the sleep interval doubles when idle and resets after removals."""
+        store = MagicMock()
+        # Empty, nothing expired, three expired, nothing expired
+        store.size.side_effect = [0, 5, 5, 2]
+        store.cleanup_expired.side_effect = [0, 3, 0]
+        # Stop the loop on the fifth sleep
+        sleep = AsyncMock(side_effect=[None, None, None, None, asyncio.CancelledError()])
+
+        with patch.object(main_module, 'get_conversation_store', return_value=store), \
+                patch.object(main_module.asyncio, 'sleep', sleep), \
+                patch.object(main_module.random, 'uniform', return_value=0):
+            await main_module.periodic_cleanup()
+
+        base = main_module.CLEANUP_INTERVAL_SECONDS
+        maximum = main_module.CLEANUP_MAX_INTERVAL_SECONDS
+        intervals = [call.args[0] for call in sleep.await_args_list]
+        assert intervals == [
+            base,
+            min(base * 2, maximum),
+            min(base * 4, maximum),
+            base,
+            min(base * 2, maximum),
+        ]
+        assert store.cleanup_expired.call_count == 3
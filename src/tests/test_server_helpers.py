@@ -2,10 +2,13 @@
 
 This test suite validates the filesystem and web search server configuration helpers.
 """
+from collections.abc import Mapping
+from unittest.mock import patch
+
 import pytest
 
 from app.mcp.config import TransportType
-from app.mcp.servers.filesystem import FilesystemServerHelper
+from app.mcp.servers.filesystem import DirectoryStatus, FilesystemServerHelper
 from app.mcp.servers.web_search import WebSearchServerHelper
 
 
@@ -35,6 +38,19 @@ class TestFilesystemServerHelper:
         assert config.enabled is False
         assert config.description == "Custom filesystem server"
 
+    def test_create_filesystem_config_normalizes_path(self):
+        """Test redundant separators are removed from the allowed directory."""
+        config = FilesystemServerHelper.create_config("/data//shared/./docs/")
+
+        assert config.args[-1] == "/data/shared/docs"
+        assert config.description == "Filesystem access to /data/shared/docs"
+
+    def test_create_filesystem_config_keeps_parent_components(self):
+        """Test '..' components are passed through rather than collapsed."""
+        config = FilesystemServerHelper.create_config("/data/link/../docs")
+
+        assert config.args[-1] == "/data/link/../docs"
+
     def test_create_filesystem_config_rejects_relative_path(self):
         """Test that relative paths are rejected."""
         with pytest.raises(ValueError, match="absolute path"):
@@ -70,11 +86,54 @@ class TestFilesystemServerHelper:
         assert not is_valid
         assert "system directory" in message.lower()
 
+    def test_validate_directory_accepts_readable_directory(self, tmp_path):
+        """Test validation probes a large directory without listing its entries."""
+        for i in range(50):
+            (tmp_path / f"file_{i}.txt").touch()
+
+        with patch("pathlib.Path.iterdir") as mock_iterdir:
+            is_valid, message = FilesystemServerHelper.validate_directory(str(tmp_path))
+
+        assert is_valid
+        assert "accessible" in message
+        mock_iterdir.assert_not_called()
+
+    def test_validate_directory_rejects_unreadable_directory(self, tmp_path):
+        """Test validation reports a directory that cannot be opened."""
+        with patch("app.mcp.servers.filesystem.os.scandir", side_effect=PermissionError):
+            is_valid, message = FilesystemServerHelper.validate_directory(str(tmp_path))
+
+        assert not is_valid
+        assert "not readable" in message
+
+    def test_check_directory_reports_status(self, tmp_path):
+        """Test check_directory exposes a status alongside the message."""
+        file_path = tmp_path / "notes.txt"
+        file_path.touch()
+
+        cases = {
+            "relative/path": (DirectoryStatus.NOT_ABSOLUTE, False),
+            "/etc/nginx": (DirectoryStatus.SYSTEM_DIRECTORY, False),
+            str(tmp_path / "missing"): (DirectoryStatus.MISSING, True),
+            str(file_path): (DirectoryStatus.NOT_DIRECTORY, False),
+            str(tmp_path): (DirectoryStatus.OK, True),
+        }
+
+        for directory, (status, is_valid) in cases.items():
+            result = FilesystemServerHelper.check_directory(directory)
+            assert result.status is status
+            assert result.is_valid is is_valid
+            assert directory in result.message
+            assert FilesystemServerHelper.validate_directory(directory) == (
+                result.is_valid,
+                result.message,
+            )
+
     def test_get_available_tools(self):
         """Test getting list of filesystem tools."""
         tools = FilesystemServerHelper.get_available_tools()
 
-        assert isinstance(tools, list)
+        assert isinstance(tools, tuple)
         assert "read_file" in tools
         assert "write_file" in tools
         assert "list_directory" in tools
@@ -83,17 +142,25 @@ class TestFilesystemServerHelper:
         """Test getting security recommendations."""
         recommendations = FilesystemServerHelper.get_security_recommendations()
 
-        assert isinstance(recommendations, dict)
+        assert isinstance(recommendations, Mapping)
         assert "directory_permissions" in recommendations
         assert "path_configuration" in recommendations
         assert "monitoring" in recommendations
 
         # Check recommendations are non-empty lists
         for category, items in recommendations.items():
-            assert isinstance(items, list)
+            assert isinstance(items, tuple)
             assert len(items) > 0
 
 
+    def test_security_recommendations_are_shared_and_read_only(self):
+        """Test recommendations are built once and cannot be mutated by callers."""
+        recommendations = FilesystemServerHelper.get_security_recommendations()
+
+        assert FilesystemServerHelper.get_security_recommendations() is recommendations
+        with pytest.raises(TypeError):
+            recommendations["monitoring"] = ()
+
 class TestWebSearchServerHelper:
     """Test cases for WebSearchServerHelper."""
 
@@ -150,21 +217,21 @@ class TestWebSearchServerHelper:
         """Test getting available search tools."""
         tools = WebSearchServerHelper.get_available_tools()
 
-        assert isinstance(tools, dict)
+        assert isinstance(tools, Mapping)
         assert "brave_search" in tools
         assert "google_search" in tools
         assert "generic" in tools
 
         # Check tool lists are non-empty
         for server_type, tool_list in tools.items():
-            assert isinstance(tool_list, list)
+            assert isinstance(tool_list, tuple)
             assert len(tool_list) > 0
 
     def test_get_rate_limit_recommendations(self):
         """Test getting rate limit recommendations."""
         recommendations = WebSearchServerHelper.get_rate_limit_recommendations()
 
-        assert isinstance(recommendations, dict)
+        assert isinstance(recommendations, Mapping)
         assert "brave_search_free" in recommendations
         assert "google_custom_search_free" in recommendations
         assert "implementation" in recommendations
@@ -173,7 +240,7 @@ class TestWebSearchServerHelper:
         """Test getting security recommendations."""
         recommendations = WebSearchServerHelper.get_security_recommendations()
 
-        assert isinstance(recommendations, dict)
+        assert isinstance(recommendations, Mapping)
         assert "api_keys" in recommendations
         assert "query_validation" in recommendations
         assert "result_handling" in recommendations
@@ -181,14 +248,14 @@ class TestWebSearchServerHelper:
 
         # Check recommendations are non-empty lists
         for category, items in recommendations.items():
-            assert isinstance(items, list)
+            assert isinstance(items, tuple)
             assert len(items) > 0
 
     def test_get_deployment_checklist(self):
         """Test getting deployment checklist."""
         checklist = WebSearchServerHelper.get_deployment_checklist()
 
-        assert isinstance(checklist, dict)
+        assert isinstance(checklist, Mapping)
         assert "pre_deployment" in checklist
         assert "deployment" in checklist
         assert "post_deployment" in checklist
@@ -196,5 +263,20 @@ class TestWebSearchServerHelper:
 
         # Check all phases have tasks
         for phase, tasks in checklist.items():
-            assert isinstance(tasks, list)
+            assert isinstance(tasks, tuple)
             assert len(tasks) > 0
+
+    def test_static_reference_data_is_shared_and_read_only(self):
+        """Test reference tables are built once and cannot be mutated by callers."""
+        getters = [
+            WebSearchServerHelper.get_available_tools,
+            WebSearchServerHelper.get_rate_limit_recommendations,
+            WebSearchServerHelper.get_security_recommendations,
+            WebSearchServerHelper.get_deployment_checklist,
+        ]
+
+        for getter in getters:
+            table = getter()
+            assert getter() is table
+            with pytest.raises(TypeError):
+                table["new_key"] = "value"
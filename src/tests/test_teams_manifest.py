@@ -197,6 +197,90 @@ class TestManifestGeneration:
         assert manifest['version'] == '1.0.0'
 
 
+    def test_manifest_generation_returns_independent_manifests(self, monkeypatch):
+        """Test each generated manifest is a new dict that follows the environment."""
+        from app.teams.manifest_generator import generate_manifest
+
+        monkeypatch.setenv('BOT_ID', 'cached-bot-id')
+        monkeypatch.setenv('ENVIRONMENT', 'staging')
+        first = generate_manifest()
+        second = generate_manifest()
+        assert second == first
+        assert second is not first
+
+        first['name']['short'] = 'Edited'
+        assert generate_manifest()['name']['short'] == 'AI Agent'
+
+        monkeypatch.setenv('ENVIRONMENT', 'prod')
+        changed = generate_manifest()
+        assert changed['packageName'] == 'com.microsoft.teams.aiagent.prod'
+
+    def test_generate_manifest_json_bytes_matches_manifest(self, monkeypatch):
+        """Test the serialized manifest matches the dict form and is cached."""
+        from app.teams.manifest_generator import generate_manifest, generate_manifest_json_bytes
+
+        monkeypatch.setenv('BOT_ID', 'bytes-bot-id')
+        monkeypatch.setenv('BOT_ENDPOINT', 'https://bot.example.com/api/messages')
+
+        data = generate_manifest_json_bytes()
+
+        assert json.loads(data) == generate_manifest()
+        assert generate_manifest_json_bytes() is data
+
+    @pytest.mark.parametrize("endpoint", [
+        "https://bot.example.com/api/messages",
+        "http://bot.example.com/api/messages",
+        "bot.example.com/api/messages",
+    ])
+    def test_manifest_resource_strips_endpoint_scheme(self, endpoint):
+        """Test the application ID URI drops only a leading URL scheme."""
+        from app.teams.manifest_generator import _build_manifest
+
+        manifest = _build_manifest('bot-id', endpoint, '1.0.0', 'dev')
+
+        assert manifest['webApplicationInfo']['resource'] == "api://bot.example.com/api/messages"
+
+    def test_built_manifests_do_not_share_sections(self):
+        """Test editing one manifest leaves the shared sections untouched."""
+        from app.teams.manifest_generator import _build_manifest
+
+        first = _build_manifest('bot-id', 'https://bot.example.com', '1.0.0', 'dev')
+        first['developer']['name'] = 'Edited'
+        first['bots'][0]['commandLists'][0]['commands'][0]['title'] = 'Edited'
+        first['validDomains'].append('evil.example.com')
+
+        second = _build_manifest('bot-id', 'https://bot.example.com', '1.0.0', 'dev')
+        assert second['developer']['name'] == 'AI Agent Development Team'
+        assert second['bots'][0]['commandLists'][1]['commands'][0]['title'] == 'Help'
+        assert 'evil.example.com' not in second['validDomains']
+
+    def test_save_manifest_round_trips(self, tmp_path):
+        """Test saved manifests are indented JSON that validate_manifest can read."""
+        from app.teams.manifest_generator import _build_manifest, save_manifest
+        from app.teams.manifest_validator import validate_manifest
+
+        manifest = _build_manifest(
+            '00000000-0000-0000-0000-000000000000', 'https://bot.example.com', '1.2.3', 'dev'
+        )
+        output_path = tmp_path / "manifest.json"
+        save_manifest(manifest, str(output_path))
+
+        text = output_path.read_text()
+        assert text.startswith('{\n  "$schema"')
+        assert json.loads(text) == manifest
+        is_valid, errors = validate_manifest(str(output_path))
+        assert is_valid, errors
+
+    def test_substitute_placeholders_single_pass(self):
+        """Test placeholders inside substituted values are not expanded again."""
+        from app.teams.manifest_generator import substitute_placeholders
+
+        template = '{"id": "{{BOT_ID}}", "botId": "{{BOT_ID}}", "other": "{{UNKNOWN}}"}'
+        result = substitute_placeholders(template, {"BOT_ID": "{{UNKNOWN}}-1", "UNKNOWN": "x"})
+
+        assert result == '{"id": "{{UNKNOWN}}-1", "botId": "{{UNKNOWN}}-1", "other": "x"}'
+        assert substitute_placeholders(template, {}) == template
+
 class TestManifestValidation:
     """Test suite for manifest schema validation."""
 
@@ -209,6 +293,106 @@ class TestManifestValidation:
             is_valid, errors = validate_manifest(str(manifest_path))
             assert is_valid, f"Manifest validation failed: {errors}"
 
+    def test_validate_manifest_reports_missing_fields_in_order(self, tmp_path):
+        """Test missing required fields are reported in declaration order."""
+        from app.teams.manifest_validator import validate_manifest
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({
+            "$schema": "https://example.com/schema.json",
+            "manifestVersion": "1.16",
+            "developer": {"name": "Dev", "websiteUrl": "https://example.com"},
+        }))
+
+        is_valid, errors = validate_manifest(str(manifest_path))
+
+        assert not is_valid
+        assert errors[:3] == [
+            "Missing required field: version",
+            "Missing required field: id",
+            "Missing required field: packageName",
+        ]
+        assert "Developer section missing privacyUrl" in errors
+        assert "Developer section missing termsOfUseUrl" in errors
+
+    @pytest.mark.parametrize("developer", ["Contoso", ["name"], 42])
+    def test_validate_manifest_rejects_non_object_developer(self, tmp_path, developer):
+        """Test a developer section that is not an object is reported, not raised."""
+        from app.teams.manifest_validator import validate_manifest
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"developer": developer}))
+
+        is_valid, errors = validate_manifest(str(manifest_path))
+
+        assert not is_valid
+        assert "Developer section must be an object" in errors
+
+    @pytest.mark.parametrize("version, message", [
+        ("1.2", "is outdated"),
+        ("1.9", "is outdated"),
+        ("latest", "is not a valid version number"),
+        ("devPreview", None),
+        ("1.16", None),
+        ("1.17", None),
+    ])
+    def test_validate_manifest_version_compares_numerically(self, tmp_path, version, message):
+        """Test manifestVersion is compared component by component, not as text."""
+        from app.teams.manifest_validator import validate_manifest
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"manifestVersion": version}))
+
+        _, errors = validate_manifest(str(manifest_path))
+        version_errors = [e for e in errors if e.startswith("Manifest version")]
+
+        if message is None:
+            assert version_errors == []
+        else:
+            assert len(version_errors) == 1
+            assert message in version_errors[0]
+
+    def test_validate_icon_dimensions_uses_module_level_pil(self, monkeypatch):
+        """Test icon checks use the import resolved at module load."""
+        from unittest.mock import MagicMock
+        from app.teams import manifest_validator
+
+        monkeypatch.setattr(manifest_validator, "Image", None)
+        assert manifest_validator.validate_icon_dimensions("color.png", (192, 192)) == (True, "")
+
+        image = MagicMock()
+        image.open.return_value.__enter__.return_value.size = (32, 32)
+        monkeypatch.setattr(manifest_validator, "Image", image)
+        is_valid, message = manifest_validator.validate_icon_dimensions("color.png", (192, 192))
+        assert not is_valid
+        assert "does not match" in message
+
+    def test_validate_icons_batch_preserves_order(self, monkeypatch):
+        """Test batch icon validation returns one result per icon, in order."""
+        from unittest.mock import MagicMock
+        from app.teams import manifest_validator
+
+        sizes = {"color.png": (192, 192), "outline.png": (20, 20), "small.png": (16, 16)}
+
+        def open_icon(path):
+            handle = MagicMock()
+            handle.__enter__.return_value.size = sizes[path]
+            return handle
+
+        image = MagicMock()
+        image.open.side_effect = open_icon
+        monkeypatch.setattr(manifest_validator, "Image", image)
+
+        results = manifest_validator.validate_icons_batch([
+            ("color.png", (192, 192)),
+            ("outline.png", (32, 32)),
+            ("small.png", (16, 16)),
+        ])
+
+        assert [is_valid for is_valid, _ in results] == [True, False, True]
+        assert "(20, 20)" in results[1][1]
+        assert manifest_validator.validate_icons_batch([]) == []
+
     def test_validate_manifest_bot_id_format(self):
         """Test bot ID format validation."""
         from app.teams.manifest_validator import validate_bot_id
@@ -0,0 +1,114 @@
+"""Tests for the background MCP event loop.
+
+Test synchronous access to async MCP code including:
+- Running coroutines on a shared loop thread
+- Exception and timeout propagation
+- Forwarding manager calls through MCPClientWrapper
+"""
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.mcp.async_loop import AsyncLoopThread, MCPClientWrapper
+from app.mcp.exceptions import MCPConnectionError
+from app.mcp.manager import MCPConnectionManager
+
+
+@pytest.fixture
+def loop_thread():
+    """Provide a loop thread that is stopped after the test."""
+    thread = AsyncLoopThread()
+    yield thread
+    thread.stop()
+
+
+class TestAsyncLoopThread:
+    """Tests for AsyncLoopThread."""
+
+    def test_run_returns_result_from_loop_thread(self, loop_thread):
+        """Test coroutines run on the dedicated thread and return their result."""
+
+        async def current_thread_name():
+            return threading.current_thread().name
+
+        assert loop_thread.run(current_thread_name()) == "mcp-event-loop"
+        assert loop_thread.is_running
+
+    def test_run_reuses_the_same_loop(self, loop_thread):
+        """Test successive calls share one event loop."""
+
+        async def running_loop():
+            return asyncio.get_running_loop()
+
+        assert loop_thread.run(running_loop()) is loop_thread.run(running_loop())
+
+    def test_run_propagates_exceptions(self, loop_thread):
+        """Test exceptions raised by the coroutine reach the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            loop_thread.run(fail())
+
+    def test_run_times_out(self, loop_thread):
+        """Test a slow coroutine raises TimeoutError when the wait expires."""
+        with pytest.raises(TimeoutError):
+            loop_thread.run(asyncio.sleep(1), timeout=0.01)
+
+    def test_stop_and_restart(self, loop_thread):
+        """Test a stopped loop thread starts again on the next call."""
+
+        async def answer():
+            return 42
+
+        loop_thread.run(answer())
+        loop_thread.stop()
+        assert not loop_thread.is_running
+
+        assert loop_thread.run(answer()) == 42
+
+
+class TestMCPClientWrapper:
+    """Tests for MCPClientWrapper."""
+
+    def test_connect_all_enabled_runs_on_loop_thread(self, loop_thread):
+        """Test manager calls are forwarded to the loop thread."""
+        manager = MagicMock(spec=MCPConnectionManager)
+        seen_threads = []
+
+        async def connect_all_enabled():
+            seen_threads.append(threading.current_thread().name)
+            return {"filesystem": True}
+
+        manager.connect_all_enabled.side_effect = connect_all_enabled
+        wrapper = MCPClientWrapper(manager, loop_thread=loop_thread)
+
+        assert wrapper.connect_all_enabled() == {"filesystem": True}
+        assert seen_threads == ["mcp-event-loop"]
+
+    def test_send_request_uses_connected_client(self, loop_thread):
+        """Test send_request looks up the client and forwards the request."""
+        client = MagicMock()
+        client.send_request = AsyncMock(return_value={"jsonrpc": "2.0", "id": 1, "result": {}})
+        manager = MagicMock(spec=MCPConnectionManager)
+        manager.get_client = AsyncMock(return_value=client)
+        wrapper = MCPClientWrapper(manager, loop_thread=loop_thread)
+
+        request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
+        response = wrapper.send_request("filesystem", request)
+
+        assert response["result"] == {}
+        manager.get_client.assert_awaited_once_with("filesystem")
+        client.send_request.assert_awaited_once_with(request)
+
+    def test_send_request_without_client_raises(self, loop_thread):
+        """Test send_request fails clearly when the server has no client."""
+        manager = MagicMock(spec=MCPConnectionManager)
+        manager.get_client = AsyncMock(return_value=None)
+        wrapper = MCPClientWrapper(manager, loop_thread=loop_thread)
+
+        with pytest.raises(MCPConnectionError, match="No client available for server: filesystem"):
+            wrapper.send_request("filesystem", {"jsonrpc": "2.0", "method": "tools/list", "id": 1})
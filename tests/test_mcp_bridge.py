@@ -7,13 +7,13 @@ Test basic tool execution and Agent Framework integration:
 - Error handling
 - Tool listing
 """
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.mcp.bridge import MCPToolBridge
 from app.mcp.exceptions import MCPConnectionError, MCPTimeoutError, MCPTransportError
-from app.mcp.tool_schema import MCPToolSchema
+from app.mcp.tool_schema import MCPToolSchema, mcp_to_agent_framework_many
 
 
 class TestMCPToolBridge:
@@ -359,6 +359,46 @@ class TestMCPToolBridge:
         # Verify get_client was called with correct server name
         mock_manager.get_client.assert_called_once_with("filesystem")
 
+    def test_get_available_tools_cached_until_registry_changes(self, mock_manager, sample_tool):
+        """Test conversions are reused until the registry version changes."""
+        from app.mcp.registry import MCPToolRegistry
+
+        registry = MCPToolRegistry()
+        registry.register_tool("filesystem", sample_tool)
+        bridge = MCPToolBridge(registry, mock_manager)
+
+        with patch(
+            "app.mcp.bridge.mcp_to_agent_framework_many", wraps=mcp_to_agent_framework_many
+        ) as convert:
+            first = bridge.get_available_tools()
+            second = bridge.get_available_tools()
+        assert second == first
+        assert convert.call_count == 1
+
+        # Callers get independent copies, so edits never reach the cache
+        first[0]["parameters"]["properties"]["injected"] = {"type": "string"}
+        assert "injected" not in bridge.get_available_tools()[0]["parameters"]["properties"]
+
+        registry.register_tool(
+            "web", MCPToolSchema(name="search", description="Search", input_schema={})
+        )
+        assert len(bridge.get_available_tools()) == 2
+
+    def test_get_available_tools_preserves_schema_values(self, mock_manager):
+        """Test cached definitions are copied without a lossy JSON round trip."""
+        from app.mcp.registry import MCPToolRegistry
+
+        registry = MCPToolRegistry()
+        schema = {"type": "object", "properties": {"mode": {"enum": ("fast", "slow")}}}
+        registry.register_tool(
+            "filesystem", MCPToolSchema(name="copy", description="Copy", input_schema=schema)
+        )
+        bridge = MCPToolBridge(registry, mock_manager)
+
+        tools = bridge.get_available_tools()
+
+        assert tools[0]["parameters"]["properties"]["mode"]["enum"] == ("fast", "slow")
+
     def test_get_available_tools_filters_by_server(self, bridge, mock_registry):
         """Test getting tools filtered by server name (if supported)."""
         tool1 = MCPToolSchema(
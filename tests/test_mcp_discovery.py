@@ -6,6 +6,7 @@ Test tool discovery from MCP servers including:
 - Multiple server discovery
 - Error handling
 """
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -217,6 +218,21 @@ class TestDiscoverTools:
         with pytest.raises((ValueError, KeyError)):
             await discover_tools(mock_client)
 
+    @pytest.mark.asyncio
+    async def test_discover_tools_default_schemas_are_independent(self, mock_client):
+        """Test tools without an inputSchema each get their own default schema."""
+        mock_client.send_request.return_value = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"tools": [{"name": "ping"}, {"name": "pong"}]},
+        }
+
+        tools = await discover_tools(mock_client)
+
+        assert tools[0].input_schema == {"type": "object", "properties": {}}
+        tools[0].input_schema["properties"]["added"] = {"type": "string"}
+        assert tools[1].input_schema == {"type": "object", "properties": {}}
+
     @pytest.mark.asyncio
     async def test_discover_tools_complex_schema(self, mock_client):
         """Test discovering tool with complex input schema."""
@@ -406,3 +422,24 @@ class TestDiscoverToolsFromManager:
 
         # Should handle gracefully
         assert "filesystem" not in result or result["filesystem"] == []
+
+    @pytest.mark.asyncio
+    async def test_discover_from_manager_queries_servers_concurrently(self):
+        """Test every server's tools/list is in flight at the same time."""
+        mock_manager = MagicMock()
+        mock_manager.list_servers.return_value = ["filesystem", "web"]
+        barrier = asyncio.Barrier(2)
+
+        async def send_request(request):
+            # Deadlocks (and times out) if servers are queried one by one
+            await barrier.wait()
+            return {"jsonrpc": "2.0", "id": 1, "result": {"tools": []}}
+
+        client = AsyncMock(spec=MCPClient)
+        client.send_request.side_effect = send_request
+        mock_manager.get_client = AsyncMock(return_value=client)
+
+        async with asyncio.timeout(1.0):
+            result = await discover_tools_from_manager(mock_manager)
+
+        assert result == {"filesystem": [], "web": []}
@@ -187,6 +187,20 @@ class TestMCPToolRegistry:
         # Should only have one instance
         assert registry.get_tool_count() == 1
 
+    def test_list_tools_by_server_tracks_replace_and_remove(self, registry, sample_tool):
+        """Test the per-server listing follows replacements and removals."""
+        tool2 = MCPToolSchema(name="write_file", description="Write", input_schema={})
+        replacement = MCPToolSchema(name="read_file", description="Read v2", input_schema={})
+
+        registry.register_tool("filesystem", sample_tool)
+        write_name = registry.register_tool("filesystem", tool2)
+        registry.register_tool("filesystem", replacement)
+
+        assert registry.list_tools("filesystem") == [replacement, tool2]
+
+        registry.remove_tool(write_name)
+        assert registry.list_tools("filesystem") == [replacement]
+
     def test_thread_safety_concurrent_registration(self, registry):
         """Test concurrent tool registration is thread-safe."""
 
@@ -8,7 +8,11 @@ Test JSON Schema to Agent Framework conversion including:
 """
 import pytest
 
-from app.mcp.tool_schema import MCPToolSchema, mcp_to_agent_framework
+from app.mcp.tool_schema import (
+    MCPToolSchema,
+    mcp_to_agent_framework,
+    mcp_to_agent_framework_many,
+)
 
 
 class TestMCPToolSchema:
@@ -56,6 +60,14 @@ class TestMCPToolSchema:
         assert schema.full_name == "filesystem.read_file"
 
 
+    def test_tool_schema_uses_slots(self):
+        """Test tool schemas carry no per-instance __dict__."""
+        tool = MCPToolSchema(name="read_file", description="Read", input_schema={})
+
+        assert not hasattr(tool, "__dict__")
+        with pytest.raises(AttributeError):
+            tool.unexpected = "value"
+
 class TestMCPToAgentFramework:
     """Tests for MCP to Agent Framework schema conversion."""
 
@@ -333,3 +345,20 @@ class TestMCPToAgentFramework:
 
         encoding = result["parameters"]["properties"]["encoding"]
         assert encoding["default"] == "utf-8"
+
+    def test_convert_many_matches_single_conversion(self):
+        """Test batch conversion matches converting each tool on its own."""
+        tools = [
+            MCPToolSchema(
+                name="read_file",
+                description="Read",
+                input_schema={"type": "object", "properties": {}, "required": ["path"]},
+                full_name="filesystem.read_file",
+            ),
+            MCPToolSchema(name="search", description="Search", input_schema={}),
+        ]
+
+        result = mcp_to_agent_framework_many(iter(tools))
+
+        assert result == [mcp_to_agent_framework(tool) for tool in tools]
+        assert [tool["name"] for tool in result] == ["filesystem.read_file", "search"]